@@ -0,0 +1,710 @@
+"""Fake RouterOS API server for benchmarks.
+
+Serves generated router tables over the RouterOS API wire protocol, so
+MikrotikAPI and the coordinators can be exercised without a router.
+
+    python -m benchmarks.fake_routeros --hosts 5000 --latency 0.002
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from dataclasses import dataclass
+
+from custom_components.mikrotik_router.apiprotocol import (
+    decode_sentences,
+    encode_password,
+    encode_sentence,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+API_ENCODING = "ISO-8859-1"
+LOGIN_TOKEN = "0123456789abcdef0123456789abcdef"
+ROUTER_POLICY = (
+    "local,telnet,ssh,ftp,reboot,read,write,policy,test,winbox,password,"
+    "web,sniff,sensitive,api,romon,rest-api"
+)
+
+
+# ---------------------------
+#   DatasetSize
+# ---------------------------
+@dataclass
+class DatasetSize:
+    """Number of rows generated per table."""
+
+    interfaces: int = 8
+    hosts: int = 50
+    wireless_hosts: int = 10
+    rules: int = 30
+    queues: int = 10
+    accounting: int = 100
+
+
+def _mac(index, prefix=0) -> str:
+    return ":".join(
+        f"{octet:02X}"
+        for octet in (
+            0x02,
+            0x11,
+            prefix,
+            (index >> 16) & 255,
+            (index >> 8) & 255,
+            index & 255,
+        )
+    )
+
+
+def _ip(index) -> str:
+    return f"10.{(index >> 16) & 255}.{(index >> 8) & 255}.{(index & 255) or 1}"
+
+
+# ---------------------------
+#   build_tables
+# ---------------------------
+def build_tables(size: DatasetSize) -> dict:
+    """Generate router tables keyed by API path, values are API strings."""
+    ports = max(2, size.interfaces)
+    tables = {
+        "/user": [{".id": "*1", "name": "admin", "group": "full"}],
+        "/user/group": [{".id": "*1", "name": "full", "policy": ROUTER_POLICY}],
+        "/system/resource": [
+            {
+                "uptime": "1w2d3h4m5s",
+                "version": "7.14.1 (stable)",
+                "free-memory": "536870912",
+                "total-memory": "1073741824",
+                "cpu-load": "5",
+                "free-hdd-space": "1000000",
+                "total-hdd-space": "2000000",
+                "board-name": "RB5009",
+                "platform": "MikroTik",
+            }
+        ],
+        "/system/routerboard": [
+            {
+                "routerboard": "true",
+                "model": "RB5009",
+                "serial-number": "HD0000000",
+                "firmware-type": "70x0",
+                "factory-firmware": "7.1",
+                "current-firmware": "7.14.1",
+                "upgrade-firmware": "7.14.1",
+            }
+        ],
+        "/system/package": [
+            {".id": "*1", "name": "routeros", "disabled": "false"},
+            {".id": "*2", "name": "wifi-qcom", "disabled": "false"},
+        ],
+        "/system/package/update": [
+            {
+                "channel": "stable",
+                "installed-version": "7.14.1",
+                "latest-version": "7.14.1",
+                "status": "System is already up to date",
+            }
+        ],
+        "/system/health": [
+            {".id": "*1", "name": "temperature", "value": "40", "type": "C"}
+        ],
+        "/system/script": [
+            {".id": "*1", "name": "backup", "run-count": "0", "last-started": ""}
+        ],
+        "/system/script/environment": [],
+        "/interface/bonding": [],
+        "/interface/bridge": [{".id": "*1", "name": "bridge"}],
+        "/ip/dhcp-server": [{".id": "*1", "name": "dhcp1", "interface": "bridge"}],
+        "/ip/dhcp-server/network": [
+            {".id": "*1", "address": "10.0.0.0/8", "gateway": "10.0.0.1"}
+        ],
+        "/ip/dhcp-client": [
+            {
+                ".id": "*1",
+                "interface": "ether1",
+                "status": "bound",
+                "address": "192.0.2.10/24",
+            }
+        ],
+        "/ip/hotspot/host": [],
+        "/ip/kid-control": [],
+        "/ppp/secret": [],
+        "/ppp/active": [],
+        "/ip/accounting": [
+            {
+                "enabled": "true",
+                "account-local-traffic": "false",
+                "threshold": str(max(2560, size.accounting * 2)),
+            }
+        ],
+    }
+
+    tables["/interface"] = [
+        {
+            ".id": f"*{i}",
+            "name": f"ether{i}",
+            "default-name": f"ether{i}",
+            "type": "ether",
+            "running": "true",
+            "disabled": "false",
+            "mac-address": _mac(i, 1),
+            "rx-byte": str(i * 1000),
+            "tx-byte": str(i * 500),
+            "actual-mtu": "1500",
+        }
+        for i in range(1, ports + 1)
+    ] + [
+        {
+            ".id": "*100",
+            "name": "bridge",
+            "type": "bridge",
+            "running": "true",
+            "disabled": "false",
+            "mac-address": _mac(100, 1),
+        },
+        {
+            ".id": "*101",
+            "name": "wifi1",
+            "default-name": "wifi1",
+            "type": "wifi",
+            "running": "true",
+            "disabled": "false",
+            "mac-address": _mac(101, 1),
+        },
+    ]
+    tables["/interface/ethernet"] = [
+        {
+            ".id": f"*{i}",
+            "name": f"ether{i}",
+            "default-name": f"ether{i}",
+            "poe-out": "off",
+        }
+        for i in range(1, ports + 1)
+    ]
+    tables["/interface/ethernet/monitor"] = [
+        {
+            "name": f"ether{i}",
+            "status": "link-ok",
+            "rate": "1Gbps",
+            "full-duplex": "true",
+            "auto-negotiation": "done",
+        }
+        for i in range(1, ports + 1)
+    ]
+    tables["/interface/bridge/port"] = [
+        {".id": f"*{i}", "interface": f"ether{i}", "bridge": "bridge"}
+        for i in range(2, ports + 1)
+    ]
+    tables["/interface/bridge/host"] = [
+        {
+            "mac-address": _mac(host),
+            "interface": f"ether{host % (ports - 1) + 2}",
+            "bridge": "bridge",
+            "local": "false",
+            "disabled": "false",
+            "external": "false",
+        }
+        for host in range(size.hosts)
+    ]
+    tables["/interface/wifi"] = [
+        {
+            ".id": "*101",
+            "name": "wifi1",
+            "default-name": "wifi1",
+            "mac-address": _mac(101, 1),
+            "disabled": "false",
+            "running": "true",
+            "ssid": "benchmark",
+        }
+    ]
+    tables["/interface/wifi/registration-table"] = [
+        {
+            ".id": f"*{host}",
+            "mac-address": _mac(host, 9),
+            "interface": "wifi1",
+            "uptime": "1h",
+            "signal": "-50",
+            "tx-rate": "144.4Mbps",
+            "rx-rate": "144.4Mbps",
+        }
+        for host in range(size.wireless_hosts)
+    ]
+
+    tables["/ip/arp"] = [
+        {
+            ".id": f"*{host}",
+            "address": _ip(host),
+            "mac-address": _mac(host),
+            "interface": "bridge",
+            "status": "reachable",
+            "complete": "true",
+            "dynamic": "true",
+            "disabled": "false",
+        }
+        for host in range(size.hosts)
+    ]
+    tables["/ip/dhcp-server/lease"] = [
+        {
+            ".id": f"*{host}",
+            "address": _ip(host),
+            "mac-address": _mac(host),
+            "active-address": _ip(host),
+            "active-mac-address": _mac(host),
+            "host-name": f"host{host}",
+            "server": "dhcp1",
+            "status": "bound",
+            "last-seen": "1m2s",
+            "comment": f"Host {host}" if host % 3 else "",
+            "disabled": "false",
+        }
+        for host in range(size.hosts)
+    ]
+    tables["/ip/dns/static"] = [
+        {".id": f"*{host}", "name": f"host{host}.lan", "address": _ip(host)}
+        for host in range(0, size.hosts, 2)
+    ]
+    tables["/ip/kid-control/device"] = [
+        {
+            ".id": f"*{host}",
+            "name": f"device{host}",
+            "mac-address": _mac(host),
+            "bytes-down": str(host * 1000),
+            "bytes-up": str(host * 100),
+            "disabled": "false",
+        }
+        for host in range(size.hosts)
+    ]
+
+    for chain in ("nat", "mangle", "filter"):
+        tables[f"/ip/firewall/{chain}"] = [
+            {
+                ".id": f"*{rule}",
+                "chain": "forward",
+                "action": "accept",
+                "protocol": "tcp",
+                "dst-port": str(1000 + rule),
+                "in-interface": "ether1",
+                "disabled": "false",
+                "comment": f"rule {rule}",
+                "bytes": str(rule * 100),
+                "packets": str(rule),
+            }
+            for rule in range(size.rules)
+        ]
+    tables["/ip/firewall/nat"] += [
+        {
+            ".id": f"*n{rule}",
+            "chain": "dstnat",
+            "action": "dst-nat",
+            "protocol": "tcp",
+            "dst-port": str(20000 + rule),
+            "to-addresses": _ip(rule),
+            "to-ports": "80",
+            "in-interface": "ether1",
+            "disabled": "false",
+            "comment": f"forward {rule}",
+        }
+        for rule in range(size.rules)
+    ]
+
+    tables["/queue/simple"] = [
+        {
+            ".id": f"*{queue}",
+            "name": f"queue{queue}",
+            "target": f"{_ip(queue)}/32",
+            "max-limit": "10000000/10000000",
+            "rate": "0/0",
+            "limit-at": "0/0",
+            "burst-limit": "0/0",
+            "burst-threshold": "0/0",
+            "burst-time": "0s/0s",
+            "packet-marks": "",
+            "parent": "none",
+            "disabled": "false",
+            "comment": "",
+        }
+        for queue in range(size.queues)
+    ]
+    tables["/tool/netwatch"] = [
+        {
+            ".id": f"*{index}",
+            "host": f"192.0.2.{index + 1}",
+            "type": "simple",
+            "interval": "10s",
+            "status": "up",
+            "disabled": "false",
+            "comment": "",
+        }
+        for index in range(3)
+    ]
+
+    hosts = max(1, size.hosts)
+    tables["/ip/accounting/snapshot"] = [
+        {
+            ".id": f"*{row}",
+            "src-address": _ip(row % hosts) if row % 2 else "198.51.100.1",
+            "dst-address": "198.51.100.1" if row % 2 else _ip(row % hosts),
+            "bytes": str(row % 1500 + 64),
+            "packets": "1",
+        }
+        for row in range(size.accounting)
+    ]
+    return tables
+
+
+# ---------------------------
+#   match_query
+# ---------------------------
+def match_query(row, query) -> bool:
+    """Evaluate RouterOS query words against row."""
+    stack = []
+    for word in query:
+        word = word[1:]
+        if word == "#!":
+            stack.append(not stack.pop())
+        elif word in ("#|", "#&"):
+            right, left = stack.pop(), stack.pop()
+            stack.append(left or right if word == "#|" else left and right)
+        elif word.startswith("-"):
+            stack.append(word[1:] not in row)
+        elif "=" in word:
+            key, value = word.split("=", 1)
+            stack.append(row.get(key) == value)
+        else:
+            stack.append(word in row)
+
+    return all(stack)
+
+
+# ---------------------------
+#   FakeRouterOS
+# ---------------------------
+class FakeRouterOS:
+    """RouterOS API server answering from generated tables.
+
+    Every reply is delayed by latency, ping replies additionally by
+    ping_delay. Counters of commands and sent bytes are kept for
+    benchmarks.
+    """
+
+    def __init__(
+        self,
+        tables,
+        username="admin",
+        password="",
+        latency=0.0,
+        ping_delay=0.0,
+    ):
+        """Initialize FakeRouterOS."""
+        self.tables = tables
+        self.username = username
+        self.password = password
+        self.latency = latency
+        self.ping_delay = ping_delay
+        self.commands = 0
+        self.sent = 0
+        self._server = None
+        self._connections = {}
+        self._listeners = []
+
+    # ---------------------------
+    #   start
+    # ---------------------------
+    async def start(self, host="127.0.0.1", port=0) -> int:
+        """Start listening, return bound port."""
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    # ---------------------------
+    #   close
+    # ---------------------------
+    async def close(self) -> None:
+        """Stop server and drop connections."""
+        if self._server:
+            self._server.close()
+
+        for writer in self._connections:
+            writer.close()
+
+        await asyncio.gather(*self._connections.values())
+        if self._server:
+            await self._server.wait_closed()
+            self._server = None
+
+    # ---------------------------
+    #   reset_counters
+    # ---------------------------
+    def reset_counters(self) -> None:
+        """Reset command and byte counters."""
+        self.commands = 0
+        self.sent = 0
+
+    # ---------------------------
+    #   set_row
+    # ---------------------------
+    def set_row(self, path, row) -> None:
+        """Add or update row by .id and notify listeners."""
+        rows = self.tables.setdefault(path, [])
+        for current in rows:
+            if current.get(".id") == row[".id"]:
+                current.update(row)
+                row = current
+                break
+        else:
+            rows.append(row)
+
+        self._notify(path, row)
+
+    # ---------------------------
+    #   remove_row
+    # ---------------------------
+    def remove_row(self, path, row_id) -> None:
+        """Remove row by .id and notify listeners."""
+        rows = self.tables.get(path, [])
+        for row in rows:
+            if row.get(".id") == row_id:
+                rows.remove(row)
+                self._notify(path, {".id": row_id, ".dead": "true"})
+                return
+
+    # ---------------------------
+    #   _notify
+    # ---------------------------
+    def _notify(self, path, row) -> None:
+        for writer, tag, listen_path, proplist in self._listeners:
+            if listen_path != path:
+                continue
+
+            if proplist:
+                row = {key: value for key, value in row.items() if key in proplist}
+
+            self._write(writer, [["!re", *self._attrs(row), *tag]])
+
+    # ---------------------------
+    #   _handle
+    # ---------------------------
+    async def _handle(self, reader, writer) -> None:
+        buffer = bytearray()
+        logged_in = False
+        self._connections[writer] = asyncio.current_task()
+        try:
+            while data := await reader.read(65536):
+                buffer += data
+                sentences, consumed = decode_sentences(buffer, API_ENCODING)
+                del buffer[:consumed]
+                for words in sentences:
+                    self.commands += 1
+                    if not logged_in:
+                        logged_in = self._login(writer, words)
+                        continue
+
+                    replies = self._reply(writer, words)
+                    if replies:
+                        self._send(writer, replies, words[0])
+        except ConnectionError:
+            pass
+        finally:
+            self._listeners = [
+                listener for listener in self._listeners if listener[0] is not writer
+            ]
+            self._connections.pop(writer, None)
+            writer.close()
+
+    # ---------------------------
+    #   _login
+    # ---------------------------
+    def _login(self, writer, words) -> bool:
+        """Answer plain and token login, return True when logged in."""
+        args = self._args(words)
+        if words[0] != "/login":
+            self._write(writer, [["!fatal", "not logged in"]])
+            return False
+
+        if "name" not in args:
+            self._write(writer, [["!done", f"=ret={LOGIN_TOKEN}"]])
+            return False
+
+        if "response" in args:
+            valid = args["response"] == encode_password(LOGIN_TOKEN, self.password)
+        else:
+            valid = args.get("password") == self.password
+
+        if valid and args["name"] == self.username:
+            self._write(writer, [["!done"]])
+            return True
+
+        self._write(
+            writer,
+            [
+                ["!trap", "=message=invalid user name or password (6)"],
+                ["!done"],
+            ],
+        )
+        return False
+
+    # ---------------------------
+    #   _reply
+    # ---------------------------
+    def _reply(self, writer, words) -> list:
+        """Return reply sentences for command."""
+        command = words[0]
+        args = self._args(words)
+        tag = [word for word in words[1:] if word.startswith(".tag=")]
+        query = [word for word in words[1:] if word.startswith("?")]
+        path, _, action = command.rpartition("/")
+
+        if action == "print":
+            return self._print(path, args, query, tag)
+
+        if action == "listen":
+            proplist = args.get(".proplist")
+            self._listeners.append(
+                (writer, tag, path, set(proplist.split(",")) if proplist else None)
+            )
+            return []
+
+        if command == "/cancel":
+            self._cancel(writer, f".tag={args.get('tag')}")
+            return [["!done", *tag]]
+
+        if action == "monitor":
+            return self._monitor(path, args, tag)
+
+        if command == "/ping":
+            count = args.get("count", "1")
+            return [
+                ["!re", f"=sent={count}", f"=received={count}", *tag],
+                ["!done", *tag],
+            ]
+
+        if path in self.tables or action in ("take", "run", "check-for-updates"):
+            return [["!done", *tag]]
+
+        return [["!trap", "=message=no such command prefix", *tag], ["!done", *tag]]
+
+    # ---------------------------
+    #   _print
+    # ---------------------------
+    def _print(self, path, args, query, tag) -> list:
+        """Return rows of table matching query."""
+        rows = self.tables.get(path)
+        if rows is None:
+            return [["!trap", "=message=no such command prefix", *tag], ["!done", *tag]]
+
+        proplist = args.get(".proplist")
+        proplist = set(proplist.split(",")) if proplist else None
+        sentences = []
+        for row in rows:
+            if query and not match_query(row, query):
+                continue
+
+            if proplist:
+                row = {key: value for key, value in row.items() if key in proplist}
+
+            sentences.append(["!re", *self._attrs(row), *tag])
+
+        return [*sentences, ["!done", *tag]]
+
+    # ---------------------------
+    #   _monitor
+    # ---------------------------
+    def _monitor(self, path, args, tag) -> list:
+        """Return monitor rows of selected table entries."""
+        numbers = set(args.get("numbers", args.get(".id", "")).split(","))
+        names = {
+            row[".id"]: row["name"] for row in self.tables.get(path, []) if ".id" in row
+        }
+        selected = {names[number] for number in numbers if number in names}
+        return [
+            *(
+                ["!re", *self._attrs(row), *tag]
+                for row in self.tables.get(f"{path}/monitor", [])
+                if row.get("name") in selected
+            ),
+            ["!done", *tag],
+        ]
+
+    # ---------------------------
+    #   _cancel
+    # ---------------------------
+    def _cancel(self, writer, tag) -> None:
+        """Stop listen command with tag and interrupt it."""
+        for listener in list(self._listeners):
+            if listener[0] is writer and listener[1] == [tag]:
+                self._listeners.remove(listener)
+                self._write(
+                    writer,
+                    [
+                        ["!trap", "=category=2", "=message=interrupted", tag],
+                        ["!done", tag],
+                    ],
+                )
+
+    # ---------------------------
+    #   _send
+    # ---------------------------
+    def _send(self, writer, sentences, command) -> None:
+        """Write reply, delayed by latency when set."""
+        delay = self.latency + (self.ping_delay if command == "/ping" else 0)
+        if not delay:
+            self._write(writer, sentences)
+            return
+
+        loop = asyncio.get_running_loop()
+        loop.call_later(delay, self._write, writer, sentences)
+
+    def _write(self, writer, sentences) -> None:
+        if writer.is_closing():
+            return
+
+        data = b"".join(
+            encode_sentence(sentence, API_ENCODING) for sentence in sentences
+        )
+        self.sent += len(data)
+        writer.write(data)
+
+    @staticmethod
+    def _args(words) -> dict:
+        return dict(
+            word[1:].split("=", 1) for word in words[1:] if word.startswith("=")
+        )
+
+    @staticmethod
+    def _attrs(row) -> list:
+        return [f"={key}={value}" for key, value in row.items()]
+
+
+# ---------------------------
+#   main
+# ---------------------------
+async def main() -> None:
+    """Run fake router until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8728)
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--ping-delay", type=float, default=0.0)
+    for field, default in vars(DatasetSize()).items():
+        parser.add_argument(f"--{field.replace('_', '-')}", type=int, default=default)
+
+    args = parser.parse_args()
+    size = DatasetSize(**{field: getattr(args, field) for field in vars(DatasetSize())})
+    server = FakeRouterOS(
+        build_tables(size),
+        username=args.username,
+        password=args.password,
+        latency=args.latency,
+        ping_delay=args.ping_delay,
+    )
+    port = await server.start(args.host, args.port)
+    _LOGGER.warning("Fake RouterOS listening on %s:%s", args.host, port)
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    asyncio.run(main())
@@ -0,0 +1,385 @@
+"""Benchmark suite for Mikrotik Router refresh cycle.
+
+Runs coordinator refresh, tracker refresh, parse_api, host processing and
+accounting against fake routers of several sizes and checks results
+against budgets.
+
+    python -m benchmarks.run --scale home smb isp
+    python -m benchmarks.run --update-budgets
+    python -m benchmarks.run --replay mikrotik_router_192_168_88_1_capture.jsonl.gz
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter, process_time
+
+from homeassistant import config_entries
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_NAME,
+    CONF_PASSWORD,
+    CONF_PORT,
+    CONF_SSL,
+    CONF_USERNAME,
+    CONF_VERIFY_SSL,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry, entity_registry
+
+from custom_components.mikrotik_router.apiparser import (
+    get_proplist,
+    get_query,
+    parse_api,
+)
+from custom_components.mikrotik_router.capture import ReplaySession
+from custom_components.mikrotik_router.const import (
+    CONF_SENSOR_CLIENT_TRAFFIC,
+    CONF_SENSOR_FILTER,
+    CONF_SENSOR_KIDCONTROL,
+    CONF_SENSOR_MANGLE,
+    CONF_SENSOR_NAT,
+    CONF_SENSOR_NETWATCH_TRACKER,
+    CONF_SENSOR_PORT_TRAFFIC,
+    CONF_SENSOR_PPP,
+    CONF_SENSOR_SCRIPTS,
+    CONF_SENSOR_SIMPLE_QUEUES,
+    CONF_TRACK_HOSTS,
+    DOMAIN,
+)
+from custom_components.mikrotik_router.coordinator import (
+    DHCP_SPEC,
+    MikrotikCoordinator,
+    MikrotikTrackerCoordinator,
+)
+
+from .fake_routeros import DatasetSize, FakeRouterOS, build_tables
+
+_LOGGER = logging.getLogger(__name__)
+
+BUDGETS_FILE = Path(__file__).with_name("budgets.json")
+BUDGET_HEADROOM = {"wall_ms": 3.0, "cpu_ms": 3.0, "peak_kib": 1.5, "round_trips": 1.0}
+BUDGET_MINIMUM = {"wall_ms": 5.0, "cpu_ms": 5.0, "peak_kib": 64.0, "round_trips": 0}
+
+SCALES = {
+    "home": DatasetSize(
+        interfaces=5, hosts=25, wireless_hosts=8, rules=20, queues=5, accounting=500
+    ),
+    "smb": DatasetSize(
+        interfaces=24,
+        hosts=500,
+        wireless_hosts=100,
+        rules=200,
+        queues=200,
+        accounting=10000,
+    ),
+    "isp": DatasetSize(
+        interfaces=48,
+        hosts=10000,
+        wireless_hosts=0,
+        rules=2000,
+        queues=5000,
+        accounting=100000,
+    ),
+}
+
+OPTIONS = {
+    CONF_TRACK_HOSTS: True,
+    CONF_SENSOR_PORT_TRAFFIC: True,
+    CONF_SENSOR_CLIENT_TRAFFIC: True,
+    CONF_SENSOR_SIMPLE_QUEUES: True,
+    CONF_SENSOR_NAT: True,
+    CONF_SENSOR_MANGLE: True,
+    CONF_SENSOR_FILTER: True,
+    CONF_SENSOR_PPP: True,
+    CONF_SENSOR_KIDCONTROL: True,
+    CONF_SENSOR_SCRIPTS: True,
+    CONF_SENSOR_NETWATCH_TRACKER: True,
+}
+
+
+# ---------------------------
+#   Result
+# ---------------------------
+@dataclass
+class Result:
+    """Measurements of one benchmark, times are medians per cycle."""
+
+    wall_ms: float
+    cpu_ms: float
+    peak_kib: float
+    round_trips: int
+
+
+# ---------------------------
+#   measure
+# ---------------------------
+async def measure(func, server, cycles) -> Result:
+    """Run func for cycles and one more time under tracemalloc."""
+    wall = []
+    cpu = []
+    round_trips = []
+    for _ in range(cycles):
+        commands = server.commands
+        wall_start = perf_counter()
+        cpu_start = process_time()
+        await func()
+        cpu.append(process_time() - cpu_start)
+        wall.append(perf_counter() - wall_start)
+        round_trips.append(server.commands - commands)
+
+    # tracemalloc slows allocations, memory is measured in separate run
+    tracemalloc.start()
+    await func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return Result(
+        wall_ms=round(median(wall) * 1000, 1),
+        cpu_ms=round(median(cpu) * 1000, 1),
+        peak_kib=round(peak / 1024, 1),
+        round_trips=max(round_trips),
+    )
+
+
+# ---------------------------
+#   create_coordinators
+# ---------------------------
+async def create_coordinators(hass, port, options) -> tuple:
+    """Create coordinator and tracker coordinator for fake router."""
+    config_entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title="Benchmark",
+        data={
+            CONF_NAME: "Benchmark",
+            CONF_HOST: "127.0.0.1",
+            CONF_PORT: port,
+            CONF_USERNAME: "admin",
+            CONF_PASSWORD: "",
+            CONF_SSL: False,
+            CONF_VERIFY_SSL: False,
+        },
+        source=config_entries.SOURCE_USER,
+        options=options,
+    )
+    config_entries.current_entry.set(config_entry)
+    coordinator = MikrotikCoordinator(hass, config_entry)
+    tracker_coordinator = MikrotikTrackerCoordinator(hass, config_entry, coordinator)
+    return coordinator, tracker_coordinator
+
+
+# ---------------------------
+#   run_benchmarks
+# ---------------------------
+async def run_benchmarks(
+    coordinator, tracker_coordinator, counter, cycles, replay=False
+) -> dict:
+    """Run all benchmarks, counter.commands counts API round trips."""
+    # First refresh connects and fills tables for other benchmarks
+    await coordinator._async_update_data()
+    leases = await coordinator.api.query(
+        "/ip/dhcp-server/lease",
+        proplist=get_proplist(**DHCP_SPEC),
+        query=get_query(**DHCP_SPEC),
+    )
+
+    async def full_refresh():
+        coordinator.invalidate_stages()
+        await coordinator._async_update_data()
+
+    async def parse_leases():
+        parse_api(data={}, source=leases, **DHCP_SPEC)
+
+    benchmarks = {
+        "refresh_full": full_refresh,
+        "refresh": coordinator._async_update_data,
+        "tracker_refresh": tracker_coordinator._async_update_data,
+        "parse_api": parse_leases,
+        "process_host": coordinator.async_process_host,
+        "process_accounting": coordinator.async_process_accounting,
+    }
+    if replay:
+        # Capture holds coordinator refresh only, pings and accounting on
+        # RouterOS 7 are not part of it
+        del benchmarks["tracker_refresh"]
+        if coordinator.major_fw_version >= 7:
+            del benchmarks["process_accounting"]
+
+    results = {}
+    for name, func in benchmarks.items():
+        results[name] = await measure(func, counter, cycles)
+
+    coordinator.api.close()
+    tracker_coordinator.api.close()
+    return results
+
+
+# ---------------------------
+#   run_scale
+# ---------------------------
+async def run_scale(size, cycles, latency) -> dict:
+    """Run all benchmarks against router of given size."""
+    server = FakeRouterOS(build_tables(size), latency=latency)
+    port = await server.start()
+    with TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        await device_registry.async_load(hass)
+        await entity_registry.async_load(hass)
+        coordinator, tracker_coordinator = await create_coordinators(
+            hass, port, OPTIONS
+        )
+        results = await run_benchmarks(coordinator, tracker_coordinator, server, cycles)
+        await server.close()
+        await hass.async_stop(force=True)
+
+    return results
+
+
+# ---------------------------
+#   run_replay
+# ---------------------------
+async def run_replay(path, cycles, speed) -> dict:
+    """Run benchmarks against captured API session."""
+    session = ReplaySession.load(path, speed)
+    with TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        await device_registry.async_load(hass)
+        await entity_registry.async_load(hass)
+        coordinator, tracker_coordinator = await create_coordinators(
+            hass, 0, session.metadata.get("options", OPTIONS)
+        )
+        coordinator.api.replay = session
+        results = await run_benchmarks(
+            coordinator, tracker_coordinator, session, cycles, replay=True
+        )
+        await hass.async_stop(force=True)
+
+    return results
+
+
+# ---------------------------
+#   check_budgets
+# ---------------------------
+def check_budgets(results, budgets) -> list:
+    """Return descriptions of results exceeding budgets."""
+    failures = []
+    for scale, benchmarks in results.items():
+        for name, result in benchmarks.items():
+            budget = budgets.get(scale, {}).get(name, {})
+            for key, limit in budget.items():
+                value = getattr(result, key)
+                if value > limit:
+                    failures.append(f"{scale} {name} {key}: {value} > {limit}")
+
+    return failures
+
+
+# ---------------------------
+#   make_budgets
+# ---------------------------
+def make_budgets(results) -> dict:
+    """Return budgets from results with headroom for machine variance."""
+    return {
+        scale: {
+            name: {
+                key: type(value)(
+                    max(BUDGET_MINIMUM[key], round(value * BUDGET_HEADROOM[key], 1))
+                )
+                for key, value in vars(result).items()
+            }
+            for name, result in benchmarks.items()
+        }
+        for scale, benchmarks in results.items()
+    }
+
+
+# ---------------------------
+#   print_results
+# ---------------------------
+def print_results(results) -> None:
+    """Print results table."""
+    print(
+        f"{'scale':<6} {'benchmark':<20} {'wall ms':>10} {'cpu ms':>10}"
+        f" {'peak KiB':>10} {'round trips':>12}"
+    )
+    for scale, benchmarks in results.items():
+        for name, result in benchmarks.items():
+            print(
+                f"{scale:<6} {name:<20} {result.wall_ms:>10} {result.cpu_ms:>10}"
+                f" {result.peak_kib:>10} {result.round_trips:>12}"
+            )
+
+
+# ---------------------------
+#   main
+# ---------------------------
+def main() -> int:
+    """Run benchmarks, return non-zero when a budget is exceeded."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", nargs="+", choices=SCALES, default=list(SCALES))
+    parser.add_argument("--cycles", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--replay", type=Path, help="run against capture file")
+    parser.add_argument(
+        "--speed", type=float, default=0.0, help="replay speed, 0 is immediate"
+    )
+    parser.add_argument("--budgets", type=Path, default=BUDGETS_FILE)
+    parser.add_argument("--json", type=Path, help="write results to file")
+    parser.add_argument(
+        "--update-budgets",
+        action="store_true",
+        help="write budgets from this run instead of checking them",
+    )
+    args = parser.parse_args()
+
+    if args.replay:
+        results = {
+            "replay": asyncio.run(run_replay(args.replay, args.cycles, args.speed))
+        }
+    else:
+        results = {
+            scale: asyncio.run(run_scale(SCALES[scale], args.cycles, args.latency))
+            for scale in args.scale
+        }
+
+    print_results(results)
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                {
+                    scale: {name: vars(result) for name, result in benchmarks.items()}
+                    for scale, benchmarks in results.items()
+                },
+                indent=2,
+            )
+        )
+
+    if args.update_budgets:
+        budgets = json.loads(args.budgets.read_text()) if args.budgets.exists() else {}
+        budgets.update(make_budgets(results))
+        args.budgets.write_text(json.dumps(budgets, indent=2) + "\n")
+        return 0
+
+    failures = check_budgets(results, json.loads(args.budgets.read_text()))
+    for failure in failures:
+        print(f"Budget exceeded: {failure}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    sys.exit(main())
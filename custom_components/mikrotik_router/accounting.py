@@ -0,0 +1,161 @@
+"""Client traffic accounting for Mikrotik Router."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from ipaddress import ip_address
+
+import numpy as np
+
+ACCOUNTING_KEYS = ("wan-tx", "wan-rx", "lan-tx", "lan-rx")
+CHUNK_SIZE = 8192
+
+
+# ---------------------------
+#   AccountingAggregator
+# ---------------------------
+class AccountingAggregator:
+    """Sum accounting snapshot bytes per host address.
+
+    Traffic between two local addresses counts as LAN, traffic leaving or
+    entering local network as WAN. Only host addresses are summed.
+    """
+
+    def __init__(self, addresses, local_networks):
+        """Initialize AccountingAggregator.
+
+        local_networks are sorted non-overlapping (starts, ends) integer ranges.
+        """
+        self.totals = {
+            address: dict.fromkeys(ACCOUNTING_KEYS, 0) for address in addresses
+        }
+        self._starts, self._ends = local_networks
+        self._local = {}
+        self.count = 0
+        self._sources = []
+        self._destinations = []
+        self._byte_counts = []
+
+    # ---------------------------
+    #   is_local
+    # ---------------------------
+    def is_local(self, address) -> bool:
+        """Return True if address is part of local network."""
+        if address not in self._local:
+            value = int(ip_address(address))
+            idx = bisect_right(self._starts, value) - 1
+            self._local[address] = idx >= 0 and value <= self._ends[idx]
+
+        return self._local[address]
+
+    # ---------------------------
+    #   add
+    # ---------------------------
+    def add(self, source, destination, bytes_count) -> None:
+        """Add single snapshot entry."""
+        if self.is_local(source) and self.is_local(destination):
+            if source in self.totals:
+                self.totals[source]["lan-tx"] += bytes_count
+            if destination in self.totals:
+                self.totals[destination]["lan-rx"] += bytes_count
+        elif self.is_local(source):
+            if source in self.totals:
+                self.totals[source]["wan-tx"] += bytes_count
+        elif self.is_local(destination) and destination in self.totals:
+            self.totals[destination]["wan-rx"] += bytes_count
+
+    # ---------------------------
+    #   add_rows
+    # ---------------------------
+    def add_rows(self, sources, destinations, byte_counts) -> None:
+        """Add snapshot entries given as columns, vectorised with numpy."""
+        if not sources:
+            return
+
+        # Encode addresses as indexes into list of unique addresses
+        index = {}
+        src = np.fromiter(
+            (index.setdefault(address, len(index)) for address in sources),
+            dtype=np.intp,
+            count=len(sources),
+        )
+        dst = np.fromiter(
+            (index.setdefault(address, len(index)) for address in destinations),
+            dtype=np.intp,
+            count=len(destinations),
+        )
+        # Integer sums stay exact above 2^53 bytes, unlike float weights
+        weights = np.asarray(byte_counts, dtype=np.int64)
+
+        # Classify unique addresses with vectorised range lookup
+        values = np.fromiter(
+            (int(ip_address(address)) for address in index),
+            dtype=np.int64,
+            count=len(index),
+        )
+        local = np.zeros(len(index), dtype=bool)
+        if self._starts:
+            starts = np.asarray(self._starts, dtype=np.int64)
+            ends = np.asarray(self._ends, dtype=np.int64)
+            idx = np.searchsorted(starts, values, side="right") - 1
+            local = (idx >= 0) & (values <= ends[np.maximum(idx, 0)])
+
+        hosts = list(self.totals)
+        host_index = {address: i for i, address in enumerate(hosts)}
+        host = np.fromiter(
+            (host_index.get(address, -1) for address in index),
+            dtype=np.intp,
+            count=len(index),
+        )
+
+        src_local = local[src]
+        dst_local = local[dst]
+        src_host = host[src]
+        dst_host = host[dst]
+
+        lan = src_local & dst_local
+        for key, mask, host_codes in (
+            ("lan-tx", lan, src_host),
+            ("lan-rx", lan, dst_host),
+            ("wan-tx", src_local & ~dst_local, src_host),
+            ("wan-rx", ~src_local & dst_local, dst_host),
+        ):
+            mask = mask & (host_codes >= 0)
+            sums = np.zeros(len(hosts), dtype=np.int64)
+            np.add.at(sums, host_codes[mask], weights[mask])
+            for i in np.flatnonzero(sums):
+                self.totals[hosts[i]][key] += int(sums[i])
+
+    # ---------------------------
+    #   feed
+    # ---------------------------
+    def feed(self, row) -> None:
+        """Add snapshot row as it is received, rows are summed in chunks."""
+        self.count += 1
+        self._sources.append(str(row.get("src-address")).strip())
+        self._destinations.append(str(row.get("dst-address")).strip())
+        self._byte_counts.append(int(str(row.get("bytes", 0)).strip()))
+        if len(self._sources) >= CHUNK_SIZE:
+            self.flush()
+
+    # ---------------------------
+    #   flush
+    # ---------------------------
+    def flush(self) -> None:
+        """Sum rows buffered by feed."""
+        self.add_rows(self._sources, self._destinations, self._byte_counts)
+        self._sources = []
+        self._destinations = []
+        self._byte_counts = []
+
+    # ---------------------------
+    #   clear
+    # ---------------------------
+    def clear(self) -> None:
+        """Drop partially received snapshot."""
+        self.count = 0
+        self._sources = []
+        self._destinations = []
+        self._byte_counts = []
+        for values in self.totals.values():
+            values.update(dict.fromkeys(ACCOUNTING_KEYS, 0))
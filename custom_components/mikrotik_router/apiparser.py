@@ -8,10 +8,13 @@ from voluptuous import Optional
 
 from homeassistant.components.diagnostics import async_redact_data
 
+from .apiprotocol import compose_query_word
 from .const import TO_REDACT
 
 _LOGGER = getLogger(__name__)
 
+_MISSING = object()
+
 
 # ---------------------------
 #   utc_from_timestamp
@@ -94,8 +97,12 @@ def parse_api(
     ensure_vals=None,
     only=None,
     skip=None,
+    seen=None,
 ) -> dict:
-    """Get data from API."""
+    """Get data from API.
+
+    When seen set is given, uids of processed rows are added to it.
+    """
     debug = _LOGGER.getEffectiveLevel() == 10
     if type(source) == dict:
         tmp = source
@@ -109,6 +116,10 @@ def parse_api(
     if debug:
         _LOGGER.debug("Processing source %s", async_redact_data(source, TO_REDACT))
 
+    vals = compile_vals(vals) if vals else None
+    ensure_vals = compile_ensure_vals(ensure_vals) if ensure_vals else None
+    val_proc = compile_val_proc(val_proc) if val_proc else None
+
     keymap = generate_keymap(data, key_search)
     for entry in source:
         if only and not matches_only(entry, only):
@@ -126,21 +137,290 @@ def parse_api(
             if uid not in data:
                 data[uid] = {}
 
+            if seen is not None:
+                seen.add(uid)
+
         if debug:
             _LOGGER.debug("Processing entry %s", async_redact_data(entry, TO_REDACT))
 
+        target = data[uid] if uid else data
         if vals:
-            data = fill_vals(data, entry, uid, vals)
+            vals.apply(target, entry)
 
         if ensure_vals:
-            data = fill_ensure_vals(data, uid, ensure_vals)
+            ensure_vals.apply(target, entry)
 
         if val_proc:
-            data = fill_vals_proc(data, uid, val_proc)
+            val_proc.apply(target, entry)
 
     return data
 
 
+# ---------------------------
+#   CompiledSpec
+# ---------------------------
+class CompiledSpec(list):
+    """Spec list with precompiled row handler.
+
+    Behaves as the original list of dicts, apply(target, entry) fills
+    target dict from API entry.
+    """
+
+    __slots__ = ("apply",)
+
+    def __init__(self, spec, apply):
+        """Initialize CompiledSpec."""
+        super().__init__(spec)
+        self.apply = apply
+
+
+# ---------------------------
+#   compile_spec
+# ---------------------------
+def compile_spec(**spec) -> dict:
+    """Compile parse_api parameters once, for specs used every update."""
+    for name, compiler in (
+        ("vals", compile_vals),
+        ("ensure_vals", compile_ensure_vals),
+        ("val_proc", compile_val_proc),
+    ):
+        if spec.get(name):
+            spec[name] = compiler(spec[name])
+
+    return spec
+
+
+# ---------------------------
+#   compile_getter
+# ---------------------------
+def compile_getter(source):
+    """Compile getter for source key, "/" separates nested dicts."""
+    if "/" not in source:
+        return lambda entry: entry.get(source, _MISSING)
+
+    path = tuple(source.split("/"))
+
+    def getter(entry):
+        for tmp_param in path:
+            if isinstance(entry, dict) and tmp_param in entry:
+                entry = entry[tmp_param]
+            else:
+                return _MISSING
+
+        return entry
+
+    return getter
+
+
+# ---------------------------
+#   compile_val
+# ---------------------------
+def compile_val(val):
+    """Compile single vals item to value extractor, same as from_entry*."""
+    getter = compile_getter(val.get("source", val["name"]))
+    convert = val.get("convert")
+
+    if val.get("type", "str") == "bool":
+        default = val.get("default", False)
+        reverse = val.get("reverse", False)
+
+        def extract(entry):
+            ret = getter(entry)
+            if ret is _MISSING:
+                return default
+
+            if isinstance(ret, str):
+                if ret in ("on", "On", "ON", "yes", "Yes", "YES", "up", "Up", "UP"):
+                    ret = True
+                elif ret in (
+                    "off",
+                    "Off",
+                    "OFF",
+                    "no",
+                    "No",
+                    "NO",
+                    "down",
+                    "Down",
+                    "DOWN",
+                ):
+                    ret = False
+
+            if not isinstance(ret, bool):
+                ret = default
+
+            return not ret if reverse else ret
+
+    else:
+        default = val.get("default", "")
+        if "default_val" in val and val["default_val"] in val:
+            default = val[val["default_val"]]
+
+        cast = default != ""
+
+        def extract(entry):
+            ret = getter(entry)
+            if ret is _MISSING:
+                return default
+
+            if cast:
+                if isinstance(ret, str):
+                    ret = str(ret)
+                elif isinstance(ret, int):
+                    ret = int(ret)
+                elif isinstance(ret, float):
+                    ret = round(float(ret), 2)
+
+            return ret[:255] if isinstance(ret, str) and len(ret) > 255 else ret
+
+    if convert != "utc_from_timestamp":
+        return extract
+
+    def extract_timestamp(entry):
+        ret = extract(entry)
+        if isinstance(ret, int) and ret > 0:
+            if ret > 100000000000:
+                ret = ret / 1000
+
+            ret = utc_from_timestamp(ret)
+
+        return ret
+
+    return extract_timestamp
+
+
+# ---------------------------
+#   compile_vals
+# ---------------------------
+def compile_vals(vals) -> CompiledSpec:
+    """Compile vals parameter of parse_api."""
+    if isinstance(vals, CompiledSpec):
+        return vals
+
+    fields = tuple(
+        (val["name"], compile_val(val))
+        for val in vals
+        if val.get("type", "str") in ("str", "bool")
+    )
+
+    def apply(target, entry):
+        for name, extract in fields:
+            target[name] = extract(entry)
+
+    return CompiledSpec(vals, apply)
+
+
+# ---------------------------
+#   compile_ensure_vals
+# ---------------------------
+def compile_ensure_vals(ensure_vals) -> CompiledSpec:
+    """Compile ensure_vals parameter of parse_api."""
+    if isinstance(ensure_vals, CompiledSpec):
+        return ensure_vals
+
+    defaults = tuple((val["name"], val.get("default", "")) for val in ensure_vals)
+
+    def apply(target, entry=None):
+        for name, default in defaults:
+            if name not in target:
+                target[name] = default
+
+    return CompiledSpec(ensure_vals, apply)
+
+
+# ---------------------------
+#   compile_val_proc
+# ---------------------------
+def compile_val_proc(vals_proc) -> CompiledSpec:
+    """Compile val_proc parameter of parse_api."""
+    if isinstance(vals_proc, CompiledSpec):
+        return vals_proc
+
+    procs = []
+    for val_sub in vals_proc:
+        _name = None
+        _action = None
+        parts = []
+        for val in val_sub:
+            if "name" in val:
+                _name = val["name"]
+                continue
+
+            if "action" in val:
+                _action = val["action"]
+                continue
+
+            if not _name and not _action:
+                break
+
+            if _action == "combine":
+                if "key" in val:
+                    parts.append((True, val["key"]))
+
+                if "text" in val:
+                    parts.append((False, val["text"]))
+
+        procs.append((_name, tuple(parts)))
+
+    def apply(target, entry=None):
+        for name, parts in procs:
+            value = None
+            for is_key, part in parts:
+                tmp = (
+                    (target[part] if part in target else "unknown") if is_key else part
+                )
+                value = f"{value}{tmp}" if value else tmp
+
+            if name and value:
+                target[name] = value
+
+    return CompiledSpec(vals_proc, apply)
+
+
+# ---------------------------
+#   get_proplist
+# ---------------------------
+def get_proplist(
+    key=None,
+    key_secondary=None,
+    key_search=None,
+    vals=None,
+    only=None,
+    skip=None,
+    **kwargs,
+) -> list:
+    """Get list of API properties used by parse_api parameters."""
+    proplist = [key, key_secondary, key_search]
+    for val in vals or []:
+        proplist.append(val.get("source", val["name"]).split("/")[0])
+
+    for val in only or []:
+        proplist.append(val["key"])
+
+    for val in skip or []:
+        proplist.append(val["name"])
+
+    return list(dict.fromkeys(tmp for tmp in proplist if tmp))
+
+
+# ---------------------------
+#   get_query
+# ---------------------------
+def get_query(only=None, skip=None, **kwargs) -> list:
+    """Get API query words filtering rows like only and skip parameters.
+
+    Skip on empty value also matches missing property and is left to
+    client side filtering.
+    """
+    query = [compose_query_word(val["key"], val["value"]) for val in only or []]
+    for val in skip or []:
+        if val["value"] == "":
+            continue
+
+        query += [compose_query_word(val["name"], val["value"]), "?#!"]
+
+    return query
+
+
 # ---------------------------
 #   get_uid
 # ---------------------------
@@ -250,48 +530,7 @@ def fill_defaults(data, vals) -> dict:
 # ---------------------------
 def fill_vals(data, entry, uid, vals) -> dict:
     """Fill all data."""
-    for val in vals:
-        _name = val["name"]
-        _type = val["type"] if "type" in val else "str"
-        _source = val["source"] if "source" in val else _name
-        _convert = val["convert"] if "convert" in val else None
-
-        if _type == "str":
-            _default = val["default"] if "default" in val else ""
-            if "default_val" in val and val["default_val"] in val:
-                _default = val[val["default_val"]]
-
-            if uid:
-                data[uid][_name] = from_entry(entry, _source, default=_default)
-            else:
-                data[_name] = from_entry(entry, _source, default=_default)
-
-        elif _type == "bool":
-            _default = val["default"] if "default" in val else False
-            _reverse = val["reverse"] if "reverse" in val else False
-
-            if uid:
-                data[uid][_name] = from_entry_bool(
-                    entry, _source, default=_default, reverse=_reverse
-                )
-            else:
-                data[_name] = from_entry_bool(
-                    entry, _source, default=_default, reverse=_reverse
-                )
-
-        if _convert == "utc_from_timestamp":
-            if uid:
-                if isinstance(data[uid][_name], int) and data[uid][_name] > 0:
-                    if data[uid][_name] > 100000000000:
-                        data[uid][_name] = data[uid][_name] / 1000
-
-                    data[uid][_name] = utc_from_timestamp(data[uid][_name])
-            elif isinstance(data[_name], int) and data[_name] > 0:
-                if data[_name] > 100000000000:
-                    data[_name] = data[_name] / 1000
-
-                data[_name] = utc_from_timestamp(data[_name])
-
+    compile_vals(vals).apply(data[uid] if uid else data, entry)
     return data
 
 
@@ -300,16 +539,7 @@ def fill_vals(data, entry, uid, vals) -> dict:
 # ---------------------------
 def fill_ensure_vals(data, uid, ensure_vals) -> dict:
     """Add required keys which are not available in data."""
-    for val in ensure_vals:
-        if uid:
-            if val["name"] not in data[uid]:
-                _default = val["default"] if "default" in val else ""
-                data[uid][val["name"]] = _default
-
-        elif val["name"] not in data:
-            _default = val["default"] if "default" in val else ""
-            data[val["name"]] = _default
-
+    compile_ensure_vals(ensure_vals).apply(data[uid] if uid else data)
     return data
 
 
@@ -318,36 +548,5 @@ def fill_ensure_vals(data, uid, ensure_vals) -> dict:
 # ---------------------------
 def fill_vals_proc(data, uid, vals_proc) -> dict:
     """Add custom keys."""
-    _data = data[uid] if uid else data
-    for val_sub in vals_proc:
-        _name = None
-        _action = None
-        _value = None
-        for val in val_sub:
-            if "name" in val:
-                _name = val["name"]
-                continue
-
-            if "action" in val:
-                _action = val["action"]
-                continue
-
-            if not _name and not _action:
-                break
-
-            if _action == "combine":
-                if "key" in val:
-                    tmp = _data[val["key"]] if val["key"] in _data else "unknown"
-                    _value = f"{_value}{tmp}" if _value else tmp
-
-                if "text" in val:
-                    tmp = val["text"]
-                    _value = f"{_value}{tmp}" if _value else tmp
-
-        if _name and _value:
-            if uid:
-                data[uid][_name] = _value
-            else:
-                data[_name] = _value
-
+    compile_val_proc(vals_proc).apply(data[uid] if uid else data)
     return data
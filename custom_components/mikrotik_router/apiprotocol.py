@@ -0,0 +1,460 @@
+"""Asyncio RouterOS API protocol for Mikrotik Router."""
+
+import asyncio
+from binascii import hexlify, unhexlify
+from hashlib import md5
+from logging import getLogger
+
+from .exceptions import (
+    ApiConnectionClosed,
+    ApiFatalError,
+    ApiProtocolError,
+    ApiTrapError,
+)
+
+_LOGGER = getLogger(__name__)
+
+API_BYTE_ORDER = "big"
+API_READ_CHUNK = 65536
+API_TIMEOUT = 10
+
+WORD_MAPPING = {"yes": True, "true": True, "no": False, "false": False}
+
+
+# ---------------------------
+#   encode_length
+# ---------------------------
+def encode_length(length) -> bytes:
+    """Encode word length in RouterOS API format."""
+    if length < 0x80:
+        return length.to_bytes(1, API_BYTE_ORDER)
+
+    if length < 0x4000:
+        return (length | 0x8000).to_bytes(2, API_BYTE_ORDER)
+
+    if length < 0x200000:
+        return (length | 0xC00000).to_bytes(3, API_BYTE_ORDER)
+
+    if length < 0x10000000:
+        return (length | 0xE0000000).to_bytes(4, API_BYTE_ORDER)
+
+    raise ApiProtocolError(f"Unable to encode length {length}")
+
+
+# ---------------------------
+#   encode_sentence
+# ---------------------------
+def encode_sentence(words, encoding) -> bytes:
+    """Encode sentence in RouterOS API format."""
+    encoded = bytearray()
+    for word in words:
+        tmp = word.encode(encoding, errors="strict")
+        encoded += encode_length(len(tmp))
+        encoded += tmp
+
+    encoded += b"\x00"
+    return bytes(encoded)
+
+
+# ---------------------------
+#   decode_sentences
+# ---------------------------
+def decode_sentences(buffer, encoding) -> tuple:
+    """Decode all complete sentences from buffer.
+
+    Returns list of sentences and number of bytes consumed.
+    """
+    sentences = []
+    words = []
+    size = len(buffer)
+    pos = 0
+    consumed = 0
+    while pos < size:
+        ctl = buffer[pos]
+        if ctl < 0x80:
+            header = 1
+            length = ctl
+        elif ctl < 0xC0:
+            header = 2
+            if pos + header > size:
+                break
+
+            length = ((ctl ^ 0x80) << 8) | buffer[pos + 1]
+        elif ctl < 0xE0:
+            header = 3
+            if pos + header > size:
+                break
+
+            length = ((ctl ^ 0xC0) << 16) | (buffer[pos + 1] << 8) | buffer[pos + 2]
+        elif ctl < 0xF0:
+            header = 4
+            if pos + header > size:
+                break
+
+            length = (
+                ((ctl ^ 0xE0) << 24)
+                | (buffer[pos + 1] << 16)
+                | (buffer[pos + 2] << 8)
+                | buffer[pos + 3]
+            )
+        else:
+            raise ApiProtocolError(f"Unknown control byte {ctl}")
+
+        if length == 0:
+            sentences.append(words)
+            words = []
+            pos += 1
+            consumed = pos
+            continue
+
+        end = pos + header + length
+        if end > size:
+            break
+
+        words.append(buffer[pos + header : end].decode(encoding, errors="ignore"))
+        pos = end
+
+    return sentences, consumed
+
+
+# ---------------------------
+#   parse_word
+# ---------------------------
+def parse_word(word) -> tuple:
+    """Split attribute word into key and python value."""
+    _, key, value = word.split("=", 2)
+    try:
+        tmp = int(value)
+        # Keep leading zeros as string
+        ret = tmp if str(tmp) == value else value
+    except ValueError:
+        ret = WORD_MAPPING.get(value, value)
+
+    return key, ret
+
+
+# ---------------------------
+#   cast_to_api
+# ---------------------------
+def cast_to_api(value) -> str:
+    """Cast python value to API value."""
+    if type(value) is bool:
+        return "yes" if value else "no"
+
+    return str(value)
+
+
+# ---------------------------
+#   compose_word
+# ---------------------------
+def compose_word(key, value) -> str:
+    """Compose attribute word from key and value."""
+    return f"={key}={cast_to_api(value)}"
+
+
+# ---------------------------
+#   compose_query_word
+# ---------------------------
+def compose_query_word(key, value) -> str:
+    """Compose query word matching property value."""
+    if type(value) is bool:
+        value = "true" if value else "false"
+
+    return f"?{key}={value}"
+
+
+# ---------------------------
+#   encode_password
+# ---------------------------
+def encode_password(token, password) -> str:
+    """Encode password for pre 6.43 token login."""
+    hasher = md5(usedforsecurity=False)
+    hasher.update(b"\x00" + password.encode("ascii") + unhexlify(token))
+    return "00" + hexlify(hasher.digest()).decode("ascii")
+
+
+# ---------------------------
+#   ApiRequest
+# ---------------------------
+class ApiRequest:
+    """Pending command on RouterOS API connection."""
+
+    __slots__ = ("future", "rows", "traps", "activity", "callback", "received")
+
+    def __init__(self, loop, callback=None):
+        """Initialize ApiRequest."""
+        self.future = loop.create_future()
+        self.rows = []
+        self.traps = []
+        self.activity = 0
+        self.callback = callback
+        self.received = 0
+
+    # ---------------------------
+    #   feed
+    # ---------------------------
+    def feed(self, reply, attrs) -> None:
+        """Process reply sentence for this request."""
+        self.activity += 1
+        if reply == "!trap":
+            self.traps.append(attrs)
+        elif reply == "!re" and self.callback:
+            try:
+                self.callback(attrs)
+            except Exception as e:
+                _LOGGER.error("Error while processing reply: %s", e)
+        elif reply in ("!re", "!done") and attrs:
+            self.rows.append(attrs)
+
+        if reply == "!done" and not self.future.done():
+            self.future.set_result(None)
+
+    # ---------------------------
+    #   fail
+    # ---------------------------
+    def fail(self, error) -> None:
+        """Fail request."""
+        if not self.future.done():
+            self.future.set_exception(error)
+
+
+# ---------------------------
+#   RouterOSConnection
+# ---------------------------
+class RouterOSConnection:
+    """Single asyncio connection to RouterOS API.
+
+    Commands are sent with unique .tag and replies are demultiplexed by
+    a background reader, so multiple commands can be in flight at once.
+    """
+
+    def __init__(self, reader, writer, encoding, timeout=API_TIMEOUT):
+        """Initialize RouterOSConnection."""
+        self._reader = reader
+        self._writer = writer
+        self._encoding = encoding
+        self._timeout = timeout
+        self._buffer = bytearray()
+        self._requests = {}
+        self._tag = 0
+        self._reader_task = asyncio.get_running_loop().create_task(self._read_loop())
+        self.closed = False
+
+    # ---------------------------
+    #   open
+    # ---------------------------
+    @classmethod
+    async def open(
+        cls, host, port, ssl_context=None, encoding="ASCII", timeout=API_TIMEOUT
+    ):
+        """Open connection to RouterOS API."""
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=ssl_context), timeout
+        )
+        return cls(reader, writer, encoding, timeout)
+
+    # ---------------------------
+    #   login
+    # ---------------------------
+    async def login(self, username, password, method="plain") -> None:
+        """Login to RouterOS API."""
+        if method == "token":
+            response = await self.talk("/login", tagged=False)
+            token = str(response[0]["ret"])
+            await self.talk(
+                "/login",
+                compose_word("name", username),
+                compose_word("response", encode_password(token, password)),
+                tagged=False,
+            )
+            return
+
+        await self.talk(
+            "/login",
+            compose_word("name", username),
+            compose_word("password", password),
+            tagged=False,
+        )
+
+    # ---------------------------
+    #   write_sentence
+    # ---------------------------
+    async def write_sentence(self, *words) -> None:
+        """Write sentence to RouterOS API."""
+        if self.closed:
+            raise ApiConnectionClosed("Connection is closed")
+
+        self._writer.write(encode_sentence(words, self._encoding))
+        await asyncio.wait_for(self._writer.drain(), self._timeout)
+
+    # ---------------------------
+    #   _read_loop
+    # ---------------------------
+    async def _read_loop(self) -> None:
+        """Read replies and dispatch them to pending requests by tag."""
+        try:
+            while True:
+                data = await self._reader.read(API_READ_CHUNK)
+                if not data:
+                    raise ApiConnectionClosed("Connection closed by router")
+
+                self._buffer += data
+                sentences, consumed = decode_sentences(self._buffer, self._encoding)
+                del self._buffer[:consumed]
+                for words in sentences:
+                    self._dispatch(words)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._fail_all(e)
+            self.close()
+
+    # ---------------------------
+    #   _dispatch
+    # ---------------------------
+    def _dispatch(self, words) -> None:
+        """Dispatch one reply sentence."""
+        if not words:
+            raise ApiProtocolError("Empty sentence received")
+
+        if words[0] == "!fatal":
+            raise ApiFatalError(words[1] if len(words) > 1 else "unknown")
+
+        tag = None
+        attrs = {}
+        for word in words[1:]:
+            if word[:1] == "=":
+                key, value = parse_word(word)
+                attrs[key] = value
+            elif word[:5] == ".tag=":
+                tag = word[5:]
+
+        request = self._requests.get(tag)
+        if request is None:
+            _LOGGER.debug("Reply %s for unknown tag %s ignored", words[0], tag)
+            return
+
+        request.received += sum(map(len, words))
+        request.feed(words[0], attrs)
+        if request.future.done():
+            del self._requests[tag]
+
+    # ---------------------------
+    #   _fail_all
+    # ---------------------------
+    def _fail_all(self, error) -> None:
+        """Fail all pending requests."""
+        requests = self._requests
+        self._requests = {}
+        for request in requests.values():
+            request.fail(error)
+
+    # ---------------------------
+    #   _wait
+    # ---------------------------
+    async def _wait(self, request, timeout=True) -> None:
+        """Wait for request to finish.
+
+        Timeout is applied to inactivity, so long replies are not cut.
+        Subscriptions wait without timeout.
+        """
+        if not timeout:
+            await request.future
+
+        while not request.future.done():
+            activity = request.activity
+            try:
+                await asyncio.wait_for(asyncio.shield(request.future), self._timeout)
+            except asyncio.TimeoutError:
+                if request.activity == activity:
+                    raise
+
+        request.future.result()
+
+    # ---------------------------
+    #   talk
+    # ---------------------------
+    async def talk(
+        self, *words, tagged=True, callback=None, timeout=True, info=None
+    ) -> list:
+        """Send command and return all reply rows.
+
+        When callback is given, !re rows are passed to it as they arrive
+        instead of being collected. Listen commands disable timeout.
+        Cancelling the waiting task cancels the command on the router.
+        Number of reply sentences and received characters are added to
+        info dict when given.
+
+        Raises ApiTrapError when command returned !trap.
+        """
+        if self.closed:
+            raise ApiConnectionClosed("Connection is closed")
+
+        tag = None
+        if tagged:
+            self._tag += 1
+            tag = str(self._tag)
+            words = (*words, f".tag={tag}")
+        elif None in self._requests:
+            raise ApiProtocolError("Untagged command already in progress")
+
+        request = ApiRequest(asyncio.get_running_loop(), callback)
+        self._requests[tag] = request
+        try:
+            await self.write_sentence(*words)
+            await self._wait(request, timeout)
+        finally:
+            if self._requests.get(tag) is request:
+                del self._requests[tag]
+                if tag and not self.closed:
+                    self._cancel(tag)
+
+            if request.future.done() and not request.future.cancelled():
+                request.future.exception()
+
+            if info is not None:
+                info["replies"] = info.get("replies", 0) + request.activity
+                info["received"] = info.get("received", 0) + request.received
+
+        if request.traps:
+            raise ApiTrapError(
+                ", ".join(
+                    str(trap.get("message", "unknown")) for trap in request.traps
+                ),
+                request.traps[0].get("category"),
+            )
+
+        return request.rows
+
+    # ---------------------------
+    #   _cancel
+    # ---------------------------
+    def _cancel(self, tag) -> None:
+        """Cancel running command on router, replies are ignored."""
+        try:
+            self._writer.write(
+                encode_sentence(
+                    ("/cancel", f"=tag={tag}", f".tag=cancel-{tag}"), self._encoding
+                )
+            )
+        except Exception as e:
+            _LOGGER.debug("Error while cancelling command %s: %s", tag, e)
+
+    # ---------------------------
+    #   close
+    # ---------------------------
+    def close(self) -> None:
+        """Close connection."""
+        if self.closed:
+            return
+
+        self.closed = True
+        if self._reader_task is not asyncio.current_task():
+            self._reader_task.cancel()
+
+        try:
+            self._writer.close()
+        except Exception as e:
+            _LOGGER.debug("Error while closing connection: %s", e)
+
+        self._fail_all(ApiConnectionClosed("Connection is closed"))
@@ -31,6 +31,7 @@ async def async_setup_entry(
     dispatcher = {
         "MikrotikButton": MikrotikButton,
         "MikrotikScriptButton": MikrotikScriptButton,
+        "MikrotikCaptureButton": MikrotikCaptureButton,
     }
     await async_add_entities(hass, config_entry, dispatcher)
 
@@ -57,6 +58,19 @@ class MikrotikScriptButton(MikrotikButton):
     async def async_press(self) -> None:
         """Run script using Mikrotik API"""
         try:
-            self.coordinator.api.run_script(self._data["name"])
+            await self.coordinator.api.run_script(
+                self._data["name"], self._data.get(".id")
+            )
         except ApiEntryNotFound as error:
             _LOGGER.error("Failed to run script: %s", error)
+
+
+# ---------------------------
+#   MikrotikCaptureButton
+# ---------------------------
+class MikrotikCaptureButton(MikrotikButton):
+    """Representation of an API session capture button."""
+
+    async def async_press(self) -> None:
+        """Record API session of full refresh for performance reports"""
+        await self.coordinator.async_capture()
@@ -8,6 +8,7 @@ from typing import List
 from homeassistant.components.sensor import (
     SensorEntityDescription,
 )
+from homeassistant.const import EntityCategory
 
 from .const import DOMAIN
 
@@ -51,6 +52,21 @@ SENSOR_TYPES: tuple[MikrotikButtonEntityDescription, ...] = (
         data_attributes_list=DEVICE_ATTRIBUTES_SCRIPT,
         func="MikrotikScriptButton",
     ),
+    MikrotikButtonEntityDescription(
+        key="system_api-capture",
+        name="Capture API session",
+        icon="mdi:record-rec",
+        device_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        ha_group="System",
+        data_path="stats",
+        data_attribute="update-duration",
+        data_name="",
+        data_uid="",
+        data_reference="",
+        func="MikrotikCaptureButton",
+    ),
 )
 
 SENSOR_SERVICES = {}
@@ -0,0 +1,367 @@
+"""Capture and replay of Mikrotik API sessions.
+
+Capture file is gzip compressed JSON lines. First line is a header, every
+other line is one command with its words, duration in seconds, returned
+rows, rows passed to callback (stream) and error, if any. Values of
+TO_REDACT fields are replaced by pseudonyms of the same format, so tables
+keep their sizes, keys and network structure.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hmac
+import json
+import re
+import secrets
+from hashlib import sha256
+from ipaddress import IPv4Address
+from string import ascii_lowercase, ascii_uppercase
+from time import monotonic
+
+from .const import TO_REDACT
+from .exceptions import ApiConnectionClosed, ApiTrapError
+
+CAPTURE_FORMAT = "mikrotik_router capture"
+CAPTURE_VERSION = 1
+
+IPV4_PATTERN = re.compile(r"\b((?:\d{1,3}\.){3}\d{1,3})(/\d{1,2})?\b")
+MAC_PATTERN = re.compile(r"\b(?:[0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2}\b")
+
+
+# ---------------------------
+#   Pseudonymizer
+# ---------------------------
+class Pseudonymizer:
+    """Replace sensitive values with consistent pseudonyms of same format.
+
+    IPv4 addresses are mapped prefix preserving, so hosts stay in their
+    networks. MAC addresses keep unicast and local bits, other text keeps
+    length and character classes. Secret is random per capture.
+    """
+
+    def __init__(self, keys=TO_REDACT, secret=None):
+        """Initialize Pseudonymizer."""
+        self._keys = keys
+        self._secret = secret or secrets.token_bytes(16)
+        self._flips = {}
+        self._addresses = {}
+
+    def _digest(self, value) -> bytes:
+        return hmac.new(self._secret, value.encode(), sha256).digest()
+
+    # ---------------------------
+    #   ipv4
+    # ---------------------------
+    def ipv4(self, address) -> str:
+        """Return pseudonym of IPv4 address, equal prefixes map equally."""
+        if address not in self._addresses:
+            try:
+                value = int(IPv4Address(address))
+            except ValueError:
+                return address
+
+            result = 0
+            for bit in range(32):
+                prefix = (bit, value >> (32 - bit) if bit else 0)
+                if prefix not in self._flips:
+                    self._flips[prefix] = self._digest(f"ip{prefix}")[0] & 1
+
+                result = (result << 1) | (
+                    ((value >> (31 - bit)) & 1) ^ self._flips[prefix]
+                )
+
+            self._addresses[address] = str(IPv4Address(result))
+
+        return self._addresses[address]
+
+    # ---------------------------
+    #   network
+    # ---------------------------
+    def network(self, match) -> str:
+        """Return pseudonym of address with optional prefix length."""
+        address, prefix = match.groups()
+        result = self.ipv4(address)
+        if not prefix or int(prefix[1:]) > 32 or result == address:
+            return result + (prefix or "")
+
+        # Keep network addresses valid, host bits stay zero
+        host_bits = 0xFFFFFFFF >> int(prefix[1:])
+        if int(IPv4Address(address)) & host_bits:
+            return result + prefix
+
+        return str(IPv4Address(int(IPv4Address(result)) & ~host_bits)) + prefix
+
+    # ---------------------------
+    #   mac
+    # ---------------------------
+    def mac(self, match) -> str:
+        """Return pseudonym of MAC address keeping separators and case."""
+        mac = match.group(0)
+        octets = list(self._digest(f"mac{mac.upper().replace('-', ':')}")[:6])
+        # Keep multicast and locally administered bits
+        octets[0] = (octets[0] & 0xFC) | (int(mac[:2], 16) & 0x03)
+        result = mac[2].join(f"{octet:02X}" for octet in octets)
+        return result.lower() if mac.islower() else result
+
+    # ---------------------------
+    #   text
+    # ---------------------------
+    def text(self, value) -> str:
+        """Return pseudonym of text keeping length and character classes."""
+        stream = b""
+        counter = 0
+        while len(stream) < len(value):
+            stream += self._digest(f"text{counter}:{value}")
+            counter += 1
+
+        result = []
+        for char, byte in zip(value, stream):
+            if char.isdigit():
+                result.append(str(byte % 10))
+            elif char in ascii_lowercase:
+                result.append(ascii_lowercase[byte % 26])
+            elif char in ascii_uppercase:
+                result.append(ascii_uppercase[byte % 26])
+            else:
+                result.append(char)
+
+        return "".join(result)
+
+    # ---------------------------
+    #   value
+    # ---------------------------
+    def value(self, value):
+        """Return pseudonym of field value."""
+        if type(value) is bool or value is None:
+            return value
+
+        if type(value) is int:
+            return int(self.text(str(value)))
+
+        value = str(value)
+        result = IPV4_PATTERN.sub(self.network, MAC_PATTERN.sub(self.mac, value))
+        if result != value:
+            return result
+
+        return self.text(value)
+
+    # ---------------------------
+    #   row
+    # ---------------------------
+    def row(self, row) -> dict:
+        """Return row with sensitive fields replaced."""
+        return {
+            key: self.value(value) if key in self._keys else value
+            for key, value in row.items()
+        }
+
+    # ---------------------------
+    #   word
+    # ---------------------------
+    def word(self, word) -> str:
+        """Return attribute or query word with sensitive value replaced."""
+        if word[:1] not in ("=", "?") or "=" not in word[1:]:
+            return word
+
+        key, value = word[1:].split("=", 1)
+        if key not in self._keys:
+            return word
+
+        return f"{word[0]}{key}={self.value(value)}"
+
+
+# ---------------------------
+#   ApiRecorder
+# ---------------------------
+class ApiRecorder:
+    """Record commands sent over API connection.
+
+    Rows are kept as received and pseudonymized when saved, so capture
+    adds little work to the event loop. Listen commands are not recorded.
+    """
+
+    def __init__(self):
+        """Initialize ApiRecorder."""
+        self.entries = []
+        self._start = monotonic()
+
+    # ---------------------------
+    #   talk
+    # ---------------------------
+    async def talk(self, connection, *words, callback=None, timeout=True, info=None):
+        """Send command over connection and record reply."""
+        if not timeout:
+            return await connection.talk(
+                *words, callback=callback, timeout=timeout, info=info
+            )
+
+        entry = {"time": round(monotonic() - self._start, 4), "words": list(words)}
+        streamed = None
+        if callback:
+            streamed = []
+
+            def record_row(row) -> None:
+                streamed.append(row)
+                callback(row)
+
+        start = monotonic()
+        try:
+            rows = await connection.talk(
+                *words,
+                callback=record_row if callback else None,
+                timeout=timeout,
+                info=info,
+            )
+        except ApiTrapError as e:
+            entry["error"] = e.message
+            entry["category"] = e.category
+            raise
+        except Exception as e:
+            entry["error"] = str(e)
+            entry["closed"] = True
+            raise
+        else:
+            entry["rows"] = rows
+        finally:
+            entry["duration"] = round(monotonic() - start, 4)
+            if streamed is not None:
+                entry["stream"] = streamed
+
+            self.entries.append(entry)
+
+        return rows
+
+    # ---------------------------
+    #   save
+    # ---------------------------
+    def save(self, path, metadata=None) -> int:
+        """Write pseudonymized capture to path, return number of commands."""
+        pseudonymizer = Pseudonymizer()
+        header = {
+            "format": CAPTURE_FORMAT,
+            "version": CAPTURE_VERSION,
+            "metadata": metadata or {},
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            file.write(json.dumps(header) + "\n")
+            for entry in self.entries:
+                entry = dict(entry)
+                entry["words"] = [pseudonymizer.word(word) for word in entry["words"]]
+                for key in ("rows", "stream"):
+                    if key in entry:
+                        entry[key] = [pseudonymizer.row(row) for row in entry[key]]
+
+                file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+        return len(self.entries)
+
+
+# ---------------------------
+#   ReplaySession
+# ---------------------------
+class ReplaySession:
+    """Recorded API session replayed in place of router connection.
+
+    Replies are matched by command words in recorded order, the last reply
+    is repeated once recorded ones are used up. Recorded durations are
+    divided by speed, speed 0 replies immediately.
+    """
+
+    def __init__(self, entries, speed=1.0, metadata=None):
+        """Initialize ReplaySession."""
+        self.speed = speed
+        self.metadata = metadata or {}
+        self.commands = 0
+        self._replies = {}
+        self._positions = {}
+        for entry in entries:
+            self._replies.setdefault(tuple(entry["words"]), []).append(entry)
+
+    # ---------------------------
+    #   load
+    # ---------------------------
+    @classmethod
+    def load(cls, path, speed=1.0) -> ReplaySession:
+        """Load capture file."""
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            header = json.loads(file.readline())
+            if header.get("format") != CAPTURE_FORMAT:
+                raise ValueError(f"{path} is not a capture file")
+
+            return cls(
+                [json.loads(line) for line in file], speed, header.get("metadata")
+            )
+
+    # ---------------------------
+    #   open
+    # ---------------------------
+    def open(self) -> ReplayConnection:
+        """Return new connection replaying this session."""
+        return ReplayConnection(self)
+
+    # ---------------------------
+    #   reply
+    # ---------------------------
+    async def reply(self, words, callback=None) -> list:
+        """Return recorded reply for command words."""
+        self.commands += 1
+        replies = self._replies.get(tuple(words))
+        if not replies:
+            raise ApiTrapError(f"no recorded reply for {' '.join(words)}")
+
+        position = self._positions.get(tuple(words), 0)
+        self._positions[tuple(words)] = position + 1
+        entry = replies[min(position, len(replies) - 1)]
+        if self.speed:
+            await asyncio.sleep(entry["duration"] / self.speed)
+
+        if callback:
+            for row in entry.get("stream", []):
+                callback(dict(row))
+
+        if entry.get("closed"):
+            raise ApiConnectionClosed(entry["error"])
+
+        if "error" in entry:
+            raise ApiTrapError(entry["error"], entry.get("category"))
+
+        return [dict(row) for row in entry["rows"]]
+
+
+# ---------------------------
+#   ReplayConnection
+# ---------------------------
+class ReplayConnection:
+    """Connection answering commands from ReplaySession."""
+
+    def __init__(self, session):
+        """Initialize ReplayConnection."""
+        self._session = session
+        self.closed = False
+
+    async def login(self, username, password, method="plain") -> None:
+        """Login is not recorded, always succeeds."""
+
+    def close(self) -> None:
+        """Close connection."""
+        self.closed = True
+
+    # ---------------------------
+    #   talk
+    # ---------------------------
+    async def talk(
+        self, *words, tagged=True, callback=None, timeout=True, info=None
+    ) -> list:
+        """Return recorded reply, listen commands wait until closed."""
+        if self.closed:
+            raise ApiConnectionClosed("Connection is closed")
+
+        if not timeout:
+            while not self.closed:
+                await asyncio.sleep(1)
+
+            raise ApiConnectionClosed("Connection is closed")
+
+        return await self._session.reply(words, callback)
@@ -27,6 +27,14 @@ from .const import (
     DEFAULT_TRACK_IFACE_CLIENTS,
     CONF_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL_MEDIUM,
+    DEFAULT_SCAN_INTERVAL_MEDIUM,
+    CONF_SCAN_INTERVAL_SLOW,
+    DEFAULT_SCAN_INTERVAL_SLOW,
+    CONF_SUBSCRIBE_CHANGES,
+    DEFAULT_SUBSCRIBE_CHANGES,
+    CONF_STALE_ROW_TIMEOUT,
+    DEFAULT_STALE_ROW_TIMEOUT,
     CONF_TRACK_HOSTS,
     DEFAULT_TRACK_HOSTS,
     CONF_SENSOR_PORT_TRACKER,
@@ -55,6 +63,10 @@ from .const import (
     DEFAULT_SENSOR_ENVIRONMENT,
     CONF_TRACK_HOSTS_TIMEOUT,
     DEFAULT_TRACK_HOST_TIMEOUT,
+    CONF_TRACK_HOSTS_CONCURRENCY,
+    DEFAULT_TRACK_HOSTS_CONCURRENCY,
+    CONF_TRACK_HOSTS_PASSIVE,
+    DEFAULT_TRACK_HOSTS_PASSIVE,
     DEFAULT_HOST,
     DEFAULT_USERNAME,
     DEFAULT_PORT,
@@ -119,9 +131,11 @@ class MikrotikControllerConfigFlow(ConfigFlow, domain=DOMAIN):
                 use_ssl=user_input[CONF_SSL],
                 ssl_verify=user_input[CONF_VERIFY_SSL],
             )
-            if not api.connect():
+            if not await api.connect():
                 errors[CONF_HOST] = api.error
 
+            api.close()
+
             # Save instance
             if not errors:
                 return self.async_create_entry(
@@ -199,6 +213,30 @@ class MikrotikControllerOptionsFlowHandler(OptionsFlow):
                             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
                         ),
                     ): int,
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_MEDIUM,
+                        default=self._config_entry.options.get(
+                            CONF_SCAN_INTERVAL_MEDIUM, DEFAULT_SCAN_INTERVAL_MEDIUM
+                        ),
+                    ): int,
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_SLOW,
+                        default=self._config_entry.options.get(
+                            CONF_SCAN_INTERVAL_SLOW, DEFAULT_SCAN_INTERVAL_SLOW
+                        ),
+                    ): int,
+                    vol.Optional(
+                        CONF_SUBSCRIBE_CHANGES,
+                        default=self._config_entry.options.get(
+                            CONF_SUBSCRIBE_CHANGES, DEFAULT_SUBSCRIBE_CHANGES
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_STALE_ROW_TIMEOUT,
+                        default=self._config_entry.options.get(
+                            CONF_STALE_ROW_TIMEOUT, DEFAULT_STALE_ROW_TIMEOUT
+                        ),
+                    ): int,
                     vol.Optional(
                         CONF_TRACK_IFACE_CLIENTS,
                         default=self._config_entry.options.get(
@@ -211,6 +249,19 @@ class MikrotikControllerOptionsFlowHandler(OptionsFlow):
                             CONF_TRACK_HOSTS_TIMEOUT, DEFAULT_TRACK_HOST_TIMEOUT
                         ),
                     ): int,
+                    vol.Optional(
+                        CONF_TRACK_HOSTS_CONCURRENCY,
+                        default=self._config_entry.options.get(
+                            CONF_TRACK_HOSTS_CONCURRENCY,
+                            DEFAULT_TRACK_HOSTS_CONCURRENCY,
+                        ),
+                    ): int,
+                    vol.Optional(
+                        CONF_TRACK_HOSTS_PASSIVE,
+                        default=self._config_entry.options.get(
+                            CONF_TRACK_HOSTS_PASSIVE, DEFAULT_TRACK_HOSTS_PASSIVE
+                        ),
+                    ): bool,
                     vol.Optional(
                         CONF_ZONE,
                         default=self._config_entry.options.get(CONF_ZONE, STATE_HOME),
@@ -27,12 +27,24 @@ DEFAULT_VERIFY_SSL = False
 
 CONF_SCAN_INTERVAL = "scan_interval"
 DEFAULT_SCAN_INTERVAL = 30
+CONF_SCAN_INTERVAL_MEDIUM = "scan_interval_medium"
+DEFAULT_SCAN_INTERVAL_MEDIUM = 300
+CONF_SCAN_INTERVAL_SLOW = "scan_interval_slow"
+DEFAULT_SCAN_INTERVAL_SLOW = 3600
+CONF_SUBSCRIBE_CHANGES = "subscribe_changes"
+DEFAULT_SUBSCRIBE_CHANGES = False
+CONF_STALE_ROW_TIMEOUT = "stale_row_timeout"
+DEFAULT_STALE_ROW_TIMEOUT = 86400
 CONF_TRACK_IFACE_CLIENTS = "track_iface_clients"
 DEFAULT_TRACK_IFACE_CLIENTS = True
 CONF_TRACK_HOSTS = "track_network_hosts"
 DEFAULT_TRACK_HOSTS = False
 CONF_TRACK_HOSTS_TIMEOUT = "track_network_hosts_timeout"
 DEFAULT_TRACK_HOST_TIMEOUT = 180
+CONF_TRACK_HOSTS_CONCURRENCY = "track_network_hosts_concurrency"
+DEFAULT_TRACK_HOSTS_CONCURRENCY = 16
+CONF_TRACK_HOSTS_PASSIVE = "track_network_hosts_passive"
+DEFAULT_TRACK_HOSTS_PASSIVE = False
 
 CONF_SENSOR_PORT_TRACKER = "sensor_port_tracker"
 DEFAULT_SENSOR_PORT_TRACKER = False
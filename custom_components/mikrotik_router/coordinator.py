@@ -2,20 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import ipaddress
 import logging
 import re
 import pytz
 
 from datetime import datetime, timedelta
+from time import monotonic
 from dataclasses import dataclass
-from ipaddress import ip_address, IPv4Network
+from ipaddress import IPv4Network
 from mac_vendor_lookup import AsyncMacLookup
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import entity_registry
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import slugify
 from homeassistant.util.dt import utcnow
 
 
@@ -37,8 +40,22 @@ from .const import (
     DEFAULT_TRACK_IFACE_CLIENTS,
     CONF_TRACK_HOSTS,
     DEFAULT_TRACK_HOSTS,
+    CONF_TRACK_HOSTS_CONCURRENCY,
+    DEFAULT_TRACK_HOSTS_CONCURRENCY,
+    CONF_TRACK_HOSTS_PASSIVE,
+    DEFAULT_TRACK_HOSTS_PASSIVE,
+    CONF_TRACK_HOSTS_TIMEOUT,
+    DEFAULT_TRACK_HOST_TIMEOUT,
     CONF_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL_MEDIUM,
+    DEFAULT_SCAN_INTERVAL_MEDIUM,
+    CONF_SCAN_INTERVAL_SLOW,
+    DEFAULT_SCAN_INTERVAL_SLOW,
+    CONF_SUBSCRIBE_CHANGES,
+    DEFAULT_SUBSCRIBE_CHANGES,
+    CONF_STALE_ROW_TIMEOUT,
+    DEFAULT_STALE_ROW_TIMEOUT,
     CONF_SENSOR_PORT_TRAFFIC,
     DEFAULT_SENSOR_PORT_TRAFFIC,
     CONF_SENSOR_CLIENT_TRAFFIC,
@@ -64,13 +81,756 @@ from .const import (
     CONF_SENSOR_NETWATCH_TRACKER,
     DEFAULT_SENSOR_NETWATCH_TRACKER,
 )
-from .apiparser import parse_api
+from .accounting import AccountingAggregator
+from .apiparser import parse_api, compile_spec, get_proplist, get_query, get_uid
+from .exceptions import ApiTrapError
+from .helper import parse_duration
 from .mikrotikapi import MikrotikAPI
+from .records import ClientTrafficRecord, HostRecord
+from .stats import StatsCollector
+from .scheduler import (
+    TIER_FAST,
+    TIER_MEDIUM,
+    TIER_SLOW,
+    UpdateStage,
+    async_run_stages,
+    select_stages,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_TIME_ZONE = None
 
+ARP_REACHABLE_STATUS = ("reachable", "delay", "probe")
+
+# Writes within cooldown are refreshed together
+WRITE_REFRESH_COOLDOWN = 0.5
+
+
+INTERFACE_SPEC = compile_spec(
+    key="default-name",
+    key_secondary="name",
+    vals=[
+        {"name": "default-name"},
+        {"name": ".id"},
+        {"name": "name", "default_val": "default-name"},
+        {"name": "type", "default": "unknown"},
+        {"name": "running", "type": "bool"},
+        {
+            "name": "enabled",
+            "source": "disabled",
+            "type": "bool",
+            "reverse": True,
+        },
+        {"name": "port-mac-address", "source": "mac-address"},
+        {"name": "comment"},
+        {"name": "last-link-down-time"},
+        {"name": "last-link-up-time"},
+        {"name": "link-downs"},
+        {"name": "tx-queue-drop"},
+        {"name": "actual-mtu"},
+        {"name": "about", "source": ".about", "default": ""},
+        {"name": "rx-current", "source": "rx-byte", "default": 0.0},
+        {"name": "tx-current", "source": "tx-byte", "default": 0.0},
+    ],
+    ensure_vals=[
+        {"name": "client-ip-address"},
+        {"name": "client-mac-address"},
+        {"name": "rx-previous", "default": 0.0},
+        {"name": "tx-previous", "default": 0.0},
+        {"name": "rx", "default": 0.0},
+        {"name": "tx", "default": 0.0},
+        {"name": "rx-total", "default": 0.0},
+        {"name": "tx-total", "default": 0.0},
+    ],
+    skip=[
+        {"name": "type", "value": "bridge"},
+        {"name": "type", "value": "ppp-in"},
+        {"name": "type", "value": "pptp-in"},
+        {"name": "type", "value": "sstp-in"},
+        {"name": "type", "value": "l2tp-in"},
+        {"name": "type", "value": "pppoe-in"},
+        {"name": "type", "value": "ovpn-in"},
+    ],
+)
+
+
+ETHERNET_MONITOR_SPEC = compile_spec(
+    key_search="name",
+    vals=[
+        {"name": "status", "default": "unknown"},
+        {"name": "rate", "default": "unknown"},
+        {"name": "full-duplex", "default": "unknown"},
+        {"name": "auto-negotiation", "default": "unknown"},
+    ],
+)
+
+
+ETHERNET_SFP_MONITOR_SPEC = compile_spec(
+    key_search="name",
+    vals=[
+        {"name": "status", "default": "unknown"},
+        {"name": "auto-negotiation", "default": "unknown"},
+        {"name": "advertising", "default": "unknown"},
+        {"name": "link-partner-advertising", "default": "unknown"},
+        {"name": "sfp-temperature", "default": 0},
+        {"name": "sfp-supply-voltage", "default": "unknown"},
+        {"name": "sfp-module-present", "default": "unknown"},
+        {"name": "sfp-tx-bias-current", "default": "unknown"},
+        {"name": "sfp-tx-power", "default": "unknown"},
+        {"name": "sfp-rx-power", "default": "unknown"},
+        {"name": "sfp-rx-loss", "default": "unknown"},
+        {"name": "sfp-tx-fault", "default": "unknown"},
+    ],
+)
+
+
+ETHERNET_SFP_INFO_SPEC = compile_spec(
+    key_search="name",
+    vals=[
+        {"name": "sfp-type", "default": "unknown"},
+        {"name": "sfp-connector-type", "default": "unknown"},
+        {"name": "sfp-vendor-name", "default": "unknown"},
+        {"name": "sfp-vendor-part-number", "default": "unknown"},
+        {"name": "sfp-vendor-revision", "default": "unknown"},
+        {"name": "sfp-vendor-serial", "default": "unknown"},
+        {"name": "sfp-manufacturing-date", "default": "unknown"},
+        {"name": "eeprom-checksum", "default": "unknown"},
+    ],
+)
+
+
+ARP_SPEC = compile_spec(
+    key="mac-address",
+    vals=[
+        {"name": "mac-address"},
+        {"name": ".id"},
+        {"name": "address"},
+        {"name": "interface"},
+        {"name": "status"},
+    ],
+    ensure_vals=[{"name": "bridge", "default": ""}],
+)
+
+
+DHCP_SPEC = compile_spec(
+    key="mac-address",
+    vals=[
+        {"name": "mac-address"},
+        {"name": ".id"},
+        {"name": "active-mac-address", "default": "unknown"},
+        {"name": "address", "default": "unknown"},
+        {"name": "active-address", "default": "unknown"},
+        {"name": "host-name", "default": "unknown"},
+        {"name": "status", "default": "unknown"},
+        {"name": "last-seen", "default": "unknown"},
+        {"name": "server", "default": "unknown"},
+        {"name": "comment", "default": ""},
+        {
+            "name": "enabled",
+            "source": "disabled",
+            "type": "bool",
+            "reverse": True,
+        },
+    ],
+    ensure_vals=[{"name": "interface", "default": "unknown"}],
+)
+
+
+NETWATCH_SPEC = compile_spec(
+    key="host",
+    vals=[
+        {"name": "host"},
+        {"name": ".id"},
+        {"name": "type"},
+        {"name": "interval"},
+        {"name": "port"},
+        {"name": "http-codes"},
+        {"name": "status", "type": "bool", "default": "unknown"},
+        {"name": "comment"},
+        {
+            "name": "enabled",
+            "source": "disabled",
+            "type": "bool",
+            "reverse": True,
+        },
+    ],
+)
+
+
+WIRELESS_HOSTS_SPEC = compile_spec(
+    key="mac-address",
+    vals=[
+        {"name": "mac-address"},
+        {"name": ".id"},
+        {"name": "interface", "default": "unknown"},
+        {"name": "ap", "type": "bool"},
+        {"name": "uptime"},
+        {"name": "signal-strength"},
+        {"name": "tx-ccq"},
+        {"name": "tx-rate"},
+        {"name": "rx-rate"},
+    ],
+)
+
+
+NAT_SPEC = compile_spec(
+    key=".id",
+    vals=[
+        {"name": ".id"},
+        {"name": "chain", "default": "unknown"},
+        {"name": "action", "default": "unknown"},
+        {"name": "protocol", "default": "any"},
+        {"name": "dst-port", "default": "any"},
+        {"name": "in-interface", "default": "any"},
+        {"name": "out-interface", "default": "any"},
+        {"name": "to-addresses"},
+        {"name": "to-ports", "default": "any"},
+        {"name": "comment"},
+        {
+            "name": "enabled",
+            "source": "disabled",
+            "type": "bool",
+            "reverse": True,
+        },
+    ],
+    val_proc=[
+        [
+            {"name": "uniq-id"},
+            {"action": "combine"},
+            {"key": "chain"},
+            {"text": ","},
+            {"key": "action"},
+            {"text": ","},
+            {"key": "protocol"},
+            {"text": ","},
+            {"key": "in-interface"},
+            {"text": ":"},
+            {"key": "dst-port"},
+            {"text": "-"},
+            {"key": "out-interface"},
+            {"text": ":"},
+            {"key": "to-addresses"},
+            {"text": ":"},
+            {"key": "to-ports"},
+        ],
+        [
+            {"name": "name"},
+            {"action": "combine"},
+            {"key": "protocol"},
+            {"text": ":"},
+            {"key": "dst-port"},
+        ],
+    ],
+    only=[{"key": "action", "value": "dst-nat"}],
+)
+
+
+MANGLE_SPEC = compile_spec(
+    key=".id",
+    vals=[
+        {"name": ".id"},
+        {"name": "chain"},
+        {"name": "action"},
+        {"name": "comment"},
+        {"name": "address-list"},
+        {"name": "passthrough", "type": "bool", "default": False},
+        {"name": "protocol", "default": "any"},
+        {"name": "src-address", "default": "any"},
+        {"name": "src-port", "default": "any"},
+        {"name": "dst-address", "default": "any"},
+        {"name": "dst-port", "default": "any"},
+        {"name": "src-address-list", "default": "any"},
+        {"name": "dst-address-list", "default": "any"},
+        {
+            "name": "enabled",
+            "source": "disabled",
+            "type": "bool",
+            "reverse": True,
+        },
+    ],
+    val_proc=[
+        [
+            {"name": "uniq-id"},
+            {"action": "combine"},
+            {"key": "chain"},
+            {"text": ","},
+            {"key": "action"},
+            {"text": ","},
+            {"key": "protocol"},
+            {"text": ","},
+            {"key": "src-address"},
+            {"text": ":"},
+            {"key": "src-port"},
+            {"text": "-"},
+            {"key": "dst-address"},
+            {"text": ":"},
+            {"key": "dst-port"},
+            {"text": ","},
+            {"key": "src-address-list"},
+            {"text": "-"},
+            {"key": "dst-address-list"},
+        ],
+        [
+            {"name": "name"},
+            {"action": "combine"},
+            {"key": "action"},
+            {"text": ","},
+            {"key": "protocol"},
+            {"text": ":"},
+            {"key": "dst-port"},
+        ],
+    ],
+    skip=[
+        {"name": "dynamic", "value": True},
+        {"name": "action", "value": "jump"},
+    ],
+)
+
+
+FILTER_SPEC = compile_spec(
+    key=".id",
+    vals=[
+        {"name": ".id"},
+        {"name": "chain"},
+        {"name": "action"},
+        {"name": "comment"},
+        {"name": "address-list"},
+        {"name": "protocol", "default": "any"},
+        {"name": "in-interface", "default": "any"},
+        {"name": "in-interface-list", "default": "any"},
+        {"name": "out-interface", "default": "any"},
+        {"name": "out-interface-list", "default": "any"},
+        {"name": "src-address", "default": "any"},
+        {"name": "src-address-list", "default": "any"},
+        {"name": "src-port", "default": "any"},
+        {"name": "dst-address", "default": "any"},
+        {"name": "dst-address-list", "default": "any"},
+        {"name": "dst-port", "default": "any"},
+        {"name": "layer7-protocol", "default": "any"},
+        {"name": "connection-state", "default": "any"},
+        {"name": "tcp-flags", "default": "any"},
+        {
+            "name": "enabled",
+            "source": "disabled",
+            "type": "bool",
+            "reverse": True,
+            "default": True,
+        },
+    ],
+    val_proc=[
+        [
+            {"name": "uniq-id"},
+            {"action": "combine"},
+            {"key": "chain"},
+            {"text": ","},
+            {"key": "action"},
+            {"text": ","},
+            {"key": "protocol"},
+            {"text": ","},
+            {"key": "layer7-protocol"},
+            {"text": ","},
+            {"key": "in-interface"},
+            {"text": ","},
+            {"key": "in-interface-list"},
+            {"text": ":"},
+            {"key": "src-address"},
+            {"text": ","},
+            {"key": "src-address-list"},
+            {"text": ":"},
+            {"key": "src-port"},
+            {"text": "-"},
+            {"key": "out-interface"},
+            {"text": ","},
+            {"key": "out-interface-list"},
+            {"text": ":"},
+            {"key": "dst-address"},
+            {"text": ","},
+            {"key": "dst-address-list"},
+            {"text": ":"},
+            {"key": "dst-port"},
+        ],
+        [
+            {"name": "name"},
+            {"action": "combine"},
+            {"key": "action"},
+            {"text": ","},
+            {"key": "protocol"},
+            {"text": ":"},
+            {"key": "dst-port"},
+        ],
+    ],
+    skip=[
+        {"name": "dynamic", "value": True},
+        {"name": "action", "value": "jump"},
+    ],
+)
+
+
+BONDING_SPEC = compile_spec(
+    key="name",
+    vals=[
+        {"name": "name"},
+        {"name": "mac-address"},
+        {"name": "slaves"},
+        {"name": "mode"},
+    ],
+)
+
+
+ETHERNET_SPEC = compile_spec(
+    key="default-name",
+    key_secondary="name",
+    vals=[
+        {"name": "default-name"},
+        {"name": "name", "default_val": "default-name"},
+        {"name": "poe-out", "default": "N/A"},
+        {"name": "sfp-shutdown-temperature", "default": 0},
+    ],
+    skip=[
+        {"name": "type", "value": "bridge"},
+        {"name": "type", "value": "ppp-in"},
+        {"name": "type", "value": "pptp-in"},
+        {"name": "type", "value": "sstp-in"},
+        {"name": "type", "value": "l2tp-in"},
+        {"name": "type", "value": "pppoe-in"},
+        {"name": "type", "value": "ovpn-in"},
+    ],
+)
+
+
+BRIDGE_HOST_SPEC = compile_spec(
+    key="mac-address",
+    vals=[
+        {"name": "mac-address"},
+        {"name": "interface", "default": "unknown"},
+        {"name": "bridge", "default": "unknown"},
+        {"name": "age"},
+        {
+            "name": "enabled",
+            "source": "disabled",
+            "type": "bool",
+            "reverse": True,
+        },
+    ],
+    only=[{"key": "local", "value": False}],
+)
+
+
+KID_CONTROL_SPEC = compile_spec(
+    key="name",
+    vals=[
+        {"name": ".id"},
+        {"name": "name"},
+        {"name": "rate-limit"},
+        {"name": "mon", "default": "None"},
+        {"name": "tue", "default": "None"},
+        {"name": "wed", "default": "None"},
+        {"name": "thu", "default": "None"},
+        {"name": "fri", "default": "None"},
+        {"name": "sat", "default": "None"},
+        {"name": "sun", "default": "None"},
+        {"name": "comment"},
+        {"name": "blocked", "type": "bool", "default": False},
+        {"name": "paused", "type": "bool", "reverse": True},
+        {
+            "name": "enabled",
+            "source": "disabled",
+            "type": "bool",
+            "reverse": True,
+        },
+    ],
+)
+
+
+PPP_SECRET_SPEC = compile_spec(
+    key="name",
+    vals=[
+        {"name": ".id"},
+        {"name": "name"},
+        {"name": "service"},
+        {"name": "profile"},
+        {"name": "comment"},
+        {
+            "name": "enabled",
+            "source": "disabled",
+            "type": "bool",
+            "reverse": True,
+        },
+    ],
+    ensure_vals=[
+        {"name": "caller-id", "default": ""},
+        {"name": "address", "default": ""},
+        {"name": "encoding", "default": ""},
+        {"name": "connected", "default": False},
+    ],
+)
+
+
+PPP_ACTIVE_SPEC = compile_spec(
+    key="name",
+    vals=[
+        {"name": "name"},
+        {"name": "service"},
+        {"name": "caller-id"},
+        {"name": "address"},
+        {"name": "encoding"},
+    ],
+)
+
+
+HEALTH_SPEC = compile_spec(
+    vals=[
+        {"name": "temperature", "default": 0},
+        {"name": "voltage", "default": 0},
+        {"name": "cpu-temperature", "default": 0},
+        {"name": "power-consumption", "default": 0},
+        {"name": "board-temperature1", "default": 0},
+        {"name": "phy-temperature", "default": 0},
+        {"name": "fan1-speed", "default": 0},
+        {"name": "fan2-speed", "default": 0},
+    ],
+)
+
+
+HEALTH7_SPEC = compile_spec(
+    key="name",
+    vals=[
+        {"name": "value", "default": "unknown"},
+    ],
+)
+
+
+RESOURCE_SPEC = compile_spec(
+    vals=[
+        {"name": "platform", "default": "unknown"},
+        {"name": "board-name", "default": "unknown"},
+        {"name": "version", "default": "unknown"},
+        {"name": "uptime_str", "source": "uptime", "default": "unknown"},
+        {"name": "cpu-load", "default": "unknown"},
+        {"name": "free-memory", "default": 0},
+        {"name": "total-memory", "default": 0},
+        {"name": "free-hdd-space", "default": 0},
+        {"name": "total-hdd-space", "default": 0},
+    ],
+    ensure_vals=[
+        {"name": "uptime", "default": 0},
+        {"name": "uptime_epoch", "default": 0},
+        {"name": "clients_wired", "default": 0},
+        {"name": "clients_wireless", "default": 0},
+        {"name": "captive_authorized", "default": 0},
+    ],
+)
+
+
+UPS_SPEC = compile_spec(
+    vals=[
+        {"name": "name", "default": "unknown"},
+        {"name": "offline-time", "default": "unknown"},
+        {"name": "min-runtime", "default": "unknown"},
+        {"name": "alarm-setting", "default": "unknown"},
+        {"name": "model", "default": "unknown"},
+        {"name": "serial", "default": "unknown"},
+        {"name": "manufacture-date", "default": "unknown"},
+        {"name": "nominal-battery-voltage", "default": "unknown"},
+        {
+            "name": "enabled",
+            "source": "disabled",
+            "type": "bool",
+            "reverse": True,
+        },
+    ],
+    ensure_vals=[
+        {"name": "on-line", "type": "bool"},
+        {"name": "runtime-left", "default": "unknown"},
+        {"name": "battery-charge", "default": 0},
+        {"name": "battery-voltage", "default": 0.0},
+        {"name": "line-voltage", "default": 0},
+        {"name": "load", "default": 0},
+        {"name": "hid-self-test", "default": "unknown"},
+    ],
+)
+
+
+UPS_MONITOR_SPEC = compile_spec(
+    vals=[
+        {"name": "on-line", "type": "bool"},
+        {"name": "runtime-left", "default": 0},
+        {"name": "battery-charge", "default": 0},
+        {"name": "battery-voltage", "default": 0.0},
+        {"name": "line-voltage", "default": 0},
+        {"name": "load", "default": 0},
+        {"name": "hid-self-test", "default": "unknown"},
+    ],
+)
+
+
+GPS_SPEC = compile_spec(
+    vals=[
+        {"name": "valid", "type": "bool"},
+        {"name": "latitude", "default": "unknown"},
+        {"name": "longitude", "default": "unknown"},
+        {"name": "altitude", "default": "unknown"},
+        {"name": "speed", "default": "unknown"},
+        {"name": "destination-bearing", "default": "unknown"},
+        {"name": "true-bearing", "default": "unknown"},
+        {"name": "magnetic-bearing", "default": "unknown"},
+        {"name": "satellites", "default": 0},
+        {"name": "fix-quality", "default": 0},
+        {"name": "horizontal-dilution", "default": "unknown"},
+    ],
+)
+
+
+SCRIPT_SPEC = compile_spec(
+    key="name",
+    vals=[
+        {"name": ".id"},
+        {"name": "name"},
+        {"name": "last-started", "default": "unknown"},
+        {"name": "run-count", "default": "unknown"},
+    ],
+)
+
+
+ENVIRONMENT_SPEC = compile_spec(
+    key="name",
+    vals=[
+        {"name": "name"},
+        {"name": "value"},
+    ],
+)
+
+
+HOTSPOT_HOST_SPEC = compile_spec(
+    key="mac-address",
+    vals=[
+        {"name": "mac-address"},
+        {"name": "authorized", "type": "bool"},
+        {"name": "bypassed", "type": "bool"},
+    ],
+)
+
+
+QUEUE_SPEC = compile_spec(
+    key="name",
+    vals=[
+        {"name": ".id"},
+        {"name": "name", "default": "unknown"},
+        {"name": "target", "default": "unknown"},
+        {"name": "rate", "default": "0/0"},
+        {"name": "max-limit", "default": "0/0"},
+        {"name": "limit-at", "default": "0/0"},
+        {"name": "burst-limit", "default": "0/0"},
+        {"name": "burst-threshold", "default": "0/0"},
+        {"name": "burst-time", "default": "0s/0s"},
+        {"name": "packet-marks", "default": "none"},
+        {"name": "parent", "default": "none"},
+        {"name": "comment"},
+        {
+            "name": "enabled",
+            "source": "disabled",
+            "type": "bool",
+            "reverse": True,
+        },
+    ],
+)
+
+
+DNS_SPEC = compile_spec(
+    key="name",
+    vals=[{"name": "name"}, {"name": "address"}, {"name": "comment"}],
+)
+
+
+DHCP_SERVER_SPEC = compile_spec(
+    key="name",
+    vals=[
+        {"name": "name"},
+        {"name": "interface", "default": "unknown"},
+    ],
+)
+
+
+DHCP_CLIENT_SPEC = compile_spec(
+    key="interface",
+    vals=[
+        {"name": "interface", "default": "unknown"},
+        {"name": "status", "default": "unknown"},
+        {"name": "address", "default": "unknown"},
+    ],
+)
+
+
+DHCP_NETWORK_SPEC = compile_spec(
+    key="address",
+    vals=[
+        {"name": "address"},
+        {"name": "gateway", "default": ""},
+        {"name": "netmask", "default": ""},
+        {"name": "dns-server", "default": ""},
+        {"name": "domain", "default": ""},
+    ],
+    ensure_vals=[{"name": "address"}, {"name": "IPv4Network", "default": ""}],
+)
+
+
+CAPSMAN_HOSTS_SPEC = compile_spec(
+    key="mac-address",
+    vals=[
+        {"name": "mac-address"},
+        {"name": "interface", "default": "unknown"},
+        {"name": "ssid", "default": "unknown"},
+    ],
+)
+
+
+WIRELESS_SPEC = compile_spec(
+    key="name",
+    vals=[
+        {"name": "master-interface", "default": ""},
+        {"name": "mac-address", "default": "unknown"},
+        {"name": "ssid", "default": "unknown"},
+        {"name": "mode", "default": "unknown"},
+        {"name": "radio-name", "default": "unknown"},
+        {"name": "interface-type", "default": "unknown"},
+        {"name": "country", "default": "unknown"},
+        {"name": "installation", "default": "unknown"},
+        {"name": "antenna-gain", "default": "unknown"},
+        {"name": "frequency", "default": "unknown"},
+        {"name": "band", "default": "unknown"},
+        {"name": "channel-width", "default": "unknown"},
+        {"name": "secondary-frequency", "default": "unknown"},
+        {"name": "wireless-protocol", "default": "unknown"},
+        {"name": "rate-set", "default": "unknown"},
+        {"name": "distance", "default": "unknown"},
+        {"name": "tx-power-mode", "default": "unknown"},
+        {"name": "vlan-id", "default": "unknown"},
+        {"name": "wds-mode", "default": "unknown"},
+        {"name": "wds-default-bridge", "default": "unknown"},
+        {"name": "bridge-mode", "default": "unknown"},
+        {"name": "hide-ssid", "type": "bool"},
+        {"name": "running", "type": "bool"},
+        {"name": "disabled", "type": "bool"},
+    ],
+)
+
+
+KID_CONTROL_DEVICES_SPEC = compile_spec(
+    key="mac-address",
+    vals=[
+        {"name": "mac-address"},
+        {"name": "bytes-down"},
+        {"name": "bytes-up"},
+        {
+            "name": "enabled",
+            "source": "disabled",
+            "type": "bool",
+            "reverse": True,
+        },
+    ],
+)
+
 
 def is_valid_ip(address):
     try:
@@ -141,6 +901,23 @@ class MikrotikTrackerCoordinator(DataUpdateCoordinator[None]):
         """Config entry option zones."""
         return self.config_entry.options.get(CONF_ZONE, STATE_HOME)
 
+    # ---------------------------
+    #   async_add_row_listener
+    # ---------------------------
+    @callback
+    def async_add_row_listener(
+        self, data_path, uid, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for changes of single data row"""
+        return self.coordinator.async_add_row_listener(data_path, uid, update_callback)
+
+    # ---------------------------
+    #   row_changed
+    # ---------------------------
+    def row_changed(self, data_path, uid) -> bool:
+        """Tracker state depends on time, rows are always updated"""
+        return True
+
     # ---------------------------
     #   _async_update_data
     # ---------------------------
@@ -149,59 +926,79 @@ class MikrotikTrackerCoordinator(DataUpdateCoordinator[None]):
         if not self.coordinator.option_track_network_hosts:
             return
 
-        if "test" not in self.coordinator.ds["access"]:
+        passive = self.coordinator.option_track_network_hosts_passive
+        if not passive and "test" not in self.coordinator.ds["access"]:
             return
 
-        for uid in list(self.coordinator.ds["host"]):
-            if not self.coordinator.host_tracking_initialized:
-                # Add missing default values
-                for key, default in zip(
-                    [
-                        "address",
-                        "mac-address",
-                        "interface",
-                        "host-name",
-                        "last-seen",
-                        "available",
-                    ],
-                    ["unknown", "unknown", "unknown", "unknown", False, False],
-                ):
-                    if key not in self.coordinator.ds["host"][uid]:
-                        self.coordinator.ds["host"][uid][key] = default
+        # Hosts are shared with running coordinator update stages
+        async with self.coordinator.data_lock:
+            ping_hosts = {}
+            passive_hosts = set()
+            for uid in list(self.coordinator.ds["host"]):
+                if not self.coordinator.host_tracking_initialized:
+                    # Add missing default values
+                    for key, default in zip(
+                        [
+                            "address",
+                            "mac-address",
+                            "interface",
+                            "host-name",
+                            "last-seen",
+                            "available",
+                        ],
+                        ["unknown", "unknown", "unknown", "unknown", False, False],
+                    ):
+                        if key not in self.coordinator.ds["host"][uid]:
+                            self.coordinator.ds["host"][uid][key] = default
 
-            # Check host availability
-            if (
-                self.coordinator.ds["host"][uid]["source"]
-                not in ["capsman", "wireless"]
-                and self.coordinator.ds["host"][uid]["address"] not in ["unknown", ""]
-                and self.coordinator.ds["host"][uid]["interface"] not in ["unknown", ""]
-            ):
-                tmp_interface = self.coordinator.ds["host"][uid]["interface"]
-                if (
-                    uid in self.coordinator.ds["arp"]
-                    and self.coordinator.ds["arp"][uid]["bridge"] != ""
+                # Check host availability
+                if passive and self.coordinator.ds["host"][uid]["source"] not in [
+                    "capsman",
+                    "wireless",
+                ]:
+                    self.coordinator.update_host_passive(uid)
+                    passive_hosts.add(uid)
+                elif (
+                    self.coordinator.ds["host"][uid]["source"]
+                    not in ["capsman", "wireless"]
+                    and self.coordinator.ds["host"][uid]["address"]
+                    not in ["unknown", ""]
+                    and self.coordinator.ds["host"][uid]["interface"]
+                    not in ["unknown", ""]
                 ):
-                    tmp_interface = self.coordinator.ds["arp"][uid]["bridge"]
-
-                _LOGGER.debug(
-                    "Ping host: %s", self.coordinator.ds["host"][uid]["address"]
-                )
+                    tmp_interface = self.coordinator.ds["host"][uid]["interface"]
+                    if (
+                        uid in self.coordinator.ds["arp"]
+                        and self.coordinator.ds["arp"][uid]["bridge"] != ""
+                    ):
+                        tmp_interface = self.coordinator.ds["arp"][uid]["bridge"]
 
-                self.coordinator.ds["host"][uid]["available"] = (
-                    await self.hass.async_add_executor_job(
-                        self.api.arp_ping,
+                    ping_hosts[uid] = (
                         self.coordinator.ds["host"][uid]["address"],
                         tmp_interface,
                     )
-                )
+
+        available = {}
+        if ping_hosts:
+            _LOGGER.debug("Ping hosts: %s", len(ping_hosts))
+            available = await self.api.arp_ping_hosts(
+                ping_hosts, self.coordinator.option_track_network_hosts_concurrency
+            )
+
+        async with self.coordinator.data_lock:
+            for uid, value in available.items():
+                if uid in self.coordinator.ds["host"]:
+                    self.coordinator.ds["host"][uid]["available"] = value
 
             # Update last seen
-            if self.coordinator.ds["host"][uid]["available"]:
-                self.coordinator.ds["host"][uid]["last-seen"] = utcnow()
+            for uid, vals in self.coordinator.ds["host"].items():
+                if vals["available"] and uid not in passive_hosts:
+                    vals["last-seen"] = utcnow()
+
+            self.coordinator.host_tracking_initialized = True
 
-        self.coordinator.host_tracking_initialized = True
+            await self.coordinator.async_process_host()
 
-        await self.coordinator.async_process_host()
         return {
             "host": self.coordinator.ds["host"],
             "routerboard": self.coordinator.ds["routerboard"],
@@ -264,6 +1061,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             "ups": {},
             "gps": {},
             "netwatch": {},
+            "stats": {},
         }
 
         self.notified_flags = []
@@ -284,6 +1082,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         self.nat_removed = {}
         self.mangle_removed = {}
         self.filter_removed = {}
+        self.accounting_ip_mac = {}
         self.host_hass_recovered = False
         self.host_tracking_initialized = False
 
@@ -301,8 +1100,20 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         self.accessrights_reported = False
 
         self.last_hwinfo_update = datetime(1970, 1, 1)
+        self.stage_last_run = {}
         self.rebootcheck = 0
 
+        self.data_lock = asyncio.Lock()
+        self.listen_tasks = {}
+        self.listen_unsupported = set()
+        self.listen_changes = {}
+        self._row_listeners = {}
+        self.rows_missing = {}
+        self.row_snapshots = {}
+        self.changed_rows = None
+        self.stats = StatsCollector()
+        self.refresh_paths = set()
+
     # ---------------------------
     #   option_track_iface_clients
     # ---------------------------
@@ -321,6 +1132,40 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Config entry option to not track ARP."""
         return self.config_entry.options.get(CONF_TRACK_HOSTS, DEFAULT_TRACK_HOSTS)
 
+    # ---------------------------
+    #   option_track_network_hosts_concurrency
+    # ---------------------------
+    @property
+    def option_track_network_hosts_concurrency(self):
+        """Config entry option for number of concurrent host pings."""
+        return max(
+            1,
+            self.config_entry.options.get(
+                CONF_TRACK_HOSTS_CONCURRENCY, DEFAULT_TRACK_HOSTS_CONCURRENCY
+            ),
+        )
+
+    # ---------------------------
+    #   option_track_network_hosts_passive
+    # ---------------------------
+    @property
+    def option_track_network_hosts_passive(self):
+        """Config entry option to track hosts without ping."""
+        return self.config_entry.options.get(
+            CONF_TRACK_HOSTS_PASSIVE, DEFAULT_TRACK_HOSTS_PASSIVE
+        )
+
+    # ---------------------------
+    #   option_track_network_hosts_timeout
+    # ---------------------------
+    @property
+    def option_track_network_hosts_timeout(self):
+        """Config entry option for host tracking timeout."""
+        track_network_hosts_timeout = self.config_entry.options.get(
+            CONF_TRACK_HOSTS_TIMEOUT, DEFAULT_TRACK_HOST_TIMEOUT
+        )
+        return timedelta(seconds=track_network_hosts_timeout)
+
     # ---------------------------
     #   option_sensor_port_traffic
     # ---------------------------
@@ -444,6 +1289,49 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         )
         return timedelta(seconds=scan_interval)
 
+    # ---------------------------
+    #   option_scan_interval_medium
+    # ---------------------------
+    @property
+    def option_scan_interval_medium(self):
+        """Config entry option scan interval for medium tier."""
+        scan_interval = self.config_entry.options.get(
+            CONF_SCAN_INTERVAL_MEDIUM, DEFAULT_SCAN_INTERVAL_MEDIUM
+        )
+        return timedelta(seconds=scan_interval)
+
+    # ---------------------------
+    #   option_scan_interval_slow
+    # ---------------------------
+    @property
+    def option_scan_interval_slow(self):
+        """Config entry option scan interval for slow tier."""
+        scan_interval = self.config_entry.options.get(
+            CONF_SCAN_INTERVAL_SLOW, DEFAULT_SCAN_INTERVAL_SLOW
+        )
+        return timedelta(seconds=scan_interval)
+
+    # ---------------------------
+    #   option_subscribe_changes
+    # ---------------------------
+    @property
+    def option_subscribe_changes(self):
+        """Config entry option to subscribe to table changes."""
+        return self.config_entry.options.get(
+            CONF_SUBSCRIBE_CHANGES, DEFAULT_SUBSCRIBE_CHANGES
+        )
+
+    # ---------------------------
+    #   option_stale_row_timeout
+    # ---------------------------
+    @property
+    def option_stale_row_timeout(self):
+        """Config entry option for removing rows no longer reported, 0 disables."""
+        stale_row_timeout = self.config_entry.options.get(
+            CONF_STALE_ROW_TIMEOUT, DEFAULT_STALE_ROW_TIMEOUT
+        )
+        return timedelta(seconds=stale_row_timeout)
+
     # ---------------------------
     #   connected
     # ---------------------------
@@ -452,27 +1340,191 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         return self.api.connected()
 
     # ---------------------------
-    #   set_value
+    #   async_set_value
     # ---------------------------
-    def set_value(self, path, param, value, mod_param, mod_value):
-        """Change value using Mikrotik API"""
-        return self.api.set_value(path, param, value, mod_param, mod_value)
+    async def async_set_value(
+        self, path, param, value, mod_param, mod_value, data_path=None
+    ):
+        """Change value using Mikrotik API
+
+        With data_path only that table is refreshed after write, otherwise
+        all tiers are refreshed on next update.
+        """
+        result = await self.api.set_value(path, param, value, mod_param, mod_value)
+        # Stage may have run during write, invalidate only once it is done
+        self.invalidate_stages(data_path)
+        if data_path:
+            self.async_request_path_refresh(data_path)
+
+        return result
 
     # ---------------------------
-    #   execute
+    #   async_execute
     # ---------------------------
-    def execute(self, path, command, param, value, attributes=None):
+    async def async_execute(
+        self, path, command, param, value, attributes=None, data_path=None
+    ):
         """Change value using Mikrotik API"""
-        return self.api.execute(path, command, param, value, attributes)
+        result = await self.api.execute(path, command, param, value, attributes)
+        self.invalidate_stages(data_path)
+        if data_path:
+            self.async_request_path_refresh(data_path)
+
+        return result
+
+    # ---------------------------
+    #   invalidate_stages
+    # ---------------------------
+    def invalidate_stages(self, data_path=None) -> None:
+        """Refresh all tiers or stage of data_path on next update"""
+        if data_path:
+            self.stage_last_run.pop(data_path, None)
+        else:
+            self.stage_last_run.clear()
+
+    # ---------------------------
+    #   async_request_path_refresh
+    # ---------------------------
+    @callback
+    def async_request_path_refresh(self, data_path) -> None:
+        """Refresh table after write, requests within cooldown are combined"""
+        if not self.refresh_paths:
+            self.config_entry.async_create_task(self.hass, self.async_refresh_paths())
+
+        self.refresh_paths.add(data_path)
 
     # ---------------------------
-    #   get_capabilities
+    #   async_refresh_paths
     # ---------------------------
-    def get_capabilities(self):
+    async def async_refresh_paths(self) -> None:
+        """Refresh requested tables and stages depending on them"""
+        await asyncio.sleep(WRITE_REFRESH_COOLDOWN)
+        async with self.data_lock:
+            # Writes from now on request new refresh
+            data_paths, self.refresh_paths = self.refresh_paths, set()
+            for data_path in data_paths:
+                self.stage_last_run.pop(data_path, None)
+
+            await async_run_stages(
+                select_stages(self._update_stages(), data_paths),
+                self.api.connected,
+                intervals=self._stage_intervals(),
+                last_run=self.stage_last_run,
+                stats=self.stats,
+            )
+            if not self.api.connected():
+                return
+
+            changed_rows = self.detect_changed_rows()
+
+        self.changed_rows = changed_rows
+        self.async_update_listeners()
+
+    # ---------------------------
+    #   async_capture
+    # ---------------------------
+    async def async_capture(self) -> str:
+        """Record API session of full refresh to config directory"""
+        path = self.hass.config.path(f"{DOMAIN}_{slugify(self.host)}_capture.jsonl.gz")
+        self.api.start_capture()
+        try:
+            self.invalidate_stages()
+            await self.async_refresh()
+            # Fetched only for unknown lease servers, replay starts empty
+            await self.async_get_dhcp_server()
+        finally:
+            commands = await self.hass.async_add_executor_job(
+                self.api.stop_capture,
+                path,
+                {"options": dict(self.config_entry.options)},
+            )
+
+        _LOGGER.warning(
+            "Mikrotik %s API session with %s commands captured to %s",
+            self.host,
+            commands,
+            path,
+        )
+        return path
+
+    # ---------------------------
+    #   async_parse_query
+    # ---------------------------
+    async def async_parse_query(
+        self, path, command=None, args=None, data_path=None, **kwargs
+    ):
+        """Query Mikrotik API for rows and properties used by parse_api and parse response
+
+        With data_path, rows are parsed into that table and rows no longer
+        returned by Mikrotik are removed once stale.
+        """
+        try:
+            source = await self.api.query(
+                path,
+                command,
+                args,
+                proplist=get_proplist(**kwargs),
+                query=get_query(**kwargs),
+                raise_trap=bool(data_path),
+            )
+        except ApiTrapError as e:
+            # Failed print says nothing about removed rows, keep table as is
+            _LOGGER.error(
+                "Mikrotik %s error while building list for path %s : %s",
+                self.host,
+                path,
+                e,
+            )
+            return self.ds[data_path]
+
+        if not data_path:
+            return parse_api(source=source, **kwargs)
+
+        seen = set()
+        data = parse_api(data=self.ds[data_path], source=source, seen=seen, **kwargs)
+        # Empty table is returned as None after !done, connection loss leaves
+        # the api disconnected
+        if source is not None or self.api.connected():
+            self.expire_rows(data_path, seen)
+
+        return data
+
+    # ---------------------------
+    #   expire_rows
+    # ---------------------------
+    def expire_rows(self, data_path, seen) -> list:
+        """Remove rows not seen within stale row timeout, return removed uids"""
+        timeout = self.option_stale_row_timeout
+        missing = self.rows_missing.setdefault(data_path, {})
+        data = self.ds[data_path]
+        now = utcnow()
+        removed = []
+        for uid in list(data):
+            if uid in seen:
+                missing.pop(uid, None)
+                continue
+
+            since = missing.setdefault(uid, now)
+            if timeout and now - since >= timeout:
+                del data[uid]
+                removed.append(uid)
+
+        for uid in [uid for uid in missing if uid not in data]:
+            del missing[uid]
+
+        if removed:
+            _LOGGER.debug("Removed stale %s rows: %s", data_path, removed)
+
+        return removed
+
+    # ---------------------------
+    #   async_get_capabilities
+    # ---------------------------
+    async def async_get_capabilities(self):
         """Update Mikrotik data"""
-        packages = parse_api(
+        packages = await self.async_parse_query(
+            "/system/package",
             data={},
-            source=self.api.query("/system/package"),
             key="name",
             vals=[
                 {"name": "name"},
@@ -560,6 +1612,196 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
 
                 self.ds["host_hass"][tmp[2].upper()] = entity.original_name
 
+    # ---------------------------
+    #   _hwinfo_stages
+    # ---------------------------
+    def _hwinfo_stages(self) -> list:
+        """Stages for rarely changing hardware info"""
+        return [
+            UpdateStage("access", self.async_get_access),
+            UpdateStage("fw-update", self.async_get_firmware_update, ("access",)),
+            UpdateStage("resource", self.async_get_system_resource),
+            UpdateStage("capabilities", self.async_get_capabilities, ("fw-update",)),
+            UpdateStage(
+                "routerboard",
+                self.async_get_system_routerboard,
+                ("access", "resource"),
+            ),
+        ]
+
+    # ---------------------------
+    #   _update_stages
+    # ---------------------------
+    def _update_stages(self) -> list:
+        """Stages for each update cycle with their data dependencies
+
+        Fast tier runs every cycle, medium and slow tiers on their own interval.
+        Tables kept in sync by subscriptions are polled on medium tier.
+        """
+        return [
+            UpdateStage("resource", self.async_get_system_resource),
+            UpdateStage("health", self.async_get_system_health),
+            UpdateStage("dhcp-client", self.async_get_dhcp_client),
+            UpdateStage("interface", self.async_get_interface),
+            UpdateStage(
+                "interface_ethernet",
+                self.async_get_interface_ethernet,
+                ("interface",),
+            ),
+            UpdateStage(
+                "interface_sfp",
+                self.async_get_interface_sfp,
+                ("interface_ethernet",),
+                tier=TIER_SLOW,
+            ),
+            UpdateStage(
+                "host_hass",
+                self.async_get_host_hass,
+                condition=lambda: not self.ds["host_hass"],
+            ),
+            UpdateStage(
+                "capsman_hosts",
+                self.async_get_capsman_hosts,
+                condition=lambda: self.support_capsman,
+            ),
+            UpdateStage(
+                "wireless",
+                self.async_get_wireless,
+                ("interface",),
+                condition=lambda: self.support_wireless,
+                tier=TIER_MEDIUM,
+            ),
+            UpdateStage(
+                "wireless_hosts",
+                self.async_get_wireless_hosts,
+                condition=lambda: self.support_wireless,
+                tier=self._listen_tier("wireless_hosts"),
+            ),
+            UpdateStage("bridge", self.async_get_bridge),
+            UpdateStage(
+                "arp",
+                self.async_get_arp,
+                ("bridge", "dhcp-client"),
+                tier=self._listen_tier("arp"),
+            ),
+            UpdateStage(
+                "dhcp", self.async_get_dhcp, ("arp",), tier=self._listen_tier("dhcp")
+            ),
+            UpdateStage("dhcp-network", self.async_get_dhcp_network, tier=TIER_SLOW),
+            UpdateStage("dns", self.async_get_dns, tier=TIER_SLOW),
+            UpdateStage(
+                "script",
+                self.async_get_script,
+                condition=lambda: self.option_sensor_scripts,
+                tier=TIER_SLOW,
+            ),
+            UpdateStage(
+                "captive",
+                self.async_get_captive,
+                ("resource",),
+                condition=lambda: self.option_sensor_client_captive,
+            ),
+            UpdateStage(
+                "host",
+                self.async_process_host,
+                (
+                    "resource",
+                    "host_hass",
+                    "capsman_hosts",
+                    "wireless_hosts",
+                    "bridge",
+                    "arp",
+                    "dhcp",
+                    "dns",
+                    "captive",
+                ),
+            ),
+            UpdateStage(
+                "interface_client",
+                self.process_interface_client,
+                ("interface", "dhcp-client", "arp"),
+            ),
+            UpdateStage(
+                "nat",
+                self.async_get_nat,
+                condition=lambda: self.option_sensor_nat,
+                tier=TIER_MEDIUM,
+            ),
+            UpdateStage(
+                "kid-control",
+                self.async_get_kidcontrol,
+                condition=lambda: self.option_sensor_kidcontrol,
+            ),
+            UpdateStage(
+                "mangle",
+                self.async_get_mangle,
+                condition=lambda: self.option_sensor_mangle,
+                tier=TIER_MEDIUM,
+            ),
+            UpdateStage(
+                "filter",
+                self.async_get_filter,
+                condition=lambda: self.option_sensor_filter,
+                tier=TIER_MEDIUM,
+            ),
+            UpdateStage(
+                "netwatch",
+                self.async_get_netwatch,
+                condition=lambda: self.option_sensor_netwatch,
+                tier=self._listen_tier("netwatch"),
+            ),
+            UpdateStage(
+                "ppp_secret",
+                self.async_get_ppp_secret,
+                condition=lambda: self.support_ppp and self.option_sensor_ppp,
+                tier=TIER_SLOW,
+            ),
+            UpdateStage(
+                "ppp",
+                self.async_get_ppp,
+                ("ppp_secret",),
+                condition=lambda: self.support_ppp and self.option_sensor_ppp,
+            ),
+            UpdateStage(
+                "accounting",
+                self.async_process_accounting,
+                ("host", "dhcp-network"),
+                condition=lambda: self.option_sensor_client_traffic
+                and 0 < self.major_fw_version < 7,
+            ),
+            UpdateStage(
+                "kid-control-devices",
+                self.async_process_kid_control_devices,
+                ("host",),
+                condition=lambda: self.option_sensor_client_traffic
+                and 0 < self.major_fw_version >= 7,
+            ),
+            UpdateStage(
+                "queue",
+                self.async_get_queue,
+                condition=lambda: self.option_sensor_simple_queues,
+            ),
+            UpdateStage(
+                "environment",
+                self.async_get_environment,
+                condition=lambda: self.option_sensor_environment,
+                tier=TIER_MEDIUM,
+            ),
+            UpdateStage("ups", self.async_get_ups, condition=lambda: self.support_ups),
+            UpdateStage("gps", self.async_get_gps, condition=lambda: self.support_gps),
+        ]
+
+    # ---------------------------
+    #   _stage_intervals
+    # ---------------------------
+    def _stage_intervals(self) -> dict:
+        """Seconds between updates of each tier"""
+        return {
+            TIER_FAST: None,
+            TIER_MEDIUM: self.option_scan_interval_medium.total_seconds(),
+            TIER_SLOW: self.option_scan_interval_slow.total_seconds(),
+        }
+
     # ---------------------------
     #   _async_update_data
     # ---------------------------
@@ -567,129 +1809,293 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Update Mikrotik data"""
         delta = datetime.now().replace(microsecond=0) - self.last_hwinfo_update
         if self.api.has_reconnected() or delta.total_seconds() > 60 * 60 * 4:
-            await self.hass.async_add_executor_job(self.get_access)
+            self.invalidate_stages()
+            await self.api.connection_check()
+            await async_run_stages(self._hwinfo_stages(), self.api.connected)
 
-            if self.api.connected():
-                await self.hass.async_add_executor_job(self.get_firmware_update)
-
-            if self.api.connected():
-                await self.hass.async_add_executor_job(self.get_system_resource)
+            if not self.api.connected():
+                raise UpdateFailed("Mikrotik Disconnected")
 
-            if self.api.connected():
-                await self.hass.async_add_executor_job(self.get_capabilities)
+            self.last_hwinfo_update = datetime.now().replace(microsecond=0)
+
+        await self.api.connection_check()
+        if self.option_subscribe_changes and self.api.connected():
+            self.start_subscriptions()
+
+        # Update all entities unless refresh completes
+        self.changed_rows = None
+        start = monotonic()
+        queries = self.api.stats.total("count")
+        received = self.api.stats.total("received")
+        async with self.data_lock:
+            await async_run_stages(
+                self._update_stages(),
+                self.api.connected,
+                intervals=self._stage_intervals(),
+                last_run=self.stage_last_run,
+                stats=self.stats,
+            )
 
-            if self.api.connected():
-                await self.hass.async_add_executor_job(self.get_system_routerboard)
+            if not self.api.connected():
+                raise UpdateFailed("Mikrotik Disconnected")
 
-            if self.api.connected() and self.option_sensor_scripts:
-                await self.hass.async_add_executor_job(self.get_script)
+            self.update_stats(start, queries, received)
+            changed_rows = self.detect_changed_rows()
 
-            if self.api.connected():
-                await self.hass.async_add_executor_job(self.get_dhcp_network)
+        # Availability of all entities changes after failed refresh
+        if self.last_update_success:
+            self.changed_rows = changed_rows
 
-            if self.api.connected():
-                await self.hass.async_add_executor_job(self.get_dns)
+        # async_dispatcher_send(self.hass, "update_sensors", self)
+        return self.ds
 
-            if not self.api.connected():
-                raise UpdateFailed("Mikrotik Disconnected")
+    # ---------------------------
+    #   update_stats
+    # ---------------------------
+    def update_stats(self, start, queries, received) -> None:
+        """Store refresh duration and API usage of this refresh"""
+        self.stats.record("refresh", monotonic() - start)
+        stages = self.stats.summary()
+        refresh = stages.pop("refresh")
+        self.ds["stats"] = {
+            "update-duration": refresh["last"],
+            "update-duration-p50": refresh["p50"],
+            "update-duration-p95": refresh["p95"],
+            "slowest-stage": max(
+                stages, key=lambda name: stages[name]["p95"], default=""
+            ),
+            "api-queries": self.api.stats.total("count") - queries,
+            "api-received": self.api.stats.total("received") - received,
+        }
 
-            if self.api.connected():
-                self.last_hwinfo_update = datetime.now().replace(microsecond=0)
+    # ---------------------------
+    #   _subscriptions
+    # ---------------------------
+    def _subscriptions(self) -> dict:
+        """Tables kept in sync by listen subscriptions"""
+        subscriptions = {
+            "arp": ("/ip/arp", ARP_SPEC),
+            "dhcp": ("/ip/dhcp-server/lease", DHCP_SPEC),
+            "interface": ("/interface", INTERFACE_SPEC),
+        }
+        if self.support_wireless:
+            subscriptions["wireless_hosts"] = (
+                f"/interface/{self._wifimodule}/registration-table",
+                WIRELESS_HOSTS_SPEC,
+            )
 
-        await self.hass.async_add_executor_job(self.get_system_resource)
+        if self.option_sensor_netwatch:
+            subscriptions["netwatch"] = ("/tool/netwatch", NETWATCH_SPEC)
 
-        # if self.api.connected() and "available" not in self.ds["fw-update"]:
-        #     await self.hass.async_add_executor_job(self.get_firmware_update)
+        return {
+            data_path: subscription
+            for data_path, subscription in subscriptions.items()
+            if data_path not in self.listen_unsupported
+        }
 
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_system_health)
+    # ---------------------------
+    #   _listen_tier
+    # ---------------------------
+    def _listen_tier(self, data_path) -> str:
+        """Return polling tier for table which can be kept in sync by subscription"""
+        task = self.listen_tasks.get(data_path)
+        return TIER_MEDIUM if task and not task.done() else TIER_FAST
 
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_dhcp_client)
+    # ---------------------------
+    #   start_subscriptions
+    # ---------------------------
+    def start_subscriptions(self) -> None:
+        """Start listen subscriptions which are not running"""
+        for data_path, (path, spec) in self._subscriptions().items():
+            task = self.listen_tasks.get(data_path)
+            if task and not task.done():
+                continue
 
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_interface)
+            # Changes may have been missed, poll table in this cycle
+            self.stage_last_run.pop(data_path, None)
+            self.listen_tasks[data_path] = (
+                self.config_entry.async_create_background_task(
+                    self.hass,
+                    self.async_listen(data_path, path, spec),
+                    f"{DOMAIN} {self.host} listen {path}",
+                )
+            )
 
-        if self.api.connected() and not self.ds["host_hass"]:
-            await self.async_get_host_hass()
+    # ---------------------------
+    #   async_listen
+    # ---------------------------
+    async def async_listen(self, data_path, path, spec) -> None:
+        """Subscribe to changes of table"""
 
-        if self.api.connected() and self.support_capsman:
-            await self.hass.async_add_executor_job(self.get_capsman_hosts)
+        def handle_row(row) -> None:
+            if not self.listen_changes:
+                self.config_entry.async_create_task(
+                    self.hass, self.async_apply_changes()
+                )
 
-        if self.api.connected() and self.support_wireless:
-            await self.hass.async_add_executor_job(self.get_wireless)
+            self.listen_changes.setdefault(data_path, []).append(row)
 
-        if self.api.connected() and self.support_wireless:
-            await self.hass.async_add_executor_job(self.get_wireless_hosts)
+        if (
+            not await self.api.listen(path, handle_row, get_proplist(**spec))
+            and self.api.connected()
+        ):
+            _LOGGER.debug("Mikrotik %s does not support listen on %s", self.host, path)
+            self.listen_unsupported.add(data_path)
 
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_bridge)
+    # ---------------------------
+    #   async_apply_changes
+    # ---------------------------
+    async def async_apply_changes(self) -> None:
+        """Apply rows received from subscriptions and update affected entities"""
+        async with self.data_lock:
+            changes, self.listen_changes = self.listen_changes, {}
+            subscriptions = self._subscriptions()
+            updated = {
+                data_path: self._apply_rows(
+                    data_path, rows, subscriptions[data_path][1]
+                )
+                for data_path, rows in changes.items()
+                if data_path in subscriptions
+            }
 
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_arp)
+            def present(data_path) -> list:
+                return [
+                    uid
+                    for uid in updated.get(data_path, ())
+                    if uid in self.ds[data_path]
+                ]
 
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_dhcp)
+            self.process_interface(present("interface"))
+            self.process_arp(present("arp"))
+            await self.async_process_dhcp(present("dhcp"))
+
+            if updated.get("interface") or updated.get("arp"):
+                before = {uid: dict(vals) for uid, vals in self.ds["interface"].items()}
+                self.process_interface_client()
+                updated.setdefault("interface", set()).update(
+                    uid
+                    for uid, vals in self.ds["interface"].items()
+                    if before.get(uid) != vals
+                )
 
-        if self.api.connected():
-            await self.async_process_host()
+            if (
+                updated.get("arp")
+                or updated.get("dhcp")
+                or updated.get("wireless_hosts")
+            ):
+                before = {uid: dict(vals) for uid, vals in self.ds["host"].items()}
+                await self.async_process_host()
+                updated["host"] = {
+                    uid
+                    for uid, vals in self.ds["host"].items()
+                    if before.get(uid) != vals
+                }
 
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.process_interface_client)
+        self.async_update_rows(updated)
 
-        if self.api.connected() and self.option_sensor_nat:
-            await self.hass.async_add_executor_job(self.get_nat)
+    # ---------------------------
+    #   _apply_rows
+    # ---------------------------
+    def _apply_rows(self, data_path, rows, spec) -> set:
+        """Apply added, changed and removed rows, return affected uids"""
+        data = self.ds[data_path]
+        ids = {vals[".id"]: uid for uid, vals in data.items() if vals.get(".id")}
+        uids = set()
+        for row in rows:
+            uid = get_uid(row, spec["key"], spec.get("key_secondary"), None, None)
+            old_uid = ids.get(row.get(".id"))
+            if old_uid is not None and (row.get(".dead") or old_uid != uid):
+                data.pop(old_uid, None)
+                uids.add(old_uid)
 
-        if self.api.connected() and self.option_sensor_kidcontrol:
-            await self.hass.async_add_executor_job(self.get_kidcontrol)
+            if row.get(".dead") or not uid:
+                continue
 
-        if self.api.connected() and self.option_sensor_mangle:
-            await self.hass.async_add_executor_job(self.get_mangle)
+            parse_api(data=data, source=row, **spec)
+            if uid in data:
+                ids[row.get(".id")] = uid
+                uids.add(uid)
 
-        if self.api.connected() and self.option_sensor_filter:
-            await self.hass.async_add_executor_job(self.get_filter)
+        return uids
 
-        if self.api.connected() and self.option_sensor_netwatch:
-            await self.hass.async_add_executor_job(self.get_netwatch)
+    # ---------------------------
+    #   async_add_row_listener
+    # ---------------------------
+    @callback
+    def async_add_row_listener(
+        self, data_path, uid, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for changes of single data row"""
+        listeners = self._row_listeners.setdefault((data_path, uid), [])
+        listeners.append(update_callback)
 
-        if self.api.connected() and self.support_ppp and self.option_sensor_ppp:
-            await self.hass.async_add_executor_job(self.get_ppp)
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+            if not listeners:
+                self._row_listeners.pop((data_path, uid), None)
 
-        if self.api.connected() and self.option_sensor_client_traffic:
-            if 0 < self.major_fw_version < 7:
-                await self.hass.async_add_executor_job(self.process_accounting)
-            elif 0 < self.major_fw_version >= 7:
-                await self.hass.async_add_executor_job(self.process_kid_control_devices)
+        return remove_listener
 
-        if self.api.connected() and self.option_sensor_client_captive:
-            await self.hass.async_add_executor_job(self.get_captive)
+    # ---------------------------
+    #   detect_changed_rows
+    # ---------------------------
+    def detect_changed_rows(self) -> dict:
+        """Compare rows with entities against previous refresh, return changed uids"""
+        changed = {}
+        for data_path, uid in self._row_listeners:
+            snapshots = self.row_snapshots.setdefault(data_path, {})
+            vals = self.ds[data_path].get(uid)
+            snapshot = dict(vals) if vals is not None else None
+            if uid not in snapshots or snapshots[uid] != snapshot:
+                snapshots[uid] = snapshot
+                changed.setdefault(data_path, set()).add(uid)
 
-        if self.api.connected() and self.option_sensor_simple_queues:
-            await self.hass.async_add_executor_job(self.get_queue)
+        # Drop snapshots of removed entities
+        for data_path, snapshots in self.row_snapshots.items():
+            for uid in [
+                uid for uid in snapshots if (data_path, uid) not in self._row_listeners
+            ]:
+                del snapshots[uid]
 
-        if self.api.connected() and self.option_sensor_environment:
-            await self.hass.async_add_executor_job(self.get_environment)
+        return changed
 
-        if self.api.connected() and self.support_ups:
-            await self.hass.async_add_executor_job(self.get_ups)
+    # ---------------------------
+    #   row_changed
+    # ---------------------------
+    def row_changed(self, data_path, uid) -> bool:
+        """Return True if row changed in last refresh"""
+        return self.changed_rows is None or uid in self.changed_rows.get(data_path, ())
 
-        if self.api.connected() and self.support_gps:
-            await self.hass.async_add_executor_job(self.get_gps)
+    # ---------------------------
+    #   async_update_rows
+    # ---------------------------
+    @callback
+    def async_update_rows(self, rows) -> None:
+        """Update entities of changed data rows"""
+        for data_path, uids in rows.items():
+            for uid in uids:
+                if uid not in self.ds[data_path]:
+                    continue
 
-        if not self.api.connected():
-            raise UpdateFailed("Mikrotik Disconnected")
+                if (data_path, uid) in self._row_listeners:
+                    self.row_snapshots.setdefault(data_path, {})[uid] = dict(
+                        self.ds[data_path][uid]
+                    )
 
-        # async_dispatcher_send(self.hass, "update_sensors", self)
-        return self.ds
+                for update_callback in list(
+                    self._row_listeners.get((data_path, uid), ())
+                ):
+                    update_callback()
 
     # ---------------------------
-    #   get_access
+    #   async_get_access
     # ---------------------------
-    def get_access(self) -> None:
+    async def async_get_access(self) -> None:
         """Get access rights from Mikrotik"""
-        tmp_user = parse_api(
+        tmp_user = await self.async_parse_query(
+            "/user",
             data={},
-            source=self.api.query("/user"),
             key="name",
             vals=[
                 {"name": "name"},
@@ -697,9 +2103,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             ],
         )
 
-        tmp_group = parse_api(
+        tmp_group = await self.async_parse_query(
+            "/user/group",
             data={},
-            source=self.api.query("/user/group"),
             key="name",
             vals=[
                 {"name": "name"},
@@ -727,57 +2133,12 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 )
 
     # ---------------------------
-    #   get_interface
+    #   async_get_interface
     # ---------------------------
-    def get_interface(self) -> None:
+    async def async_get_interface(self) -> None:
         """Get all interfaces data from Mikrotik"""
-        self.ds["interface"] = parse_api(
-            data=self.ds["interface"],
-            source=self.api.query("/interface"),
-            key="default-name",
-            key_secondary="name",
-            vals=[
-                {"name": "default-name"},
-                {"name": ".id"},
-                {"name": "name", "default_val": "default-name"},
-                {"name": "type", "default": "unknown"},
-                {"name": "running", "type": "bool"},
-                {
-                    "name": "enabled",
-                    "source": "disabled",
-                    "type": "bool",
-                    "reverse": True,
-                },
-                {"name": "port-mac-address", "source": "mac-address"},
-                {"name": "comment"},
-                {"name": "last-link-down-time"},
-                {"name": "last-link-up-time"},
-                {"name": "link-downs"},
-                {"name": "tx-queue-drop"},
-                {"name": "actual-mtu"},
-                {"name": "about", "source": ".about", "default": ""},
-                {"name": "rx-current", "source": "rx-byte", "default": 0.0},
-                {"name": "tx-current", "source": "tx-byte", "default": 0.0},
-            ],
-            ensure_vals=[
-                {"name": "client-ip-address"},
-                {"name": "client-mac-address"},
-                {"name": "rx-previous", "default": 0.0},
-                {"name": "tx-previous", "default": 0.0},
-                {"name": "rx", "default": 0.0},
-                {"name": "tx", "default": 0.0},
-                {"name": "rx-total", "default": 0.0},
-                {"name": "tx-total", "default": 0.0},
-            ],
-            skip=[
-                {"name": "type", "value": "bridge"},
-                {"name": "type", "value": "ppp-in"},
-                {"name": "type", "value": "pptp-in"},
-                {"name": "type", "value": "sstp-in"},
-                {"name": "type", "value": "l2tp-in"},
-                {"name": "type", "value": "pppoe-in"},
-                {"name": "type", "value": "ovpn-in"},
-            ],
+        self.ds["interface"] = await self.async_parse_query(
+            "/interface", data_path="interface", **INTERFACE_SPEC
         )
 
         if self.option_sensor_port_traffic:
@@ -803,137 +2164,112 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 self.ds["interface"][uid]["tx-total"] = current_tx
                 self.ds["interface"][uid]["rx-total"] = current_rx
 
-        self.ds["interface"] = parse_api(
-            data=self.ds["interface"],
-            source=self.api.query("/interface/ethernet"),
-            key="default-name",
-            key_secondary="name",
-            vals=[
-                {"name": "default-name"},
-                {"name": "name", "default_val": "default-name"},
-                {"name": "poe-out", "default": "N/A"},
-                {"name": "sfp-shutdown-temperature", "default": 0},
-            ],
-            skip=[
-                {"name": "type", "value": "bridge"},
-                {"name": "type", "value": "ppp-in"},
-                {"name": "type", "value": "pptp-in"},
-                {"name": "type", "value": "sstp-in"},
-                {"name": "type", "value": "l2tp-in"},
-                {"name": "type", "value": "pppoe-in"},
-                {"name": "type", "value": "ovpn-in"},
-            ],
-        )
-
-        # Udpate virtual interfaces
-        bonding = False
-        for uid, vals in self.ds["interface"].items():
-            if self.ds["interface"][uid]["type"] == "bond":
-                bonding = True
+        self.process_interface(list(self.ds["interface"]))
 
-            self.ds["interface"][uid]["comment"] = str(
-                self.ds["interface"][uid]["comment"]
+        bonding = any(vals["type"] == "bond" for vals in self.ds["interface"].values())
+        if bonding:
+            self.ds["bonding"] = await self.async_parse_query(
+                "/interface/bonding", data={}, **BONDING_SPEC
             )
 
+            self.ds["bonding_slaves"] = {}
+            for uid, vals in self.ds["bonding"].items():
+                for tmp in vals["slaves"].split(","):
+                    self.ds["bonding_slaves"][tmp] = vals
+                    self.ds["bonding_slaves"][tmp]["master"] = uid
+
+    # ---------------------------
+    #   process_interface
+    # ---------------------------
+    def process_interface(self, uids) -> None:
+        """Update virtual interfaces"""
+        for uid in uids:
+            vals = self.ds["interface"][uid]
+            vals["comment"] = str(vals["comment"])
+
             if vals["default-name"] == "":
-                self.ds["interface"][uid]["default-name"] = vals["name"]
-                self.ds["interface"][uid][
-                    "port-mac-address"
-                ] = f"{vals['port-mac-address']}-{vals['name']}"
-
-            if self.ds["interface"][uid]["type"] == "ether":
-                if (
-                    "sfp-shutdown-temperature" in vals
-                    and vals["sfp-shutdown-temperature"] != ""
-                ):
-                    self.ds["interface"] = parse_api(
-                        data=self.ds["interface"],
-                        source=self.api.query(
-                            "/interface/ethernet",
-                            command="monitor",
-                            args={".id": vals[".id"], "once": True},
-                        ),
-                        key_search="name",
-                        vals=[
-                            {"name": "status", "default": "unknown"},
-                            {"name": "auto-negotiation", "default": "unknown"},
-                            {"name": "advertising", "default": "unknown"},
-                            {"name": "link-partner-advertising", "default": "unknown"},
-                            {"name": "sfp-temperature", "default": 0},
-                            {"name": "sfp-supply-voltage", "default": "unknown"},
-                            {"name": "sfp-module-present", "default": "unknown"},
-                            {"name": "sfp-tx-bias-current", "default": "unknown"},
-                            {"name": "sfp-tx-power", "default": "unknown"},
-                            {"name": "sfp-rx-power", "default": "unknown"},
-                            {"name": "sfp-rx-loss", "default": "unknown"},
-                            {"name": "sfp-tx-fault", "default": "unknown"},
-                            {"name": "sfp-type", "default": "unknown"},
-                            {"name": "sfp-connector-type", "default": "unknown"},
-                            {"name": "sfp-vendor-name", "default": "unknown"},
-                            {"name": "sfp-vendor-part-number", "default": "unknown"},
-                            {"name": "sfp-vendor-revision", "default": "unknown"},
-                            {"name": "sfp-vendor-serial", "default": "unknown"},
-                            {"name": "sfp-manufacturing-date", "default": "unknown"},
-                            {"name": "eeprom-checksum", "default": "unknown"},
-                        ],
-                    )
-                else:
-                    self.ds["interface"] = parse_api(
-                        data=self.ds["interface"],
-                        source=self.api.query(
-                            "/interface/ethernet",
-                            command="monitor",
-                            args={".id": vals[".id"], "once": True},
-                        ),
-                        key_search="name",
-                        vals=[
-                            {"name": "status", "default": "unknown"},
-                            {"name": "rate", "default": "unknown"},
-                            {"name": "full-duplex", "default": "unknown"},
-                            {"name": "auto-negotiation", "default": "unknown"},
-                        ],
-                    )
+                vals["default-name"] = vals["name"]
+                vals["port-mac-address"] = f"{vals['port-mac-address']}-{vals['name']}"
 
-        if bonding:
-            self.ds["bonding"] = parse_api(
-                data={},
-                source=self.api.query("/interface/bonding"),
-                key="name",
-                vals=[
-                    {"name": "name"},
-                    {"name": "mac-address"},
-                    {"name": "slaves"},
-                    {"name": "mode"},
-                ],
-            )
+    # ---------------------------
+    #   async_get_interface_ethernet
+    # ---------------------------
+    async def async_get_interface_ethernet(self) -> None:
+        """Get ethernet port details from Mikrotik"""
+        self.ds["interface"] = await self.async_parse_query(
+            "/interface/ethernet", data=self.ds["interface"], **ETHERNET_SPEC
+        )
+
+        sfp_ports, copper_ports = self._ethernet_ports()
+
+        # Module info is polled on slow tier, new ports get it in this update
+        if any("sfp-type" not in vals for vals in sfp_ports):
+            self.stage_last_run.pop("interface_sfp", None)
+
+        # Monitor all ports of a kind in one call, rows are matched by name
+        await asyncio.gather(
+            self.async_get_ethernet_monitor(
+                [vals[".id"] for vals in sfp_ports], ETHERNET_SFP_MONITOR_SPEC
+            ),
+            self.async_get_ethernet_monitor(
+                [vals[".id"] for vals in copper_ports], ETHERNET_MONITOR_SPEC
+            ),
+        )
+
+    # ---------------------------
+    #   async_get_interface_sfp
+    # ---------------------------
+    async def async_get_interface_sfp(self) -> None:
+        """Get SFP module info from Mikrotik"""
+        sfp_ports, _ = self._ethernet_ports()
+        await self.async_get_ethernet_monitor(
+            [vals[".id"] for vals in sfp_ports], ETHERNET_SFP_INFO_SPEC
+        )
+
+    # ---------------------------
+    #   _ethernet_ports
+    # ---------------------------
+    def _ethernet_ports(self) -> tuple:
+        """Return SFP and copper ethernet port rows"""
+        sfp_ports = []
+        copper_ports = []
+        for vals in self.ds["interface"].values():
+            if vals["type"] != "ether":
+                continue
+
+            if (
+                "sfp-shutdown-temperature" in vals
+                and vals["sfp-shutdown-temperature"] != ""
+            ):
+                sfp_ports.append(vals)
+            else:
+                copper_ports.append(vals)
+
+        return sfp_ports, copper_ports
+
+    # ---------------------------
+    #   async_get_ethernet_monitor
+    # ---------------------------
+    async def async_get_ethernet_monitor(self, ids, spec) -> None:
+        """Get ethernet monitor data for list of ports"""
+        if not ids:
+            return
 
-            self.ds["bonding_slaves"] = {}
-            for uid, vals in self.ds["bonding"].items():
-                for tmp in vals["slaves"].split(","):
-                    self.ds["bonding_slaves"][tmp] = vals
-                    self.ds["bonding_slaves"][tmp]["master"] = uid
+        self.ds["interface"] = await self.async_parse_query(
+            "/interface/ethernet",
+            command="monitor",
+            args={"numbers": ",".join(ids), "once": True},
+            data=self.ds["interface"],
+            **spec,
+        )
 
     # ---------------------------
-    #   get_bridge
+    #   async_get_bridge
     # ---------------------------
-    def get_bridge(self) -> None:
+    async def async_get_bridge(self) -> None:
         """Get system resources data from Mikrotik"""
-        self.ds["bridge_host"] = parse_api(
-            data=self.ds["bridge_host"],
-            source=self.api.query("/interface/bridge/host"),
-            key="mac-address",
-            vals=[
-                {"name": "mac-address"},
-                {"name": "interface", "default": "unknown"},
-                {"name": "bridge", "default": "unknown"},
-                {
-                    "name": "enabled",
-                    "source": "disabled",
-                    "type": "bool",
-                    "reverse": True,
-                },
-            ],
-            only=[{"key": "local", "value": False}],
+        self.ds["bridge_host"] = await self.async_parse_query(
+            "/interface/bridge/host", data_path="bridge_host", **BRIDGE_HOST_SPEC
         )
 
         for uid, vals in self.ds["bridge_host"].items():
@@ -950,96 +2286,40 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 self.ds["interface"][uid]["client-mac-address"] = "disabled"
             return
 
-        for uid, vals in self.ds["interface"].items():
-            self.ds["interface"][uid]["client-ip-address"] = ""
-            self.ds["interface"][uid]["client-mac-address"] = ""
-            for arp_uid, arp_vals in self.ds["arp"].items():
-                if arp_vals["interface"] != vals["name"] and not (
-                    vals["name"] in self.ds["bonding_slaves"]
-                    and self.ds["bonding_slaves"][vals["name"]]["master"]
-                    == arp_vals["interface"]
-                ):
-                    continue
-
-                if self.ds["interface"][uid]["client-ip-address"] == "":
-                    self.ds["interface"][uid]["client-ip-address"] = arp_vals["address"]
-                else:
-                    self.ds["interface"][uid]["client-ip-address"] = "multiple"
+        # Index ARP entries by interface
+        arp_by_interface = {}
+        for arp_vals in self.ds["arp"].values():
+            arp_by_interface.setdefault(arp_vals["interface"], []).append(arp_vals)
 
-                if self.ds["interface"][uid]["client-mac-address"] == "":
-                    self.ds["interface"][uid]["client-mac-address"] = arp_vals[
-                        "mac-address"
+        for uid, vals in self.ds["interface"].items():
+            clients = arp_by_interface.get(vals["name"], [])
+            if vals["name"] in self.ds["bonding_slaves"]:
+                master = self.ds["bonding_slaves"][vals["name"]]["master"]
+                if master != vals["name"]:
+                    clients = clients + arp_by_interface.get(master, [])
+
+            if len(clients) > 1:
+                vals["client-ip-address"] = "multiple"
+                vals["client-mac-address"] = "multiple"
+            elif clients:
+                vals["client-ip-address"] = clients[0]["address"]
+                vals["client-mac-address"] = clients[0]["mac-address"]
+            else:
+                vals["client-ip-address"] = "none"
+                if vals["name"] in self.ds["dhcp-client"]:
+                    vals["client-ip-address"] = self.ds["dhcp-client"][vals["name"]][
+                        "address"
                     ]
-                else:
-                    self.ds["interface"][uid]["client-mac-address"] = "multiple"
 
-            if self.ds["interface"][uid]["client-ip-address"] == "":
-                if self.ds["interface"][uid]["name"] in self.ds["dhcp-client"]:
-                    self.ds["interface"][uid]["client-ip-address"] = self.ds[
-                        "dhcp-client"
-                    ][self.ds["interface"][uid]["name"]]["address"]
-                else:
-                    self.ds["interface"][uid]["client-ip-address"] = "none"
-
-            if self.ds["interface"][uid]["client-mac-address"] == "":
-                self.ds["interface"][uid]["client-mac-address"] = "none"
+                vals["client-mac-address"] = "none"
 
     # ---------------------------
-    #   get_nat
+    #   async_get_nat
     # ---------------------------
-    def get_nat(self) -> None:
+    async def async_get_nat(self) -> None:
         """Get NAT data from Mikrotik"""
-        self.ds["nat"] = parse_api(
-            data=self.ds["nat"],
-            source=self.api.query("/ip/firewall/nat"),
-            key=".id",
-            vals=[
-                {"name": ".id"},
-                {"name": "chain", "default": "unknown"},
-                {"name": "action", "default": "unknown"},
-                {"name": "protocol", "default": "any"},
-                {"name": "dst-port", "default": "any"},
-                {"name": "in-interface", "default": "any"},
-                {"name": "out-interface", "default": "any"},
-                {"name": "to-addresses"},
-                {"name": "to-ports", "default": "any"},
-                {"name": "comment"},
-                {
-                    "name": "enabled",
-                    "source": "disabled",
-                    "type": "bool",
-                    "reverse": True,
-                },
-            ],
-            val_proc=[
-                [
-                    {"name": "uniq-id"},
-                    {"action": "combine"},
-                    {"key": "chain"},
-                    {"text": ","},
-                    {"key": "action"},
-                    {"text": ","},
-                    {"key": "protocol"},
-                    {"text": ","},
-                    {"key": "in-interface"},
-                    {"text": ":"},
-                    {"key": "dst-port"},
-                    {"text": "-"},
-                    {"key": "out-interface"},
-                    {"text": ":"},
-                    {"key": "to-addresses"},
-                    {"text": ":"},
-                    {"key": "to-ports"},
-                ],
-                [
-                    {"name": "name"},
-                    {"action": "combine"},
-                    {"key": "protocol"},
-                    {"text": ":"},
-                    {"key": "dst-port"},
-                ],
-            ],
-            only=[{"key": "action", "value": "dst-nat"}],
+        self.ds["nat"] = await self.async_parse_query(
+            "/ip/firewall/nat", data_path="nat", **NAT_SPEC
         )
 
         # Remove duplicate NAT entries to prevent crash
@@ -1067,71 +2347,12 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             del self.ds["nat"][uid]
 
     # ---------------------------
-    #   get_mangle
+    #   async_get_mangle
     # ---------------------------
-    def get_mangle(self) -> None:
+    async def async_get_mangle(self) -> None:
         """Get Mangle data from Mikrotik"""
-        self.ds["mangle"] = parse_api(
-            data=self.ds["mangle"],
-            source=self.api.query("/ip/firewall/mangle"),
-            key=".id",
-            vals=[
-                {"name": ".id"},
-                {"name": "chain"},
-                {"name": "action"},
-                {"name": "comment"},
-                {"name": "address-list"},
-                {"name": "passthrough", "type": "bool", "default": False},
-                {"name": "protocol", "default": "any"},
-                {"name": "src-address", "default": "any"},
-                {"name": "src-port", "default": "any"},
-                {"name": "dst-address", "default": "any"},
-                {"name": "dst-port", "default": "any"},
-                {"name": "src-address-list", "default": "any"},
-                {"name": "dst-address-list", "default": "any"},
-                {
-                    "name": "enabled",
-                    "source": "disabled",
-                    "type": "bool",
-                    "reverse": True,
-                },
-            ],
-            val_proc=[
-                [
-                    {"name": "uniq-id"},
-                    {"action": "combine"},
-                    {"key": "chain"},
-                    {"text": ","},
-                    {"key": "action"},
-                    {"text": ","},
-                    {"key": "protocol"},
-                    {"text": ","},
-                    {"key": "src-address"},
-                    {"text": ":"},
-                    {"key": "src-port"},
-                    {"text": "-"},
-                    {"key": "dst-address"},
-                    {"text": ":"},
-                    {"key": "dst-port"},
-                    {"text": ","},
-                    {"key": "src-address-list"},
-                    {"text": "-"},
-                    {"key": "dst-address-list"},
-                ],
-                [
-                    {"name": "name"},
-                    {"action": "combine"},
-                    {"key": "action"},
-                    {"text": ","},
-                    {"key": "protocol"},
-                    {"text": ":"},
-                    {"key": "dst-port"},
-                ],
-            ],
-            skip=[
-                {"name": "dynamic", "value": True},
-                {"name": "action", "value": "jump"},
-            ],
+        self.ds["mangle"] = await self.async_parse_query(
+            "/ip/firewall/mangle", data_path="mangle", **MANGLE_SPEC
         )
 
         # Remove duplicate Mangle entries to prevent crash
@@ -1159,88 +2380,12 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             del self.ds["mangle"][uid]
 
     # ---------------------------
-    #   get_filter
+    #   async_get_filter
     # ---------------------------
-    def get_filter(self) -> None:
+    async def async_get_filter(self) -> None:
         """Get Filter data from Mikrotik"""
-        self.ds["filter"] = parse_api(
-            data=self.ds["filter"],
-            source=self.api.query("/ip/firewall/filter"),
-            key=".id",
-            vals=[
-                {"name": ".id"},
-                {"name": "chain"},
-                {"name": "action"},
-                {"name": "comment"},
-                {"name": "address-list"},
-                {"name": "protocol", "default": "any"},
-                {"name": "in-interface", "default": "any"},
-                {"name": "in-interface-list", "default": "any"},
-                {"name": "out-interface", "default": "any"},
-                {"name": "out-interface-list", "default": "any"},
-                {"name": "src-address", "default": "any"},
-                {"name": "src-address-list", "default": "any"},
-                {"name": "src-port", "default": "any"},
-                {"name": "dst-address", "default": "any"},
-                {"name": "dst-address-list", "default": "any"},
-                {"name": "dst-port", "default": "any"},
-                {"name": "layer7-protocol", "default": "any"},
-                {"name": "connection-state", "default": "any"},
-                {"name": "tcp-flags", "default": "any"},
-                {
-                    "name": "enabled",
-                    "source": "disabled",
-                    "type": "bool",
-                    "reverse": True,
-                    "default": True,
-                },
-            ],
-            val_proc=[
-                [
-                    {"name": "uniq-id"},
-                    {"action": "combine"},
-                    {"key": "chain"},
-                    {"text": ","},
-                    {"key": "action"},
-                    {"text": ","},
-                    {"key": "protocol"},
-                    {"text": ","},
-                    {"key": "layer7-protocol"},
-                    {"text": ","},
-                    {"key": "in-interface"},
-                    {"text": ","},
-                    {"key": "in-interface-list"},
-                    {"text": ":"},
-                    {"key": "src-address"},
-                    {"text": ","},
-                    {"key": "src-address-list"},
-                    {"text": ":"},
-                    {"key": "src-port"},
-                    {"text": "-"},
-                    {"key": "out-interface"},
-                    {"text": ","},
-                    {"key": "out-interface-list"},
-                    {"text": ":"},
-                    {"key": "dst-address"},
-                    {"text": ","},
-                    {"key": "dst-address-list"},
-                    {"text": ":"},
-                    {"key": "dst-port"},
-                ],
-                [
-                    {"name": "name"},
-                    {"action": "combine"},
-                    {"key": "action"},
-                    {"text": ","},
-                    {"key": "protocol"},
-                    {"text": ":"},
-                    {"key": "dst-port"},
-                ],
-            ],
-            skip=[
-                {"name": "dynamic", "value": True},
-                {"name": "action", "value": "jump"},
-            ],
+        self.ds["filter"] = await self.async_parse_query(
+            "/ip/firewall/filter", data_path="filter", **FILTER_SPEC
         )
 
         # Remove duplicate filter entries to prevent crash
@@ -1269,34 +2414,12 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             del self.ds["filter"][uid]
 
     # ---------------------------
-    #   get_kidcontrol
+    #   async_get_kidcontrol
     # ---------------------------
-    def get_kidcontrol(self) -> None:
+    async def async_get_kidcontrol(self) -> None:
         """Get Kid-control data from Mikrotik"""
-        self.ds["kid-control"] = parse_api(
-            data=self.ds["kid-control"],
-            source=self.api.query("/ip/kid-control"),
-            key="name",
-            vals=[
-                {"name": "name"},
-                {"name": "rate-limit"},
-                {"name": "mon", "default": "None"},
-                {"name": "tue", "default": "None"},
-                {"name": "wed", "default": "None"},
-                {"name": "thu", "default": "None"},
-                {"name": "fri", "default": "None"},
-                {"name": "sat", "default": "None"},
-                {"name": "sun", "default": "None"},
-                {"name": "comment"},
-                {"name": "blocked", "type": "bool", "default": False},
-                {"name": "paused", "type": "bool", "reverse": True},
-                {
-                    "name": "enabled",
-                    "source": "disabled",
-                    "type": "bool",
-                    "reverse": True,
-                },
-            ],
+        self.ds["kid-control"] = await self.async_parse_query(
+            "/ip/kid-control", data_path="kid-control", **KID_CONTROL_SPEC
         )
 
         for uid in self.ds["kid-control"]:
@@ -1305,45 +2428,21 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             )
 
     # ---------------------------
-    #   get_ppp
+    #   async_get_ppp_secret
     # ---------------------------
-    def get_ppp(self) -> None:
-        """Get PPP data from Mikrotik"""
-        self.ds["ppp_secret"] = parse_api(
-            data=self.ds["ppp_secret"],
-            source=self.api.query("/ppp/secret"),
-            key="name",
-            vals=[
-                {"name": "name"},
-                {"name": "service"},
-                {"name": "profile"},
-                {"name": "comment"},
-                {
-                    "name": "enabled",
-                    "source": "disabled",
-                    "type": "bool",
-                    "reverse": True,
-                },
-            ],
-            ensure_vals=[
-                {"name": "caller-id", "default": ""},
-                {"name": "address", "default": ""},
-                {"name": "encoding", "default": ""},
-                {"name": "connected", "default": False},
-            ],
+    async def async_get_ppp_secret(self) -> None:
+        """Get PPP secrets from Mikrotik"""
+        self.ds["ppp_secret"] = await self.async_parse_query(
+            "/ppp/secret", data_path="ppp_secret", **PPP_SECRET_SPEC
         )
 
-        self.ds["ppp_active"] = parse_api(
-            data={},
-            source=self.api.query("/ppp/active"),
-            key="name",
-            vals=[
-                {"name": "name"},
-                {"name": "service"},
-                {"name": "caller-id"},
-                {"name": "address"},
-                {"name": "encoding"},
-            ],
+    # ---------------------------
+    #   async_get_ppp
+    # ---------------------------
+    async def async_get_ppp(self) -> None:
+        """Get PPP active connections from Mikrotik"""
+        self.ds["ppp_active"] = await self.async_parse_query(
+            "/ppp/active", data={}, **PPP_ACTIVE_SPEC
         )
 
         for uid in self.ds["ppp_secret"]:
@@ -1369,35 +2468,18 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 self.ds["ppp_secret"][uid]["encoding"] = "not connected"
 
     # ---------------------------
-    #   get_netwatch
+    #   async_get_netwatch
     # ---------------------------
-    def get_netwatch(self) -> None:
+    async def async_get_netwatch(self) -> None:
         """Get netwatch data from Mikrotik"""
-        self.ds["netwatch"] = parse_api(
-            data=self.ds["netwatch"],
-            source=self.api.query("/tool/netwatch"),
-            key="host",
-            vals=[
-                {"name": "host"},
-                {"name": "type"},
-                {"name": "interval"},
-                {"name": "port"},
-                {"name": "http-codes"},
-                {"name": "status", "type": "bool", "default": "unknown"},
-                {"name": "comment"},
-                {
-                    "name": "enabled",
-                    "source": "disabled",
-                    "type": "bool",
-                    "reverse": True,
-                },
-            ],
+        self.ds["netwatch"] = await self.async_parse_query(
+            "/tool/netwatch", data_path="netwatch", **NETWATCH_SPEC
         )
 
     # ---------------------------
-    #   get_system_routerboard
+    #   async_get_system_routerboard
     # ---------------------------
-    def get_system_routerboard(self) -> None:
+    async def async_get_system_routerboard(self) -> None:
         """Get routerboard data from Mikrotik"""
         if self.ds["resource"]["board-name"].startswith("x86") or self.ds["resource"][
             "board-name"
@@ -1406,9 +2488,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             self.ds["routerboard"]["model"] = self.ds["resource"]["board-name"]
             self.ds["routerboard"]["serial-number"] = "N/A"
         else:
-            self.ds["routerboard"] = parse_api(
+            self.ds["routerboard"] = await self.async_parse_query(
+                "/system/routerboard",
                 data=self.ds["routerboard"],
-                source=self.api.query("/system/routerboard"),
                 vals=[
                     {"name": "routerboard", "type": "bool"},
                     {"name": "model", "default": "unknown"},
@@ -1427,9 +2509,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 self.ds["routerboard"].pop("upgrade-firmware")
 
     # ---------------------------
-    #   get_system_health
+    #   async_get_system_health
     # ---------------------------
-    def get_system_health(self) -> None:
+    async def async_get_system_health(self) -> None:
         """Get routerboard data from Mikrotik"""
         if (
             "write" not in self.ds["access"]
@@ -1439,59 +2521,24 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             return
 
         if 0 < self.major_fw_version < 7:
-            self.ds["health"] = parse_api(
-                data=self.ds["health"],
-                source=self.api.query("/system/health"),
-                vals=[
-                    {"name": "temperature", "default": 0},
-                    {"name": "voltage", "default": 0},
-                    {"name": "cpu-temperature", "default": 0},
-                    {"name": "power-consumption", "default": 0},
-                    {"name": "board-temperature1", "default": 0},
-                    {"name": "phy-temperature", "default": 0},
-                    {"name": "fan1-speed", "default": 0},
-                    {"name": "fan2-speed", "default": 0},
-                ],
+            self.ds["health"] = await self.async_parse_query(
+                "/system/health", data=self.ds["health"], **HEALTH_SPEC
             )
         elif 0 < self.major_fw_version >= 7:
-            self.ds["health7"] = parse_api(
-                data=self.ds["health7"],
-                source=self.api.query("/system/health"),
-                key="name",
-                vals=[
-                    {"name": "value", "default": "unknown"},
-                ],
+            self.ds["health7"] = await self.async_parse_query(
+                "/system/health", data=self.ds["health7"], **HEALTH7_SPEC
             )
             if self.ds["health7"]:
                 for uid, vals in self.ds["health7"].items():
                     self.ds["health"][uid] = vals["value"]
 
     # ---------------------------
-    #   get_system_resource
+    #   async_get_system_resource
     # ---------------------------
-    def get_system_resource(self) -> None:
+    async def async_get_system_resource(self) -> None:
         """Get system resources data from Mikrotik"""
-        self.ds["resource"] = parse_api(
-            data=self.ds["resource"],
-            source=self.api.query("/system/resource"),
-            vals=[
-                {"name": "platform", "default": "unknown"},
-                {"name": "board-name", "default": "unknown"},
-                {"name": "version", "default": "unknown"},
-                {"name": "uptime_str", "source": "uptime", "default": "unknown"},
-                {"name": "cpu-load", "default": "unknown"},
-                {"name": "free-memory", "default": 0},
-                {"name": "total-memory", "default": 0},
-                {"name": "free-hdd-space", "default": 0},
-                {"name": "total-hdd-space", "default": 0},
-            ],
-            ensure_vals=[
-                {"name": "uptime", "default": 0},
-                {"name": "uptime_epoch", "default": 0},
-                {"name": "clients_wired", "default": 0},
-                {"name": "clients_wireless", "default": 0},
-                {"name": "captive_authorized", "default": 0},
-            ],
+        self.ds["resource"] = await self.async_parse_query(
+            "/system/resource", data=self.ds["resource"], **RESOURCE_SPEC
         )
 
         tmp_uptime = 0
@@ -1557,15 +2604,15 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             "uptime_epoch" in self.ds["resource"]
             and self.rebootcheck > self.ds["resource"]["uptime_epoch"]
         ):
-            self.get_firmware_update()
+            await self.async_get_firmware_update()
 
         if "uptime_epoch" in self.ds["resource"]:
             self.rebootcheck = self.ds["resource"]["uptime_epoch"]
 
     # ---------------------------
-    #   get_firmware_update
+    #   async_get_firmware_update
     # ---------------------------
-    def get_firmware_update(self) -> None:
+    async def async_get_firmware_update(self) -> None:
         """Check for firmware update on Mikrotik"""
         if (
             "write" not in self.ds["access"]
@@ -1574,12 +2621,12 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         ):
             return
 
-        self.execute(
+        await self.async_execute(
             "/system/package/update", "check-for-updates", None, None, {"duration": 10}
         )
-        self.ds["fw-update"] = parse_api(
+        self.ds["fw-update"] = await self.async_parse_query(
+            "/system/package/update",
             data=self.ds["fw-update"],
-            source=self.api.query("/system/package/update"),
             vals=[
                 {"name": "status"},
                 {"name": "channel", "default": "unknown"},
@@ -1618,130 +2665,62 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 )
 
     # ---------------------------
-    #   get_ups
+    #   async_get_ups
     # ---------------------------
-    def get_ups(self) -> None:
+    async def async_get_ups(self) -> None:
         """Get UPS info from Mikrotik"""
-        self.ds["ups"] = parse_api(
-            data=self.ds["ups"],
-            source=self.api.query("/system/ups"),
-            vals=[
-                {"name": "name", "default": "unknown"},
-                {"name": "offline-time", "default": "unknown"},
-                {"name": "min-runtime", "default": "unknown"},
-                {"name": "alarm-setting", "default": "unknown"},
-                {"name": "model", "default": "unknown"},
-                {"name": "serial", "default": "unknown"},
-                {"name": "manufacture-date", "default": "unknown"},
-                {"name": "nominal-battery-voltage", "default": "unknown"},
-                {
-                    "name": "enabled",
-                    "source": "disabled",
-                    "type": "bool",
-                    "reverse": True,
-                },
-            ],
-            ensure_vals=[
-                {"name": "on-line", "type": "bool"},
-                {"name": "runtime-left", "default": "unknown"},
-                {"name": "battery-charge", "default": 0},
-                {"name": "battery-voltage", "default": 0.0},
-                {"name": "line-voltage", "default": 0},
-                {"name": "load", "default": 0},
-                {"name": "hid-self-test", "default": "unknown"},
-            ],
+        self.ds["ups"] = await self.async_parse_query(
+            "/system/ups", data=self.ds["ups"], **UPS_SPEC
         )
         if self.ds["ups"]["enabled"]:
-            self.ds["ups"] = parse_api(
+            self.ds["ups"] = await self.async_parse_query(
+                "/system/ups",
+                command="monitor",
+                args={".id": 0, "once": True},
                 data=self.ds["ups"],
-                source=self.api.query(
-                    "/system/ups",
-                    command="monitor",
-                    args={".id": 0, "once": True},
-                ),
-                vals=[
-                    {"name": "on-line", "type": "bool"},
-                    {"name": "runtime-left", "default": 0},
-                    {"name": "battery-charge", "default": 0},
-                    {"name": "battery-voltage", "default": 0.0},
-                    {"name": "line-voltage", "default": 0},
-                    {"name": "load", "default": 0},
-                    {"name": "hid-self-test", "default": "unknown"},
-                ],
+                **UPS_MONITOR_SPEC,
             )
 
     # ---------------------------
-    #   get_gps
+    #   async_get_gps
     # ---------------------------
-    def get_gps(self) -> None:
+    async def async_get_gps(self) -> None:
         """Get GPS data from Mikrotik"""
-        self.ds["gps"] = parse_api(
+        self.ds["gps"] = await self.async_parse_query(
+            "/system/gps",
+            command="monitor",
+            args={"once": True},
             data=self.ds["gps"],
-            source=self.api.query(
-                "/system/gps",
-                command="monitor",
-                args={"once": True},
-            ),
-            vals=[
-                {"name": "valid", "type": "bool"},
-                {"name": "latitude", "default": "unknown"},
-                {"name": "longitude", "default": "unknown"},
-                {"name": "altitude", "default": "unknown"},
-                {"name": "speed", "default": "unknown"},
-                {"name": "destination-bearing", "default": "unknown"},
-                {"name": "true-bearing", "default": "unknown"},
-                {"name": "magnetic-bearing", "default": "unknown"},
-                {"name": "satellites", "default": 0},
-                {"name": "fix-quality", "default": 0},
-                {"name": "horizontal-dilution", "default": "unknown"},
-            ],
+            **GPS_SPEC,
         )
 
     # ---------------------------
-    #   get_script
+    #   async_get_script
     # ---------------------------
-    def get_script(self) -> None:
+    async def async_get_script(self) -> None:
         """Get list of all scripts from Mikrotik"""
-        self.ds["script"] = parse_api(
-            data=self.ds["script"],
-            source=self.api.query("/system/script"),
-            key="name",
-            vals=[
-                {"name": "name"},
-                {"name": "last-started", "default": "unknown"},
-                {"name": "run-count", "default": "unknown"},
-            ],
+        self.ds["script"] = await self.async_parse_query(
+            "/system/script", data_path="script", **SCRIPT_SPEC
         )
 
     # ---------------------------
-    #   get_environment
+    #   async_get_environment
     # ---------------------------
-    def get_environment(self) -> None:
+    async def async_get_environment(self) -> None:
         """Get list of all environment variables from Mikrotik"""
-        self.ds["environment"] = parse_api(
+        self.ds["environment"] = await self.async_parse_query(
+            "/system/script/environment",
             data=self.ds["environment"],
-            source=self.api.query("/system/script/environment"),
-            key="name",
-            vals=[
-                {"name": "name"},
-                {"name": "value"},
-            ],
+            **ENVIRONMENT_SPEC,
         )
 
     # ---------------------------
-    #   get_captive
+    #   async_get_captive
     # ---------------------------
-    def get_captive(self) -> None:
+    async def async_get_captive(self) -> None:
         """Get list of all environment variables from Mikrotik"""
-        self.ds["hostspot_host"] = parse_api(
-            data={},
-            source=self.api.query("/ip/hotspot/host"),
-            key="mac-address",
-            vals=[
-                {"name": "mac-address"},
-                {"name": "authorized", "type": "bool"},
-                {"name": "bypassed", "type": "bool"},
-            ],
+        self.ds["hostspot_host"] = await self.async_parse_query(
+            "/ip/hotspot/host", data={}, **HOTSPOT_HOST_SPEC
         )
 
         auth_hosts = sum(
@@ -1752,34 +2731,12 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         self.ds["resource"]["captive_authorized"] = auth_hosts
 
     # ---------------------------
-    #   get_queue
+    #   async_get_queue
     # ---------------------------
-    def get_queue(self) -> None:
+    async def async_get_queue(self) -> None:
         """Get Queue data from Mikrotik"""
-        self.ds["queue"] = parse_api(
-            data=self.ds["queue"],
-            source=self.api.query("/queue/simple"),
-            key="name",
-            vals=[
-                {"name": ".id"},
-                {"name": "name", "default": "unknown"},
-                {"name": "target", "default": "unknown"},
-                {"name": "rate", "default": "0/0"},
-                {"name": "max-limit", "default": "0/0"},
-                {"name": "limit-at", "default": "0/0"},
-                {"name": "burst-limit", "default": "0/0"},
-                {"name": "burst-threshold", "default": "0/0"},
-                {"name": "burst-time", "default": "0s/0s"},
-                {"name": "packet-marks", "default": "none"},
-                {"name": "parent", "default": "none"},
-                {"name": "comment"},
-                {
-                    "name": "enabled",
-                    "source": "disabled",
-                    "type": "bool",
-                    "reverse": True,
-                },
-            ],
+        self.ds["queue"] = await self.async_parse_query(
+            "/queue/simple", data_path="queue", **QUEUE_SPEC
         )
 
         for uid, vals in self.ds["queue"].items():
@@ -1830,170 +2787,109 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             self.ds["queue"][uid]["download-burst-time"] = download_burst_time
 
     # ---------------------------
-    #   get_arp
+    #   async_get_arp
     # ---------------------------
-    def get_arp(self) -> None:
+    async def async_get_arp(self) -> None:
         """Get ARP data from Mikrotik"""
-        self.ds["arp"] = parse_api(
-            data=self.ds["arp"],
-            source=self.api.query("/ip/arp"),
-            key="mac-address",
-            vals=[{"name": "mac-address"}, {"name": "address"}, {"name": "interface"}],
-            ensure_vals=[{"name": "bridge", "default": ""}],
+        self.ds["arp"] = await self.async_parse_query(
+            "/ip/arp", data_path="arp", **ARP_SPEC
         )
+        self.process_arp(list(self.ds["arp"]))
 
-        for uid, vals in self.ds["arp"].items():
+    # ---------------------------
+    #   process_arp
+    # ---------------------------
+    def process_arp(self, uids) -> None:
+        """Map bridged ARP entries to ports and remove DHCP client entries"""
+        for uid in uids:
+            vals = self.ds["arp"][uid]
             if vals["interface"] in self.ds["bridge"] and uid in self.ds["bridge_host"]:
-                self.ds["arp"][uid]["bridge"] = vals["interface"]
-                self.ds["arp"][uid]["interface"] = self.ds["bridge_host"][uid][
-                    "interface"
-                ]
-
-        if self.ds["dhcp-client"]:
-            to_remove = [
-                uid
-                for uid, vals in self.ds["arp"].items()
-                if vals["interface"] in self.ds["dhcp-client"]
-            ]
+                vals["bridge"] = vals["interface"]
+                vals["interface"] = self.ds["bridge_host"][uid]["interface"]
 
-            for uid in to_remove:
+            if vals["interface"] in self.ds["dhcp-client"]:
                 self.ds["arp"].pop(uid)
 
     # ---------------------------
-    #   get_dns
+    #   async_get_dns
     # ---------------------------
-    def get_dns(self) -> None:
+    async def async_get_dns(self) -> None:
         """Get static DNS data from Mikrotik"""
-        self.ds["dns"] = parse_api(
-            data=self.ds["dns"],
-            source=self.api.query("/ip/dns/static"),
-            key="name",
-            vals=[{"name": "name"}, {"name": "address"}, {"name": "comment"}],
+        self.ds["dns"] = await self.async_parse_query(
+            "/ip/dns/static", data_path="dns", **DNS_SPEC
         )
 
         for uid, vals in self.ds["dns"].items():
             self.ds["dns"][uid]["comment"] = str(self.ds["dns"][uid]["comment"])
 
     # ---------------------------
-    #   get_dhcp
+    #   async_get_dhcp
     # ---------------------------
-    def get_dhcp(self) -> None:
+    async def async_get_dhcp(self) -> None:
         """Get DHCP data from Mikrotik"""
-        self.ds["dhcp"] = parse_api(
-            data=self.ds["dhcp"],
-            source=self.api.query("/ip/dhcp-server/lease"),
-            key="mac-address",
-            vals=[
-                {"name": "mac-address"},
-                {"name": "active-mac-address", "default": "unknown"},
-                {"name": "address", "default": "unknown"},
-                {"name": "active-address", "default": "unknown"},
-                {"name": "host-name", "default": "unknown"},
-                {"name": "status", "default": "unknown"},
-                {"name": "last-seen", "default": "unknown"},
-                {"name": "server", "default": "unknown"},
-                {"name": "comment", "default": ""},
-                {
-                    "name": "enabled",
-                    "source": "disabled",
-                    "type": "bool",
-                    "reverse": True,
-                },
-            ],
-            ensure_vals=[{"name": "interface", "default": "unknown"}],
+        self.ds["dhcp"] = await self.async_parse_query(
+            "/ip/dhcp-server/lease", data_path="dhcp", **DHCP_SPEC
         )
+        await self.async_process_dhcp(list(self.ds["dhcp"]))
 
-        dhcpserver_query = False
-        for uid in self.ds["dhcp"]:
-            self.ds["dhcp"][uid]["comment"] = str(self.ds["dhcp"][uid]["comment"])
+    # ---------------------------
+    #   async_process_dhcp
+    # ---------------------------
+    async def async_process_dhcp(self, uids) -> None:
+        """Fix DHCP lease addresses and assign interfaces"""
+        if any(
+            self.ds["dhcp"][uid]["server"] not in self.ds["dhcp-server"] for uid in uids
+        ):
+            await self.async_get_dhcp_server()
 
-            # is_valid_ip
-            if self.ds["dhcp"][uid]["address"] != "unknown":
-                if not is_valid_ip(self.ds["dhcp"][uid]["address"]):
-                    self.ds["dhcp"][uid]["address"] = "unknown"
+        for uid in uids:
+            vals = self.ds["dhcp"][uid]
+            vals["comment"] = str(vals["comment"])
 
-                if self.ds["dhcp"][uid]["active-address"] not in [
-                    self.ds["dhcp"][uid]["address"],
-                    "unknown",
-                ]:
-                    self.ds["dhcp"][uid]["address"] = self.ds["dhcp"][uid][
-                        "active-address"
-                    ]
+            # is_valid_ip
+            if vals["address"] != "unknown":
+                if not is_valid_ip(vals["address"]):
+                    vals["address"] = "unknown"
 
-                if (
-                    self.ds["dhcp"][uid]["mac-address"]
-                    != self.ds["dhcp"][uid]["active-mac-address"]
-                    != "unknown"
-                ):
-                    self.ds["dhcp"][uid]["mac-address"] = self.ds["dhcp"][uid][
-                        "active-mac-address"
-                    ]
+                if vals["active-address"] not in [vals["address"], "unknown"]:
+                    vals["address"] = vals["active-address"]
 
-            if (
-                not dhcpserver_query
-                and self.ds["dhcp"][uid]["server"] not in self.ds["dhcp-server"]
-            ):
-                self.get_dhcp_server()
-                dhcpserver_query = True
+                if vals["mac-address"] != vals["active-mac-address"] != "unknown":
+                    vals["mac-address"] = vals["active-mac-address"]
 
-            if self.ds["dhcp"][uid]["server"] in self.ds["dhcp-server"]:
-                self.ds["dhcp"][uid]["interface"] = self.ds["dhcp-server"][
-                    self.ds["dhcp"][uid]["server"]
-                ]["interface"]
+            if vals["server"] in self.ds["dhcp-server"]:
+                vals["interface"] = self.ds["dhcp-server"][vals["server"]]["interface"]
             elif uid in self.ds["arp"]:
                 if self.ds["arp"][uid]["bridge"] != "unknown":
-                    self.ds["dhcp"][uid]["interface"] = self.ds["arp"][uid]["bridge"]
+                    vals["interface"] = self.ds["arp"][uid]["bridge"]
                 else:
-                    self.ds["dhcp"][uid]["interface"] = self.ds["arp"][uid]["interface"]
+                    vals["interface"] = self.ds["arp"][uid]["interface"]
 
     # ---------------------------
-    #   get_dhcp_server
+    #   async_get_dhcp_server
     # ---------------------------
-    def get_dhcp_server(self) -> None:
+    async def async_get_dhcp_server(self) -> None:
         """Get DHCP server data from Mikrotik"""
-        self.ds["dhcp-server"] = parse_api(
-            data=self.ds["dhcp-server"],
-            source=self.api.query("/ip/dhcp-server"),
-            key="name",
-            vals=[
-                {"name": "name"},
-                {"name": "interface", "default": "unknown"},
-            ],
+        self.ds["dhcp-server"] = await self.async_parse_query(
+            "/ip/dhcp-server", data_path="dhcp-server", **DHCP_SERVER_SPEC
         )
 
     # ---------------------------
-    #   get_dhcp_client
+    #   async_get_dhcp_client
     # ---------------------------
-    def get_dhcp_client(self) -> None:
+    async def async_get_dhcp_client(self) -> None:
         """Get DHCP client data from Mikrotik"""
-        self.ds["dhcp-client"] = parse_api(
-            data=self.ds["dhcp-client"],
-            source=self.api.query("/ip/dhcp-client"),
-            key="interface",
-            vals=[
-                {"name": "interface", "default": "unknown"},
-                {"name": "status", "default": "unknown"},
-                {"name": "address", "default": "unknown"},
-            ],
+        self.ds["dhcp-client"] = await self.async_parse_query(
+            "/ip/dhcp-client", data_path="dhcp-client", **DHCP_CLIENT_SPEC
         )
 
     # ---------------------------
-    #   get_dhcp_network
+    #   async_get_dhcp_network
     # ---------------------------
-    def get_dhcp_network(self) -> None:
+    async def async_get_dhcp_network(self) -> None:
         """Get DHCP network data from Mikrotik"""
-        self.ds["dhcp-network"] = parse_api(
-            data=self.ds["dhcp-network"],
-            source=self.api.query("/ip/dhcp-server/network"),
-            key="address",
-            vals=[
-                {"name": "address"},
-                {"name": "gateway", "default": ""},
-                {"name": "netmask", "default": ""},
-                {"name": "dns-server", "default": ""},
-                {"name": "domain", "default": ""},
-            ],
-            ensure_vals=[{"name": "address"}, {"name": "IPv4Network", "default": ""}],
+        self.ds["dhcp-network"] = await self.async_parse_query(
+            "/ip/dhcp-server/network", data_path="dhcp-network", **DHCP_NETWORK_SPEC
         )
 
         for uid, vals in self.ds["dhcp-network"].items():
@@ -2003,9 +2899,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 )
 
     # ---------------------------
-    #   get_capsman_hosts
+    #   async_get_capsman_hosts
     # ---------------------------
-    def get_capsman_hosts(self) -> None:
+    async def async_get_capsman_hosts(self) -> None:
         """Get CAPS-MAN hosts data from Mikrotik"""
 
         if self.major_fw_version > 7 or (
@@ -2016,53 +2912,18 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         else:
             registration_path = "/caps-man/registration-table"
 
-        self.ds["capsman_hosts"] = parse_api(
-            data={},
-            source=self.api.query(registration_path),
-            key="mac-address",
-            vals=[
-                {"name": "mac-address"},
-                {"name": "interface", "default": "unknown"},
-                {"name": "ssid", "default": "unknown"},
-            ],
+        self.ds["capsman_hosts"] = await self.async_parse_query(
+            registration_path, data={}, **CAPSMAN_HOSTS_SPEC
         )
 
     # ---------------------------
-    #   get_wireless
+    #   async_get_wireless
     # ---------------------------
-    def get_wireless(self) -> None:
+    async def async_get_wireless(self) -> None:
         """Get wireless data from Mikrotik"""
 
-        self.ds["wireless"] = parse_api(
-            data=self.ds["wireless"],
-            source=self.api.query(f"/interface/{self._wifimodule}"),
-            key="name",
-            vals=[
-                {"name": "master-interface", "default": ""},
-                {"name": "mac-address", "default": "unknown"},
-                {"name": "ssid", "default": "unknown"},
-                {"name": "mode", "default": "unknown"},
-                {"name": "radio-name", "default": "unknown"},
-                {"name": "interface-type", "default": "unknown"},
-                {"name": "country", "default": "unknown"},
-                {"name": "installation", "default": "unknown"},
-                {"name": "antenna-gain", "default": "unknown"},
-                {"name": "frequency", "default": "unknown"},
-                {"name": "band", "default": "unknown"},
-                {"name": "channel-width", "default": "unknown"},
-                {"name": "secondary-frequency", "default": "unknown"},
-                {"name": "wireless-protocol", "default": "unknown"},
-                {"name": "rate-set", "default": "unknown"},
-                {"name": "distance", "default": "unknown"},
-                {"name": "tx-power-mode", "default": "unknown"},
-                {"name": "vlan-id", "default": "unknown"},
-                {"name": "wds-mode", "default": "unknown"},
-                {"name": "wds-default-bridge", "default": "unknown"},
-                {"name": "bridge-mode", "default": "unknown"},
-                {"name": "hide-ssid", "type": "bool"},
-                {"name": "running", "type": "bool"},
-                {"name": "disabled", "type": "bool"},
-            ],
+        self.ds["wireless"] = await self.async_parse_query(
+            f"/interface/{self._wifimodule}", data_path="wireless", **WIRELESS_SPEC
         )
 
         for uid in self.ds["wireless"]:
@@ -2078,24 +2939,14 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                     self.ds["interface"][uid][tmp] = self.ds["wireless"][uid][tmp]
 
     # ---------------------------
-    #   get_wireless_hosts
+    #   async_get_wireless_hosts
     # ---------------------------
-    def get_wireless_hosts(self) -> None:
+    async def async_get_wireless_hosts(self) -> None:
         """Get wireless hosts data from Mikrotik"""
-        self.ds["wireless_hosts"] = parse_api(
+        self.ds["wireless_hosts"] = await self.async_parse_query(
+            f"/interface/{self._wifimodule}/registration-table",
             data={},
-            source=self.api.query(f"/interface/{self._wifimodule}/registration-table"),
-            key="mac-address",
-            vals=[
-                {"name": "mac-address"},
-                {"name": "interface", "default": "unknown"},
-                {"name": "ap", "type": "bool"},
-                {"name": "uptime"},
-                {"name": "signal-strength"},
-                {"name": "tx-ccq"},
-                {"name": "tx-rate"},
-                {"name": "rx-rate"},
-            ],
+            **WIRELESS_HOSTS_SPEC,
         )
 
     # ---------------------------
@@ -2103,20 +2954,23 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     # ---------------------------
     async def async_process_host(self) -> None:
         """Get host tracking data"""
+        hosts = self.ds["host"]
+
         # Add hosts from CAPS-MAN
         capsman_detected = {}
         if self.support_capsman:
             for uid, vals in self.ds["capsman_hosts"].items():
-                if uid not in self.ds["host"]:
-                    self.ds["host"][uid] = {"source": "capsman"}
-                elif self.ds["host"][uid]["source"] != "capsman":
+                if uid not in hosts:
+                    hosts[uid] = HostRecord({"source": "capsman"})
+                elif hosts[uid].source != "capsman":
                     continue
 
                 capsman_detected[uid] = True
-                self.ds["host"][uid]["available"] = True
-                self.ds["host"][uid]["last-seen"] = utcnow()
+                host = hosts[uid]
+                host.available = True
+                host.last_seen = utcnow()
                 for key in ["mac-address", "interface"]:
-                    self.ds["host"][uid][key] = vals[key]
+                    host[key] = vals[key]
 
         # Add hosts from wireless
         wireless_detected = {}
@@ -2125,14 +2979,15 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 if vals["ap"]:
                     continue
 
-                if uid not in self.ds["host"]:
-                    self.ds["host"][uid] = {"source": "wireless"}
-                elif self.ds["host"][uid]["source"] != "wireless":
+                if uid not in hosts:
+                    hosts[uid] = HostRecord({"source": "wireless"})
+                elif hosts[uid].source != "wireless":
                     continue
 
                 wireless_detected[uid] = True
-                self.ds["host"][uid]["available"] = True
-                self.ds["host"][uid]["last-seen"] = utcnow()
+                host = hosts[uid]
+                host.available = True
+                host.last_seen = utcnow()
                 for key in [
                     "mac-address",
                     "interface",
@@ -2141,229 +2996,248 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                     "tx-rate",
                     "rx-rate",
                 ]:
-                    self.ds["host"][uid][key] = vals[key]
+                    host[key] = vals[key]
 
         # Add hosts from DHCP
         for uid, vals in self.ds["dhcp"].items():
             if not vals["enabled"]:
                 continue
 
-            if uid not in self.ds["host"]:
-                self.ds["host"][uid] = {"source": "dhcp"}
-            elif self.ds["host"][uid]["source"] != "dhcp":
+            if uid not in hosts:
+                hosts[uid] = HostRecord({"source": "dhcp"})
+            elif hosts[uid].source != "dhcp":
                 continue
 
+            host = hosts[uid]
             for key in ["address", "mac-address", "interface"]:
-                self.ds["host"][uid][key] = vals[key]
+                host[key] = vals[key]
 
         # Add hosts from ARP
         for uid, vals in self.ds["arp"].items():
-            if uid not in self.ds["host"]:
-                self.ds["host"][uid] = {"source": "arp"}
-            elif self.ds["host"][uid]["source"] != "arp":
+            if uid not in hosts:
+                hosts[uid] = HostRecord({"source": "arp"})
+            elif hosts[uid].source != "arp":
                 continue
 
+            host = hosts[uid]
             for key in ["address", "mac-address", "interface"]:
-                self.ds["host"][uid][key] = vals[key]
+                host[key] = vals[key]
 
         # Add restored hosts from hass registry
         if not self.host_hass_recovered:
             self.host_hass_recovered = True
             for uid in self.ds["host_hass"]:
-                if uid not in self.ds["host"]:
-                    self.ds["host"][uid] = {"source": "restored"}
-                    self.ds["host"][uid]["mac-address"] = uid
-                    self.ds["host"][uid]["host-name"] = self.ds["host_hass"][uid]
+                if uid not in hosts:
+                    hosts[uid] = HostRecord(
+                        {
+                            "source": "restored",
+                            "mac-address": uid,
+                            "host-name": self.ds["host_hass"][uid],
+                        }
+                    )
 
-        for uid, vals in self.ds["host"].items():
-            # Add missing default values
-            for key, default in zip(
-                [
-                    "address",
-                    "mac-address",
-                    "interface",
-                    "host-name",
-                    "manufacturer",
-                    "last-seen",
-                    "available",
-                ],
-                ["unknown", "unknown", "unknown", "unknown", "detect", False, False],
-            ):
-                if key not in self.ds["host"][uid]:
-                    self.ds["host"][uid][key] = default
+        # Remove hosts no longer reported by any source
+        seen = {*capsman_detected, *wireless_detected, *self.ds["arp"]}
+        seen.update(uid for uid, vals in self.ds["dhcp"].items() if vals["enabled"])
+        seen.update(uid for uid, host in hosts.items() if host.available)
+        if removed := self.expire_rows("host", seen):
+            for uid in removed:
+                self.ds["client_traffic"].pop(uid, None)
+
+            self.accounting_ip_mac = {
+                address: uid
+                for address, uid in self.accounting_ip_mac.items()
+                if uid in self.ds["client_traffic"]
+            }
 
         # if not self.host_tracking_initialized:
         #     await self.async_ping_tracked_hosts()
 
+        # Index static DNS by address and DHCP names by MAC
+        dns_index = {}
+        for dns_vals in self.ds["dns"].values():
+            dns_index.setdefault(dns_vals["address"], dns_vals)
+
+        dhcp_names = {
+            uid: (vals["comment"].split("#", 1)[0], vals["host-name"])
+            for uid, vals in self.ds["dhcp"].items()
+            if vals["enabled"]
+        }
+
         # Process hosts
-        self.ds["resource"]["clients_wired"] = 0
-        self.ds["resource"]["clients_wireless"] = 0
-        for uid, vals in self.ds["host"].items():
+        clients_wired = 0
+        clients_wireless = 0
+        for uid, host in hosts.items():
             # Captive portal data
             if self.option_sensor_client_captive:
                 if uid in self.ds["hostspot_host"]:
-                    self.ds["host"][uid]["authorized"] = self.ds["hostspot_host"][uid][
-                        "authorized"
-                    ]
-                    self.ds["host"][uid]["bypassed"] = self.ds["hostspot_host"][uid][
-                        "bypassed"
-                    ]
-                elif "authorized" in self.ds["host"][uid]:
-                    del self.ds["host"][uid]["authorized"]
-                    del self.ds["host"][uid]["bypassed"]
+                    host.authorized = self.ds["hostspot_host"][uid]["authorized"]
+                    host.bypassed = self.ds["hostspot_host"][uid]["bypassed"]
+                elif "authorized" in host:
+                    del host["authorized"]
+                    del host["bypassed"]
 
             # CAPS-MAN availability
-            if vals["source"] == "capsman" and uid not in capsman_detected:
-                self.ds["host"][uid]["available"] = False
+            if host.source == "capsman" and uid not in capsman_detected:
+                host.available = False
 
             # Wireless availability
-            if vals["source"] == "wireless" and uid not in wireless_detected:
-                self.ds["host"][uid]["available"] = False
+            if host.source == "wireless" and uid not in wireless_detected:
+                host.available = False
 
             # Update IP and interface (DHCP/returned host)
-            if (
-                uid in self.ds["dhcp"]
-                and self.ds["dhcp"][uid]["enabled"]
-                and "." in self.ds["dhcp"][uid]["address"]
-            ):
-                if self.ds["dhcp"][uid]["address"] != self.ds["host"][uid]["address"]:
-                    self.ds["host"][uid]["address"] = self.ds["dhcp"][uid]["address"]
-                    if vals["source"] not in ["capsman", "wireless"]:
-                        self.ds["host"][uid]["source"] = "dhcp"
-                        self.ds["host"][uid]["interface"] = self.ds["dhcp"][uid][
-                            "interface"
-                        ]
-
-            elif (
-                uid in self.ds["arp"]
-                and "." in self.ds["arp"][uid]["address"]
-                and self.ds["arp"][uid]["address"] != self.ds["host"][uid]["address"]
-            ):
-                self.ds["host"][uid]["address"] = self.ds["arp"][uid]["address"]
-                if vals["source"] not in ["capsman", "wireless"]:
-                    self.ds["host"][uid]["source"] = "arp"
-                    self.ds["host"][uid]["interface"] = self.ds["arp"][uid]["interface"]
+            dhcp = self.ds["dhcp"].get(uid)
+            arp = self.ds["arp"].get(uid)
+            if dhcp and dhcp["enabled"] and "." in dhcp["address"]:
+                if dhcp["address"] != host.address:
+                    host.address = dhcp["address"]
+                    if host.source not in ["capsman", "wireless"]:
+                        host.source = "dhcp"
+                        host["interface"] = dhcp["interface"]
+
+            elif arp and "." in arp["address"] and arp["address"] != host.address:
+                host.address = arp["address"]
+                if host.source not in ["capsman", "wireless"]:
+                    host.source = "arp"
+                    host["interface"] = arp["interface"]
+
+            if host.host_name == "unknown":
+                dhcp_comment, dhcp_host_name = dhcp_names.get(uid, ("", "unknown"))
 
-            if vals["host-name"] == "unknown":
                 # Resolve hostname from static DNS
-                if vals["address"] != "unknown":
-                    for dns_uid, dns_vals in self.ds["dns"].items():
-                        if dns_vals["address"] == vals["address"]:
-                            if dns_vals["comment"].split("#", 1)[0] != "":
-                                self.ds["host"][uid]["host-name"] = dns_vals[
-                                    "comment"
-                                ].split("#", 1)[0]
-                            elif (
-                                uid in self.ds["dhcp"]
-                                and self.ds["dhcp"][uid]["enabled"]
-                                and self.ds["dhcp"][uid]["comment"].split("#", 1)[0]
-                                != ""
-                            ):
-                                # Override name if DHCP comment exists
-                                self.ds["host"][uid]["host-name"] = self.ds["dhcp"][
-                                    uid
-                                ]["comment"].split("#", 1)[0]
-                            else:
-                                self.ds["host"][uid]["host-name"] = dns_vals[
-                                    "name"
-                                ].split(".")[0]
-                            break
-
-                if self.ds["host"][uid]["host-name"] == "unknown":
+                if host.address != "unknown" and host.address in dns_index:
+                    dns_vals = dns_index[host.address]
+                    dns_comment = dns_vals["comment"].split("#", 1)[0]
+                    if dns_comment != "":
+                        host.host_name = dns_comment
+                    elif dhcp_comment != "":
+                        # Override name if DHCP comment exists
+                        host.host_name = dhcp_comment
+                    else:
+                        host.host_name = dns_vals["name"].split(".")[0]
+
+                if host.host_name == "unknown":
                     # Resolve hostname from DHCP comment
-                    if (
-                        uid in self.ds["dhcp"]
-                        and self.ds["dhcp"][uid]["enabled"]
-                        and self.ds["dhcp"][uid]["comment"].split("#", 1)[0] != ""
-                    ):
-                        self.ds["host"][uid]["host-name"] = self.ds["dhcp"][uid][
-                            "comment"
-                        ].split("#", 1)[0]
+                    if dhcp_comment != "":
+                        host.host_name = dhcp_comment
                     # Resolve hostname from DHCP hostname
-                    elif (
-                        uid in self.ds["dhcp"]
-                        and self.ds["dhcp"][uid]["enabled"]
-                        and self.ds["dhcp"][uid]["host-name"] != "unknown"
-                    ):
-                        self.ds["host"][uid]["host-name"] = self.ds["dhcp"][uid][
-                            "host-name"
-                        ]
+                    elif dhcp_host_name != "unknown":
+                        host.host_name = dhcp_host_name
                     # Fallback to mac address for hostname
                     else:
-                        self.ds["host"][uid]["host-name"] = uid
+                        host.host_name = uid
 
             # Resolve manufacturer
-            if vals["manufacturer"] == "detect" and vals["mac-address"] != "unknown":
+            if host.manufacturer == "detect" and host.mac_address != "unknown":
                 try:
-                    self.ds["host"][uid]["manufacturer"] = (
-                        await self.async_mac_lookup.lookup(vals["mac-address"])
+                    host["manufacturer"] = await self.async_mac_lookup.lookup(
+                        host.mac_address
                     )
                 except Exception:
-                    self.ds["host"][uid]["manufacturer"] = ""
+                    host.manufacturer = ""
 
-            if vals["manufacturer"] == "detect":
-                self.ds["host"][uid]["manufacturer"] = ""
+            if host.manufacturer == "detect":
+                host.manufacturer = ""
 
             # Count hosts
-            if self.ds["host"][uid]["available"]:
-                if vals["source"] in ["capsman", "wireless"]:
-                    self.ds["resource"]["clients_wireless"] += 1
+            if host.available:
+                if host.source in ["capsman", "wireless"]:
+                    clients_wireless += 1
                 else:
-                    self.ds["resource"]["clients_wired"] += 1
+                    clients_wired += 1
+
+        self.ds["resource"]["clients_wired"] = clients_wired
+        self.ds["resource"]["clients_wireless"] = clients_wireless
 
     # ---------------------------
-    #   process_accounting
+    #   get_host_passive_age
     # ---------------------------
-    def process_accounting(self) -> None:
+    def get_host_passive_age(self, uid):
+        """Seconds since host was last seen in ARP, DHCP or bridge data"""
+        ages = []
+        if (
+            uid in self.ds["arp"]
+            and self.ds["arp"][uid]["status"] in ARP_REACHABLE_STATUS
+        ):
+            ages.append(0)
+
+        if uid in self.ds["dhcp"] and self.ds["dhcp"][uid]["status"] == "bound":
+            ages.append(parse_duration(self.ds["dhcp"][uid]["last-seen"]))
+
+        if uid in self.ds["bridge_host"]:
+            ages.append(parse_duration(self.ds["bridge_host"][uid]["age"]))
+
+        return min((age for age in ages if age is not None), default=None)
+
+    # ---------------------------
+    #   update_host_passive
+    # ---------------------------
+    def update_host_passive(self, uid) -> None:
+        """Update host availability from already collected data without ping"""
+        age = self.get_host_passive_age(uid)
+        vals = self.ds["host"][uid]
+        if age is None:
+            vals["available"] = False
+            return
+
+        last_seen = utcnow() - timedelta(seconds=age)
+        if not vals["last-seen"] or last_seen > vals["last-seen"]:
+            vals["last-seen"] = last_seen
+
+        vals["available"] = (
+            utcnow() - vals["last-seen"] < self.option_track_network_hosts_timeout
+        )
+
+    # ---------------------------
+    #   async_process_accounting
+    # ---------------------------
+    async def async_process_accounting(self) -> None:
         """Get Accounting data from Mikrotik"""
         # Check if accounting and account-local-traffic is enabled
         (
             accounting_enabled,
             local_traffic_enabled,
-        ) = self.api.is_accounting_and_local_traffic_enabled()
+        ) = await self.api.is_accounting_and_local_traffic_enabled()
 
         # Build missing hosts from main hosts dict
         for uid, vals in self.ds["host"].items():
             if uid not in self.ds["client_traffic"]:
-                self.ds["client_traffic"][uid] = {
-                    "address": vals["address"],
-                    "mac-address": vals["mac-address"],
-                    "host-name": vals["host-name"],
-                    "available": False,
-                    "local_accounting": False,
-                }
+                self.ds["client_traffic"][uid] = ClientTrafficRecord(
+                    {
+                        "address": vals["address"],
+                        "mac-address": vals["mac-address"],
+                        "host-name": vals["host-name"],
+                        "available": False,
+                        "local_accounting": False,
+                    }
+                )
+                self.accounting_ip_mac.setdefault(vals["address"], uid)
 
         _LOGGER.debug(
             f"Working with {len(self.ds['client_traffic'])} accounting devices"
         )
 
         # Build temp accounting values dict with ip address as key
-        tmp_accounting_values = {
-            vals["address"]: {
-                "wan-tx": 0,
-                "wan-rx": 0,
-                "lan-tx": 0,
-                "lan-rx": 0,
-            }
-            for uid, vals in self.ds["client_traffic"].items()
-        }
+        aggregator = AccountingAggregator(
+            [vals["address"] for vals in self.ds["client_traffic"].values()],
+            self._get_local_networks(),
+        )
+        tmp_accounting_values = aggregator.totals
 
-        time_diff = self.api.take_client_traffic_snapshot(True)
+        time_diff = await self.api.take_client_traffic_snapshot(True)
         if time_diff:
-            accounting_data = parse_api(
-                data={},
-                source=self.api.query("/ip/accounting/snapshot"),
-                key=".id",
-                vals=[
-                    {"name": ".id"},
-                    {"name": "src-address"},
-                    {"name": "dst-address"},
-                    {"name": "bytes", "default": 0},
-                ],
-            )
+            # Rows are summed as they arrive, snapshot is never held in memory
+            if await self.api.stream(
+                "/ip/accounting/snapshot",
+                aggregator.feed,
+                proplist=["src-address", "dst-address", "bytes"],
+            ):
+                aggregator.flush()
+            else:
+                aggregator.clear()
 
-            threshold = self.api.query("/ip/accounting")[0].get("threshold")
-            entry_count = len(accounting_data)
+            threshold = (await self.api.query("/ip/accounting"))[0].get("threshold")
+            entry_count = aggregator.count
 
             if entry_count == threshold:
                 _LOGGER.warning(
@@ -2379,33 +3253,6 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                     " increasing the accounting threshold value in Mikrotik."
                 )
 
-            for item in accounting_data.values():
-                source_ip = str(item.get("src-address")).strip()
-                destination_ip = str(item.get("dst-address")).strip()
-                bits_count = int(str(item.get("bytes")).strip())
-
-                if self._address_part_of_local_network(
-                    source_ip
-                ) and self._address_part_of_local_network(destination_ip):
-                    # LAN TX/RX
-                    if source_ip in tmp_accounting_values:
-                        tmp_accounting_values[source_ip]["lan-tx"] += bits_count
-                    if destination_ip in tmp_accounting_values:
-                        tmp_accounting_values[destination_ip]["lan-rx"] += bits_count
-                elif self._address_part_of_local_network(
-                    source_ip
-                ) and not self._address_part_of_local_network(destination_ip):
-                    # WAN TX
-                    if source_ip in tmp_accounting_values:
-                        tmp_accounting_values[source_ip]["wan-tx"] += bits_count
-                elif (
-                    not self._address_part_of_local_network(source_ip)
-                    and self._address_part_of_local_network(destination_ip)
-                    and destination_ip in tmp_accounting_values
-                ):
-                    # WAN RX
-                    tmp_accounting_values[destination_ip]["wan-rx"] += bits_count
-
         # Calculate real throughput and transform it to appropriate unit
         # Also handle availability of accounting and local_accounting from Mikrotik
         for addr, vals in tmp_accounting_values.items():
@@ -2442,23 +3289,38 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             )
 
     # ---------------------------
-    #   _address_part_of_local_network
+    #   _get_local_networks
     # ---------------------------
-    def _address_part_of_local_network(self, address) -> bool:
-        address = ip_address(address)
-        for vals in self.ds["dhcp-network"].values():
-            if address in vals["IPv4Network"]:
-                return True
-        return False
+    def _get_local_networks(self) -> tuple:
+        """Get DHCP networks as sorted non-overlapping integer ranges"""
+        starts = []
+        ends = []
+        for start, end in sorted(
+            (int(vals["IPv4Network"][0]), int(vals["IPv4Network"][-1]))
+            for vals in self.ds["dhcp-network"].values()
+        ):
+            if ends and start <= ends[-1] + 1:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+
+        return starts, ends
 
     # ---------------------------
     #   _get_accounting_uid_by_ip
     # ---------------------------
     def _get_accounting_uid_by_ip(self, requested_ip):
+        uid = self.accounting_ip_mac.get(requested_ip)
+        if uid in self.ds["client_traffic"]:
+            return uid
+
+        # Rebuild map when client traffic entries changed
+        self.accounting_ip_mac = {}
         for mac, vals in self.ds["client_traffic"].items():
-            if vals.get("address") is requested_ip:
-                return mac
-        return None
+            self.accounting_ip_mac.setdefault(vals.get("address"), mac)
+
+        return self.accounting_ip_mac.get(requested_ip)
 
     # ---------------------------
     #   _get_iface_from_entry
@@ -2474,48 +3336,37 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         return uid
 
     # ---------------------------
-    #   process_kid_control
+    #   async_process_kid_control_devices
     # ---------------------------
-    def process_kid_control_devices(self) -> None:
+    async def async_process_kid_control_devices(self) -> None:
         """Get Kid Control Device data from Mikrotik"""
 
         # Build missing hosts from main hosts dict
         for uid, vals in self.ds["host"].items():
             if uid not in self.ds["client_traffic"]:
-                self.ds["client_traffic"][uid] = {
-                    "address": vals["address"],
-                    "mac-address": vals["mac-address"],
-                    "host-name": vals["host-name"],
-                    "previous-bytes-up": 0.0,
-                    "previous-bytes-down": 0.0,
-                    "tx": 0.0,
-                    "rx": 0.0,
-                    "available": False,
-                    "local_accounting": False,
-                }
+                self.ds["client_traffic"][uid] = ClientTrafficRecord(
+                    {
+                        "address": vals["address"],
+                        "mac-address": vals["mac-address"],
+                        "host-name": vals["host-name"],
+                        "previous-bytes-up": 0.0,
+                        "previous-bytes-down": 0.0,
+                        "tx": 0.0,
+                        "rx": 0.0,
+                        "available": False,
+                        "local_accounting": False,
+                    }
+                )
 
         _LOGGER.debug(
             f"Working with {len(self.ds['client_traffic'])} kid control devices"
         )
 
-        kid_control_devices_data = parse_api(
-            data={},
-            source=self.api.query("/ip/kid-control/device"),
-            key="mac-address",
-            vals=[
-                {"name": "mac-address"},
-                {"name": "bytes-down"},
-                {"name": "bytes-up"},
-                {
-                    "name": "enabled",
-                    "source": "disabled",
-                    "type": "bool",
-                    "reverse": True,
-                },
-            ],
+        kid_control_devices_data = await self.async_parse_query(
+            "/ip/kid-control/device", data={}, **KID_CONTROL_DEVICES_SPEC
         )
 
-        time_diff = self.api.take_client_traffic_snapshot(False)
+        time_diff = await self.api.take_client_traffic_snapshot(False)
 
         if not kid_control_devices_data:
             if "kid-control-devices" not in self.notified_flags:
@@ -2528,22 +3379,21 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             self.notified_flags.remove("kid-control-devices")
 
         for uid, vals in kid_control_devices_data.items():
-            if uid not in self.ds["client_traffic"]:
+            traffic = self.ds["client_traffic"].get(uid)
+            if traffic is None:
                 _LOGGER.debug(f"Skipping unknown device {uid}")
                 continue
 
-            self.ds["client_traffic"][uid]["available"] = vals["enabled"]
+            traffic.available = vals["enabled"]
 
             current_tx = vals["bytes-up"]
-            previous_tx = self.ds["client_traffic"][uid]["previous-bytes-up"]
             if time_diff:
-                delta_tx = max(0, current_tx - previous_tx)
-                self.ds["client_traffic"][uid]["tx"] = round(delta_tx / time_diff)
-            self.ds["client_traffic"][uid]["previous-bytes-up"] = current_tx
+                delta_tx = max(0, current_tx - traffic.previous_bytes_up)
+                traffic.tx = round(delta_tx / time_diff)
+            traffic.previous_bytes_up = current_tx
 
             current_rx = vals["bytes-down"]
-            previous_rx = self.ds["client_traffic"][uid]["previous-bytes-down"]
             if time_diff:
-                delta_rx = max(0, current_rx - previous_rx)
-                self.ds["client_traffic"][uid]["rx"] = round(delta_rx / time_diff)
-            self.ds["client_traffic"][uid]["previous-bytes-down"] = current_rx
+                delta_rx = max(0, current_rx - traffic.previous_bytes_down)
+                traffic.rx = round(delta_rx / time_diff)
+            traffic.previous_bytes_down = current_rx
@@ -13,7 +13,7 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     data_coordinator = hass.data[DOMAIN][config_entry.entry_id].data_coordinator
-    tracker_coordinator = hass.data[DOMAIN][config_entry.entry_id].data_coordinator
+    tracker_coordinator = hass.data[DOMAIN][config_entry.entry_id].tracker_coordinator
 
     return {
         "entry": {
@@ -22,4 +22,9 @@ async def async_get_config_entry_diagnostics(
         },
         "data": async_redact_data(data_coordinator.data, TO_REDACT),
         "tracker": async_redact_data(tracker_coordinator.data, TO_REDACT),
+        "stats": {
+            "stages": data_coordinator.stats.summary(),
+            "api": data_coordinator.api.stats.summary(),
+            "tracker_api": tracker_coordinator.api.stats.summary(),
+        },
     }
@@ -184,13 +184,35 @@ class MikrotikEntity(CoordinatorEntity[_MikrotikCoordinatorT], Entity):
 
         self._attr_name = self.custom_name
 
+    async def async_added_to_hass(self) -> None:
+        """Register row listener when entity is added to hass."""
+        await super().async_added_to_hass()
+        if self._uid:
+            self.async_on_remove(
+                self.coordinator.async_add_row_listener(
+                    self.entity_description.data_path,
+                    self._uid,
+                    self._handle_row_update,
+                )
+            )
+
     @callback
     def _handle_coordinator_update(self) -> None:
+        """Update entity only when its row changed in last refresh"""
+        if self._uid and not self.coordinator.row_changed(
+            self.entity_description.data_path, self._uid
+        ):
+            return
+
+        self._handle_row_update()
+
+    @callback
+    def _handle_row_update(self) -> None:
         self._data = self.coordinator.data[self.entity_description.data_path]
         if self._uid:
-            self._data = self.coordinator.data[self.entity_description.data_path][
-                self._uid
-            ]
+            self._data = self.coordinator.data[self.entity_description.data_path].get(
+                self._uid, self._data
+            )
         super()._handle_coordinator_update()
 
     @property
@@ -224,10 +246,16 @@ class MikrotikEntity(CoordinatorEntity[_MikrotikCoordinatorT], Entity):
         else:
             return f"{self._inst.lower()}-{self.entity_description.key}"
 
-    # @property
-    # def available(self) -> bool:
-    #     """Return if controller is available"""
-    #     return self.coordinator.connected()
+    @property
+    def available(self) -> bool:
+        """Return if entity row is still reported by Mikrotik"""
+        if not super().available:
+            return False
+
+        return (
+            not self._uid
+            or self._uid in self.coordinator.data[self.entity_description.data_path]
+        )
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -3,3 +3,28 @@
 
 class ApiEntryNotFound(Exception):
     """Api entry not found."""
+
+
+class ApiProtocolError(Exception):
+    """Api protocol error."""
+
+
+class ApiConnectionClosed(ApiProtocolError):
+    """Api connection closed."""
+
+
+class ApiFatalError(ApiProtocolError):
+    """Api returned !fatal."""
+
+
+class ApiTrapError(ApiProtocolError):
+    """Api returned !trap."""
+
+    def __init__(self, message, category=None):
+        """Initialize ApiTrapError."""
+        super().__init__(message)
+        self.message = message
+        self.category = category
+
+    def __str__(self):
+        return str(self.message).replace("\r\n", ",")
@@ -1,5 +1,9 @@
 """Helper functions for Mikrotik Router."""
 
+import re
+
+DURATION_UNITS = {"w": 604800, "d": 86400, "h": 3600, "m": 60, "s": 1, "ms": 0.001}
+
 
 # ---------------------------
 #   format_attribute
@@ -21,3 +25,35 @@ def format_value(res):
     res = res.replace("wireless", "Wireless")
     res = res.replace("restored", "Restored")
     return res
+
+
+# ---------------------------
+#   parse_duration
+# ---------------------------
+def parse_duration(value):
+    """Convert RouterOS duration to seconds, None if value is not a duration.
+
+    Accepts 1w2d3h4m5s, 500ms, 1d02:03:04 and 00:00:05 formats.
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+
+    if not isinstance(value, str) or not value:
+        return None
+
+    match = re.fullmatch(
+        r"((?:\d+(?:ms|[wdhms]))*)(?:(\d+):(\d+):(\d+)(?:\.\d+)?)?", value
+    )
+    if not match:
+        return None
+
+    seconds = 0
+    for number, unit in re.findall(r"(\d+)(ms|[wdhms])", match.group(1)):
+        seconds += int(number) * DURATION_UNITS[unit]
+
+    if match.group(2):
+        seconds += (
+            int(match.group(2)) * 3600 + int(match.group(3)) * 60 + int(match.group(4))
+        )
+
+    return seconds
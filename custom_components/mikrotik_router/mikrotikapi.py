@@ -1,16 +1,18 @@
 """Mikrotik API for Mikrotik Router."""
 
+import asyncio
 import logging
 import ssl
-from time import time
-from threading import Lock
+from time import monotonic, time
 from voluptuous import Optional
+from .apiprotocol import RouterOSConnection, compose_query_word, compose_word
+from .capture import ApiRecorder
 from .const import (
     DEFAULT_LOGIN_METHOD,
     DEFAULT_ENCODING,
 )
-
-import librouteros
+from .exceptions import ApiTrapError
+from .stats import StatsCollector
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,8 +43,8 @@ class MikrotikAPI:
         self._password = password
         self._login_method = login_method
         self._encoding = encoding
-        self._ssl_wrapper = None
-        self.lock = Lock()
+        self._ssl_context = None
+        self.lock = asyncio.Lock()
 
         self._connection = None
         self._connected = False
@@ -53,6 +55,10 @@ class MikrotikAPI:
         self.connection_error_reported = False
         self.client_traffic_last_run = None
         self.disable_health = False
+        self.query_unsupported = set()
+        self.stats = StatsCollector()
+        self.recorder = None
+        self.replay = None
 
         # Default ports
         if not self._port:
@@ -72,13 +78,18 @@ class MikrotikAPI:
     # ---------------------------
     #   connection_check
     # ---------------------------
-    def connection_check(self) -> bool:
+    async def connection_check(self) -> bool:
         """Check if mikrotik is connected"""
         if not self._connected or not self._connection:
+            if self.lock.locked():
+                # Wait for connect in progress
+                async with self.lock:
+                    return self.connected()
+
             if self._connection_epoch > time() - self._connection_retry_sec:
                 return False
 
-            if not self.connect():
+            if not await self.connect():
                 return False
 
         return True
@@ -101,52 +112,106 @@ class MikrotikAPI:
 
             self.connection_error_reported = True
 
+        if self._connection:
+            self._connection.close()
+
         self._reconnected = False
         self._connected = False
         self._connection = None
         self._connection_epoch = 0
 
     # ---------------------------
-    #   connect
+    #   close
     # ---------------------------
-    def connect(self) -> bool:
-        """Connect to Mikrotik device."""
-        self.error = ""
+    def close(self):
+        """Close connection to Mikrotik device without reporting an error."""
+        if self._connection:
+            self._connection.close()
+
         self._connected = False
-        self._connection_epoch = time()
+        self._connection = None
 
-        kwargs = {
-            "encoding": self._encoding,
-            "login_methods": self._login_method,
-            "port": self._port,
-        }
+    # ---------------------------
+    #   start_capture
+    # ---------------------------
+    def start_capture(self) -> None:
+        """Record commands and replies until stop_capture"""
+        self.recorder = ApiRecorder()
 
-        self.lock.acquire()
-        try:
-            if self._use_ssl:
-                if self._ssl_wrapper is None:
-                    ssl_context = ssl.create_default_context()
-                    ssl_context.check_hostname = False
-                    if self._ssl_verify:
-                        ssl_context.verify_mode = ssl.CERT_REQUIRED
-                        ssl_context.verify_flags &= ~ssl.VERIFY_X509_STRICT
-                    else:
-                        ssl_context.verify_mode = ssl.CERT_NONE
-                    self._ssl_wrapper = ssl_context.wrap_socket
-                kwargs["ssl_wrapper"] = self._ssl_wrapper
-            self._connection = librouteros.connect(
-                self._host, self._username, self._password, **kwargs
-            )
-        except Exception as e:
-            if not self.connection_error_reported:
-                _LOGGER.error("Mikrotik %s error while connecting: %s", self._host, e)
-                self.connection_error_reported = True
+    # ---------------------------
+    #   stop_capture
+    # ---------------------------
+    def stop_capture(self, path, metadata=None) -> int:
+        """Stop recording and write redacted capture to path, blocking"""
+        recorder, self.recorder = self.recorder, None
+        return recorder.save(path, metadata) if recorder else 0
 
-            self.error_to_strings(f"{e}")
-            self._connection = None
-            self.lock.release()
-            return False
+    # ---------------------------
+    #   _create_ssl_context
+    # ---------------------------
+    def _create_ssl_context(self) -> ssl.SSLContext:
+        """Create SSL context, loads certificates from disk."""
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        if self._ssl_verify:
+            ssl_context.verify_mode = ssl.CERT_REQUIRED
+            ssl_context.verify_flags &= ~ssl.VERIFY_X509_STRICT
         else:
+            ssl_context.verify_mode = ssl.CERT_NONE
+
+        return ssl_context
+
+    # ---------------------------
+    #   _open_connection
+    # ---------------------------
+    async def _open_connection(self) -> RouterOSConnection:
+        """Open connection to Mikrotik device."""
+        if self._use_ssl and self._ssl_context is None:
+            self._ssl_context = await asyncio.get_running_loop().run_in_executor(
+                None, self._create_ssl_context
+            )
+
+        return await RouterOSConnection.open(
+            self._host,
+            self._port,
+            ssl_context=self._ssl_context if self._use_ssl else None,
+            encoding=self._encoding,
+        )
+
+    # ---------------------------
+    #   connect
+    # ---------------------------
+    async def connect(self) -> bool:
+        """Connect to Mikrotik device."""
+        async with self.lock:
+            if self._connected and self._connection:
+                return True
+
+            self.error = ""
+            self._connection_epoch = time()
+            try:
+                if self.replay:
+                    self._connection = self.replay.open()
+                else:
+                    self._connection = await self._open_connection()
+
+                await self._connection.login(
+                    self._username, self._password, self._login_method
+                )
+            except Exception as e:
+                if not self.connection_error_reported:
+                    _LOGGER.error(
+                        "Mikrotik %s error while connecting: %s", self._host, e
+                    )
+                    self.connection_error_reported = True
+
+                self.error_to_strings(f"{e}")
+                if self._connection:
+                    self._connection.close()
+
+                self._connection = None
+                return False
+
             if self.connection_error_reported:
                 _LOGGER.warning("Mikrotik Reconnected to %s", self._host)
                 self.connection_error_reported = False
@@ -155,7 +220,6 @@ class MikrotikAPI:
 
             self._connected = True
             self._reconnected = True
-            self.lock.release()
 
         return self._connected
 
@@ -182,78 +246,269 @@ class MikrotikAPI:
         return self._connected
 
     # ---------------------------
-    #   query
+    #   _talk
     # ---------------------------
-    def query(self, path, command=None, args=None, return_list=True) -> Optional(list):
-        """Retrieve data from Mikrotik API."""
-        """Returns generator object, unless return_list passed as True"""
-        if path == "/system/health" and self.disable_health:
-            return None
-
-        if args is None:
-            args = {}
-
-        if not self.connection_check():
+    async def _talk(
+        self,
+        command,
+        args=None,
+        location=None,
+        query=None,
+        raise_trap=False,
+        callback=None,
+        timeout=True,
+        info=None,
+    ) -> Optional(list):
+        """Send command to Mikrotik and return reply rows.
+
+        Commands are tagged, so concurrent calls share one connection.
+        """
+        words = [compose_word(key, value) for key, value in (args or {}).items()]
+        words += query or []
+        connection = self._connection
+        if not connection:
             return None
 
-        self.lock.acquire()
         try:
-            _LOGGER.debug("API query: %s", path)
-            response = self._connection.path(path)
+            if self.recorder:
+                return await self.recorder.talk(
+                    connection,
+                    command,
+                    *words,
+                    callback=callback,
+                    timeout=timeout,
+                    info=info,
+                )
+
+            return await connection.talk(
+                command, *words, callback=callback, timeout=timeout, info=info
+            )
         except Exception as e:
-            self.disconnect("path", e)
-            self.lock.release()
-            return None
+            if (
+                command == "/system/health/print"
+                and isinstance(e, ApiTrapError)
+                and "no such command prefix" in str(e)
+            ):
+                self.disable_health = True
+                return None
 
-        if response and return_list and not command:
-            try:
-                response = list(response)
-            except Exception as e:
-                if path == "/system/health" and "no such command prefix" in str(e):
-                    self.disable_health = True
-                    self.lock.release()
-                    return None
+            # Trap is bound to its tag, other commands on connection are fine
+            if isinstance(e, ApiTrapError):
+                if raise_trap:
+                    raise
 
-                self.disconnect(f"building list for path {path}", e)
-                self.lock.release()
+                _LOGGER.error(
+                    "Mikrotik %s error while %s : %s",
+                    self._host,
+                    location or command,
+                    e,
+                )
                 return None
 
-        elif response and command:
-            _LOGGER.debug("API query: %s, %s, %s", path, command, args)
-            try:
-                response = list(response(command, **args))
-            except Exception as e:
-                self.disconnect("path", e)
-                self.lock.release()
-                return None
+            # Connection may have been replaced while command was in flight
+            if connection is self._connection:
+                self.disconnect(location or command, e)
+
+            return None
+
+    # ---------------------------
+    #   query
+    # ---------------------------
+    async def query(
+        self, path, command=None, args=None, proplist=None, query=None, raise_trap=False
+    ) -> Optional(list):
+        """Retrieve data from Mikrotik API.
+
+        proplist limits returned properties and query words filter returned
+        rows, both apply to print only. Query words are dropped for a path
+        once the router rejects them. With raise_trap, !trap raises
+        ApiTrapError, so it can be told apart from an empty table.
+        """
+        if path == "/system/health" and self.disable_health:
+            return None
+
+        start = monotonic()
+        if not await self.connection_check():
+            return None
+
+        connect_wait = monotonic() - start
+        info = {}
+        retries = 0
+        response = None
+        try:
+            if command:
+                _LOGGER.debug("API query: %s, %s, %s", path, command, args)
+                response = await self._talk(
+                    f"{path}/{command}",
+                    args,
+                    "path",
+                    raise_trap=raise_trap,
+                    info=info,
+                )
+            else:
+                _LOGGER.debug("API query: %s %s", path, proplist or "")
+                if proplist:
+                    args = {**(args or {}), ".proplist": ",".join(proplist)}
+
+                if path in self.query_unsupported:
+                    query = None
+
+                location = f"building list for path {path}"
+                try:
+                    response = await self._talk(
+                        f"{path}/print",
+                        args,
+                        location,
+                        query,
+                        raise_trap=raise_trap or bool(query),
+                        info=info,
+                    )
+                except ApiTrapError as e:
+                    if not query:
+                        raise
+
+                    retries += 1
+                    response = await self._talk(
+                        f"{path}/print",
+                        args,
+                        location,
+                        raise_trap=raise_trap,
+                        info=info,
+                    )
+                    # Query words are at fault only when print works without them
+                    if response is not None:
+                        _LOGGER.debug("API query words rejected for %s: %s", path, e)
+                        self.query_unsupported.add(path)
+        finally:
+            self._record(
+                f"{path}/{command or 'print'}",
+                start,
+                connect_wait,
+                info,
+                len(response or ()),
+                retries,
+            )
 
-        self.lock.release()
         return response or None
 
     # ---------------------------
-    #   set_value
+    #   _record
     # ---------------------------
-    def set_value(self, path, param, value, mod_param, mod_value) -> bool:
-        """Modify a parameter"""
-        entry_found = None
+    def _record(self, name, start, connect_wait, info, rows, retries=0) -> None:
+        """Record timing and size of API call
+
+        connect_wait is time spent in connection_check before the command,
+        tagged commands share the connection without waiting for a lock.
+        """
+        self.stats.record(
+            name,
+            monotonic() - start,
+            rows=rows,
+            received=info.get("received", 0),
+            connect_wait=round(connect_wait * 1000, 1),
+            retries=retries,
+        )
 
-        if not self.connection_check():
+    # ---------------------------
+    #   listen
+    # ---------------------------
+    async def listen(self, path, callback, proplist=None) -> bool:
+        """Subscribe to changes in path.
+
+        Callback is called with every added, changed or removed (.dead) row.
+        Returns when subscription ends, False if it could not be started.
+        """
+        if not await self.connection_check():
             return False
 
-        response = self.query(path, return_list=False)
-        if response is None:
+        args = (
+            {".proplist": ",".join([".id", ".dead", *proplist])} if proplist else None
+        )
+        _LOGGER.debug("API listen: %s", path)
+        try:
+            response = await self._talk(
+                f"{path}/listen",
+                args,
+                f"listening to {path}",
+                raise_trap=True,
+                callback=callback,
+                timeout=False,
+            )
+        except ApiTrapError as e:
+            _LOGGER.debug("Mikrotik %s listen %s ended: %s", self._host, path, e)
             return False
 
-        for tmp in response:
-            if param not in tmp:
-                continue
+        return response is not None
 
-            if tmp[param] != value:
-                continue
+    # ---------------------------
+    #   stream
+    # ---------------------------
+    async def stream(self, path, callback, proplist=None) -> bool:
+        """Retrieve rows from path one by one.
+
+        Callback is called with every row as it arrives, rows are not kept.
+        Returns False if rows could not be retrieved.
+        """
+        start = monotonic()
+        if not await self.connection_check():
+            return False
 
-            entry_found = tmp[".id"]
+        connect_wait = monotonic() - start
+        info = {}
+        args = {".proplist": ",".join(proplist)} if proplist else None
+        _LOGGER.debug("API stream: %s %s", path, proplist or "")
+        response = await self._talk(
+            f"{path}/print",
+            args,
+            f"building list for path {path}",
+            callback=callback,
+            info=info,
+        )
+        # Every reply except final !done is a row
+        self._record(
+            f"{path}/print",
+            start,
+            connect_wait,
+            info,
+            max(0, info.get("replies", 0) - 1),
+        )
+        return response is not None
 
+    # ---------------------------
+    #   _find_id
+    # ---------------------------
+    async def _find_id(self, path, param, value) -> Optional(str):
+        """Return .id of row where param equals value.
+
+        .id is used as given, other parameters are looked up with filtered
+        print, so only matching row is transferred.
+        """
+        if param == ".id":
+            return value
+
+        response = await self.query(
+            path, proplist=[".id", param], query=[compose_query_word(param, value)]
+        )
+        entry_found = None
+        for tmp in response or []:
+            if tmp.get(param) == value:
+                entry_found = tmp[".id"]
+
+        return entry_found
+
+    # ---------------------------
+    #   set_value
+    # ---------------------------
+    async def set_value(self, path, param, value, mod_param, mod_value) -> bool:
+        """Modify a parameter"""
+        if not await self.connection_check():
+            return False
+
+        entry_found = await self._find_id(path, param, value)
         if not entry_found:
+            if not self.connected():
+                return False
+
             _LOGGER.error(
                 "Mikrotik %s set_value parameter %s with value %s not found",
                 self._host,
@@ -263,43 +518,27 @@ class MikrotikAPI:
             return True
 
         params = {".id": entry_found, mod_param: mod_value}
-        self.lock.acquire()
-        try:
-            response.update(**params)
-        except Exception as e:
-            self.disconnect("set_value", e)
-            self.lock.release()
-            return False
-
-        self.lock.release()
-        return True
+        return await self._talk(f"{path}/set", params, "set_value") is not None
 
     # ---------------------------
     #   execute
     # ---------------------------
-    def execute(self, path, command, param, value, attributes=None) -> bool:
+    async def execute(self, path, command, param, value, attributes=None) -> bool:
         """Execute a command"""
-        entry_found = None
         params = {}
 
-        if not self.connection_check():
-            return False
-
-        response = self.query(path, return_list=False)
-        if response is None:
+        start = monotonic()
+        if not await self.connection_check():
             return False
 
+        connect_wait = monotonic() - start
+        info = {}
         if param:
-            for tmp in response:
-                if param not in tmp:
-                    continue
-
-                if tmp[param] != value:
-                    continue
-
-                entry_found = tmp[".id"]
-
+            entry_found = await self._find_id(path, param, value)
             if not entry_found:
+                if not self.connected():
+                    return False
+
                 _LOGGER.error(
                     "Mikrotik %s Execute %s parameter %s with value %s not found",
                     self._host,
@@ -314,65 +553,37 @@ class MikrotikAPI:
         if attributes:
             params.update(attributes)
 
-        self.lock.acquire()
-        try:
-            tuple(response(command, **params))
-        except Exception as e:
-            self.disconnect("execute", e)
-            self.lock.release()
-            return False
-
-        self.lock.release()
-        return True
+        response = await self._talk(f"{path}/{command}", params, "execute", info=info)
+        self._record(f"{path}/{command}", start, connect_wait, info, len(response or ()))
+        return response is not None
 
     # ---------------------------
     #   run_script
     # ---------------------------
-    def run_script(self, name) -> bool:
-        """Run script"""
-        entry_found = None
-        if not self.connection_check():
+    async def run_script(self, name, script_id=None) -> bool:
+        """Run script, by .id when known"""
+        if not await self.connection_check():
             return False
 
-        response = self.query("/system/script", return_list=False)
-        if response is None:
-            return False
-
-        self.lock.acquire()
-        for tmp in response:
-            if "name" not in tmp:
-                continue
-
-            if tmp["name"] != name:
-                continue
-
-            entry_found = tmp[".id"]
-
+        entry_found = script_id or await self._find_id("/system/script", "name", name)
         if not entry_found:
+            if not self.connected():
+                return False
+
             _LOGGER.error("Mikrotik %s Script %s not found", self._host, name)
             return True
 
-        try:
-            run = response("run", **{".id": entry_found})
-            tuple(run)
-        except Exception as e:
-            self.disconnect("run_script", e)
-            self.lock.release()
-            return False
-
-        self.lock.release()
-        return True
+        return (
+            await self._talk("/system/script/run", {".id": entry_found}, "run_script")
+            is not None
+        )
 
     # ---------------------------
     #   arp_ping
     # ---------------------------
-    def arp_ping(self, address, interface) -> bool:
+    async def arp_ping(self, address, interface) -> bool:
         """Check arp ping response traffic stats"""
-        if not self.connection_check():
-            return False
-
-        response = self.query("/ping", return_list=False)
-        if response is None:
+        if not await self.connection_check():
             return False
 
         args = {
@@ -382,24 +593,11 @@ class MikrotikAPI:
             "interface": interface,
             "address": address,
         }
-        self.lock.acquire()
-        try:
-            # _LOGGER.debug("Ping host query: %s", args["address"])
-            ping = response("/ping", **args)
-        except Exception as e:
-            self.disconnect("arp_ping", e)
-            self.lock.release()
+        # _LOGGER.debug("Ping host query: %s", args["address"])
+        ping = await self._talk("/ping", args, "arp_ping")
+        if ping is None:
             return False
 
-        try:
-            ping = list(ping)
-        except Exception as e:
-            self.disconnect("arp_ping", e)
-            self.lock.release()
-            return False
-
-        self.lock.release()
-
         for tmp in ping:
             if "received" in tmp and tmp["received"] > 0:
                 _LOGGER.debug("Ping host success: %s", args["address"])
@@ -408,19 +606,38 @@ class MikrotikAPI:
         _LOGGER.debug("Ping host failure: %s", args["address"])
         return False
 
+    # ---------------------------
+    #   arp_ping_hosts
+    # ---------------------------
+    async def arp_ping_hosts(self, hosts, concurrency) -> dict:
+        """Ping hosts concurrently, at most concurrency pings at once
+
+        hosts is a dict of uid: (address, interface), returns uid: bool.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def ping(address, interface) -> bool:
+            async with semaphore:
+                return await self.arp_ping(address, interface)
+
+        results = await asyncio.gather(
+            *(ping(address, interface) for address, interface in hosts.values())
+        )
+        return dict(zip(hosts, results))
+
     @staticmethod
     def _current_milliseconds():
         return int(round(time() * 1000))
 
-    def is_accounting_and_local_traffic_enabled(self) -> (bool, bool):
+    async def is_accounting_and_local_traffic_enabled(self) -> (bool, bool):
         # Returns:
         #   1st bool: Is accounting enabled
         #   2nd bool: Is account-local-traffic enabled
 
-        if not self.connection_check():
+        if not await self.connection_check():
             return False, False
 
-        response = self.query("/ip/accounting")
+        response = await self.query("/ip/accounting")
         if response is None:
             return False, False
 
@@ -442,32 +659,18 @@ class MikrotikAPI:
     #   take_client_traffic_snapshot
     #   Returns float -> period in seconds between last and current run
     # ---------------------------
-    def take_client_traffic_snapshot(self, use_accounting) -> float:
+    async def take_client_traffic_snapshot(self, use_accounting) -> float:
         """Tako accounting snapshot and return time diff"""
-        if not self.connection_check():
+        if not await self.connection_check():
             return 0
 
         if use_accounting:
-            accounting = self.query("/ip/accounting", return_list=False)
-
-            self.lock.acquire()
-            try:
-                # Prepare command
-                take = accounting("snapshot/take")
-            except Exception as e:
-                self.disconnect("accounting_snapshot", e)
-                self.lock.release()
-                return 0
-
-            try:
-                list(take)
-            except Exception as e:
-                self.disconnect("accounting_snapshot", e)
-                self.lock.release()
+            take = await self._talk(
+                "/ip/accounting/snapshot/take", location="accounting_snapshot"
+            )
+            if take is None:
                 return 0
 
-            self.lock.release()
-
         # First request will be discarded because we cannot know when the last data was retrieved
         # prevents spikes in data
         if not self.client_traffic_last_run:
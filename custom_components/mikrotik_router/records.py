@@ -0,0 +1,133 @@
+"""Compact record types for Mikrotik Router tables."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import MutableMapping
+
+
+# ---------------------------
+#   record_keys
+# ---------------------------
+def record_keys(*keys) -> dict:
+    """Map data keys to slot attribute names."""
+    return {key: key.replace("-", "_") for key in keys}
+
+
+# ---------------------------
+#   Record
+# ---------------------------
+class Record(MutableMapping):
+    """Slotted row with mapping access by data keys.
+
+    Unset attributes are missing keys. String values of interned fields
+    are interned, so hosts share one copy of each source or interface name.
+    """
+
+    __slots__ = ()
+    _keys: dict = {}
+    _interned: frozenset = frozenset()
+    _defaults: dict = {}
+
+    def __init__(self, values=None):
+        """Initialize record from defaults and values."""
+        for key, value in {**self._defaults, **(values or {})}.items():
+            self[key] = value
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, self._keys[key])
+        except (KeyError, AttributeError):
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        try:
+            attr = self._keys[key]
+        except KeyError:
+            raise KeyError(f"{type(self).__name__} has no field {key}") from None
+
+        if attr in self._interned and type(value) is str:
+            value = sys.intern(value)
+
+        setattr(self, attr, value)
+
+    def __delitem__(self, key):
+        try:
+            delattr(self, self._keys[key])
+        except (KeyError, AttributeError):
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        attr = self._keys.get(key)
+        return attr is not None and hasattr(self, attr)
+
+    def __iter__(self):
+        return (key for key, attr in self._keys.items() if hasattr(self, attr))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)})"
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+# ---------------------------
+#   HostRecord
+# ---------------------------
+class HostRecord(Record):
+    """Tracked network host."""
+
+    _keys = record_keys(
+        "source",
+        "address",
+        "mac-address",
+        "interface",
+        "host-name",
+        "manufacturer",
+        "last-seen",
+        "available",
+        "authorized",
+        "bypassed",
+        "signal-strength",
+        "tx-ccq",
+        "tx-rate",
+        "rx-rate",
+    )
+    __slots__ = tuple(_keys.values())
+    _interned = frozenset({"source", "interface", "manufacturer"})
+    _defaults = {
+        "address": "unknown",
+        "mac-address": "unknown",
+        "interface": "unknown",
+        "host-name": "unknown",
+        "manufacturer": "detect",
+        "last-seen": False,
+        "available": False,
+    }
+
+
+# ---------------------------
+#   ClientTrafficRecord
+# ---------------------------
+class ClientTrafficRecord(Record):
+    """Traffic counters of network host."""
+
+    _keys = record_keys(
+        "address",
+        "mac-address",
+        "host-name",
+        "available",
+        "local_accounting",
+        "previous-bytes-up",
+        "previous-bytes-down",
+        "tx",
+        "rx",
+        "wan-tx",
+        "wan-rx",
+        "lan-tx",
+        "lan-rx",
+    )
+    __slots__ = tuple(_keys.values())
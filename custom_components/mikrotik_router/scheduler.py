@@ -0,0 +1,152 @@
+"""Update stage scheduler for Mikrotik Router."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from inspect import isawaitable
+from time import monotonic
+from typing import Any
+
+TIER_FAST = "fast"
+TIER_MEDIUM = "medium"
+TIER_SLOW = "slow"
+
+
+# ---------------------------
+#   UpdateStage
+# ---------------------------
+@dataclass
+class UpdateStage:
+    """Coordinator update stage with its data dependencies."""
+
+    name: str
+    func: Callable[[], Any]
+    deps: tuple[str, ...] = ()
+    condition: Callable[[], bool] | None = None
+    tier: str = TIER_FAST
+
+
+# ---------------------------
+#   sort_stages
+# ---------------------------
+def sort_stages(stages) -> list:
+    """Sort stages so every stage follows its dependencies."""
+    by_name = {stage.name: stage for stage in stages}
+    ordered = []
+    state = {}
+
+    def visit(stage, path):
+        if state.get(stage.name) == "done":
+            return
+
+        if state.get(stage.name) == "visiting":
+            raise ValueError(f"Stage dependency cycle: {' -> '.join(path)}")
+
+        state[stage.name] = "visiting"
+        for dep in stage.deps:
+            if dep not in by_name:
+                raise ValueError(f"Stage {stage.name} depends on unknown {dep}")
+
+            visit(by_name[dep], [*path, dep])
+
+        state[stage.name] = "done"
+        ordered.append(stage)
+
+    for stage in stages:
+        visit(stage, [stage.name])
+
+    return ordered
+
+
+# ---------------------------
+#   select_stages
+# ---------------------------
+def select_stages(stages, names) -> list:
+    """Return named stages with all stages depending on them.
+
+    Dependencies outside of selection are dropped, their data is used
+    as left by previous update.
+    """
+    selected = set(names)
+    changed = True
+    while changed:
+        changed = False
+        for stage in stages:
+            if stage.name not in selected and selected.intersection(stage.deps):
+                selected.add(stage.name)
+                changed = True
+
+    return [
+        replace(stage, deps=tuple(dep for dep in stage.deps if dep in selected))
+        for stage in stages
+        if stage.name in selected
+    ]
+
+
+# ---------------------------
+#   async_run_stages
+# ---------------------------
+async def async_run_stages(
+    stages, is_connected=None, intervals=None, last_run=None, stats=None
+) -> None:
+    """Run stages concurrently.
+
+    Each stage starts as soon as all of its dependencies are finished.
+    Condition is evaluated right before the stage would run, skipped
+    stages count as finished for their dependents.
+
+    When intervals (seconds per tier) and last_run are given, stages of
+    a tier with interval run only once the interval elapsed since their
+    last successful run. Removing a stage from last_run forces a refresh.
+
+    Duration of every stage which ran is recorded to stats when given.
+    """
+    intervals = intervals or {}
+    now = monotonic()
+    tasks = {}
+
+    def is_due(stage) -> bool:
+        if last_run is None or stage.name not in last_run:
+            return True
+
+        interval = intervals.get(stage.tier)
+        return not interval or now - last_run[stage.name] >= interval
+
+    async def run(stage):
+        deps = [tasks[dep] for dep in stage.deps]
+        if deps:
+            await asyncio.gather(*deps)
+
+        if not is_due(stage):
+            return
+
+        if is_connected and not is_connected():
+            return
+
+        if stage.condition and not stage.condition():
+            return
+
+        start = monotonic()
+        result = stage.func()
+        if isawaitable(result):
+            await result
+
+        if stats is not None:
+            stats.record(stage.name, monotonic() - start)
+
+        if last_run is not None and (not is_connected or is_connected()):
+            last_run[stage.name] = now
+
+    for stage in sort_stages(stages):
+        tasks[stage.name] = asyncio.create_task(run(stage), name=stage.name)
+
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
@@ -21,6 +21,7 @@ from homeassistant.const import (
     UnitOfElectricPotential,
     UnitOfElectricCurrent,
     UnitOfPower,
+    UnitOfTime,
 )
 
 from .const import DOMAIN
@@ -102,6 +103,11 @@ DEVICE_ATTRIBUTES_CLIENT_TRAFFIC = [
     "authorized",
     "bypassed",
 ]
+DEVICE_ATTRIBUTES_STATS = [
+    "update-duration-p50",
+    "update-duration-p95",
+    "slowest-stage",
+]
 DEVICE_ATTRIBUTES_GPS = [
     "valid",
     "latitude",
@@ -431,6 +437,58 @@ SENSOR_TYPES: tuple[MikrotikSensorEntityDescription, ...] = (
         data_uid="",
         data_reference="",
     ),
+    MikrotikSensorEntityDescription(
+        key="system_update-duration",
+        name="Update duration",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        ha_group="System",
+        data_path="stats",
+        data_attribute="update-duration",
+        data_name="",
+        data_uid="",
+        data_reference="",
+        data_attributes_list=DEVICE_ATTRIBUTES_STATS,
+    ),
+    MikrotikSensorEntityDescription(
+        key="system_api-queries",
+        name="API queries",
+        icon="mdi:swap-vertical",
+        native_unit_of_measurement=None,
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        ha_group="System",
+        data_path="stats",
+        data_attribute="api-queries",
+        data_name="",
+        data_uid="",
+        data_reference="",
+    ),
+    MikrotikSensorEntityDescription(
+        key="system_api-received",
+        name="API received",
+        icon="mdi:download-network",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.KILOBYTES,
+        suggested_display_precision=0,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        ha_group="System",
+        data_path="stats",
+        data_attribute="api-received",
+        data_name="",
+        data_uid="",
+        data_reference="",
+    ),
     MikrotikSensorEntityDescription(
         key="system_cpu-load",
         name="CPU load",
@@ -0,0 +1,78 @@
+"""Timing statistics for Mikrotik Router."""
+
+from __future__ import annotations
+
+from collections import deque
+from math import ceil
+
+STATS_SAMPLES = 100
+
+
+# ---------------------------
+#   percentile
+# ---------------------------
+def percentile(ordered, fraction) -> float:
+    """Return nearest-rank percentile of sorted samples."""
+    if not ordered:
+        return 0.0
+
+    return ordered[max(0, ceil(fraction * len(ordered)) - 1)]
+
+
+# ---------------------------
+#   StatsCollector
+# ---------------------------
+class StatsCollector:
+    """Collect durations and counters per operation name.
+
+    Durations of last STATS_SAMPLES calls are kept for percentiles,
+    counters are kept as totals and values of last call.
+    """
+
+    def __init__(self, size=STATS_SAMPLES):
+        """Initialize StatsCollector."""
+        self._size = size
+        self._samples = {}
+        self._last = {}
+        self.totals = {}
+
+    # ---------------------------
+    #   record
+    # ---------------------------
+    def record(self, name, duration, **counters) -> None:
+        """Record one call taking duration seconds."""
+        if name not in self._samples:
+            self._samples[name] = deque(maxlen=self._size)
+            self.totals[name] = {"count": 0}
+
+        self._samples[name].append(duration)
+        self._last[name] = counters
+        totals = self.totals[name]
+        totals["count"] += 1
+        for key, value in counters.items():
+            totals[key] = totals.get(key, 0) + value
+
+    # ---------------------------
+    #   total
+    # ---------------------------
+    def total(self, key) -> int:
+        """Return counter summed over all names."""
+        return sum(totals.get(key, 0) for totals in self.totals.values())
+
+    # ---------------------------
+    #   summary
+    # ---------------------------
+    def summary(self) -> dict:
+        """Return last, p50 and p95 in milliseconds with counters per name."""
+        summary = {}
+        for name, samples in self._samples.items():
+            ordered = sorted(samples)
+            summary[name] = {
+                "last": round(samples[-1] * 1000, 1),
+                "p50": round(percentile(ordered, 0.5) * 1000, 1),
+                "p95": round(percentile(ordered, 0.95) * 1000, 1),
+                **self._last[name],
+                "total": dict(self.totals[name]),
+            }
+
+        return summary
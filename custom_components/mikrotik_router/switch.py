@@ -73,17 +73,30 @@ class MikrotikSwitch(MikrotikEntity, SwitchEntity, RestoreEntity):
         """Required abstract method."""
         pass
 
+    def _switch_reference(self) -> tuple:
+        """Return parameter and value identifying row, .id when known."""
+        if ".id" in self._data:
+            return ".id", self._data[".id"]
+
+        param = self.entity_description.data_reference
+        return param, self._data[param]
+
     async def async_turn_on(self) -> None:
         """Turn on the switch."""
         if "write" not in self.coordinator.data["access"]:
             return
 
         path = self.entity_description.data_switch_path
-        param = self.entity_description.data_reference
-        value = self._data[self.entity_description.data_reference]
+        param, value = self._switch_reference()
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_set_value(
+            path,
+            param,
+            value,
+            mod_param,
+            False,
+            data_path=self.entity_description.data_path,
+        )
 
     async def async_turn_off(self) -> None:
         """Turn off the switch."""
@@ -91,11 +104,16 @@ class MikrotikSwitch(MikrotikEntity, SwitchEntity, RestoreEntity):
             return
 
         path = self.entity_description.data_switch_path
-        param = self.entity_description.data_reference
-        value = self._data[self.entity_description.data_reference]
+        param, value = self._switch_reference()
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_set_value(
+            path,
+            param,
+            value,
+            mod_param,
+            True,
+            data_path=self.entity_description.data_path,
+        )
 
 
 # ---------------------------
@@ -145,21 +163,27 @@ class MikrotikPortSwitch(MikrotikSwitch):
             return
 
         path = self.entity_description.data_switch_path
-        param = self.entity_description.data_reference
         if self._data["about"] == "managed by CAPsMAN":
-            _LOGGER.error("Unable to enable %s, managed by CAPsMAN", self._data[param])
+            _LOGGER.error("Unable to enable %s, managed by CAPsMAN", self._data["name"])
             return "managed by CAPsMAN"
-        if "-" in self._data["port-mac-address"]:
-            param = "name"
-        value = self._data[self.entity_description.data_reference]
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
+        await self.coordinator.async_set_value(
+            path,
+            *self._switch_reference(),
+            mod_param,
+            False,
+            data_path=self.entity_description.data_path,
+        )
 
         if "poe-out" in self._data and self._data["poe-out"] == "off":
             path = "/interface/ethernet"
-            self.coordinator.set_value(path, param, value, "poe-out", "auto-on")
-
-        await self.coordinator.async_refresh()
+            await self.coordinator.async_set_value(
+                path,
+                *self._switch_reference(),
+                "poe-out",
+                "auto-on",
+                data_path="interface_ethernet",
+            )
 
     async def async_turn_off(self) -> Optional[str]:
         """Turn off the switch."""
@@ -167,21 +191,29 @@ class MikrotikPortSwitch(MikrotikSwitch):
             return
 
         path = self.entity_description.data_switch_path
-        param = self.entity_description.data_reference
         if self._data["about"] == "managed by CAPsMAN":
-            _LOGGER.error("Unable to disable %s, managed by CAPsMAN", self._data[param])
+            _LOGGER.error(
+                "Unable to disable %s, managed by CAPsMAN", self._data["name"]
+            )
             return "managed by CAPsMAN"
-        if "-" in self._data["port-mac-address"]:
-            param = "name"
-        value = self._data[self.entity_description.data_reference]
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
+        await self.coordinator.async_set_value(
+            path,
+            *self._switch_reference(),
+            mod_param,
+            True,
+            data_path=self.entity_description.data_path,
+        )
 
         if "poe-out" in self._data and self._data["poe-out"] == "auto-on":
             path = "/interface/ethernet"
-            self.coordinator.set_value(path, param, value, "poe-out", "off")
-
-        await self.coordinator.async_refresh()
+            await self.coordinator.async_set_value(
+                path,
+                *self._switch_reference(),
+                "poe-out",
+                "off",
+                data_path="interface_ethernet",
+            )
 
 
 # ---------------------------
@@ -190,46 +222,6 @@ class MikrotikPortSwitch(MikrotikSwitch):
 class MikrotikNATSwitch(MikrotikSwitch):
     """Representation of a NAT switch."""
 
-    async def async_turn_on(self) -> None:
-        """Turn on the switch."""
-        if "write" not in self.coordinator.data["access"]:
-            return
-
-        path = self.entity_description.data_switch_path
-        param = ".id"
-        value = None
-        for uid in self.coordinator.data["nat"]:
-            if self.coordinator.data["nat"][uid]["uniq-id"] == (
-                f"{self._data['chain']},{self._data['action']},{self._data['protocol']},"
-                f"{self._data['in-interface']}:{self._data['dst-port']}-"
-                f"{self._data['out-interface']}:{self._data['to-addresses']}:{self._data['to-ports']}"
-            ):
-                value = self.coordinator.data["nat"][uid][".id"]
-
-        mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
-        await self.coordinator.async_refresh()
-
-    async def async_turn_off(self) -> None:
-        """Turn off the switch."""
-        if "write" not in self.coordinator.data["access"]:
-            return
-
-        path = self.entity_description.data_switch_path
-        param = ".id"
-        value = None
-        for uid in self.coordinator.data["nat"]:
-            if self.coordinator.data["nat"][uid]["uniq-id"] == (
-                f"{self._data['chain']},{self._data['action']},{self._data['protocol']},"
-                f"{self._data['in-interface']}:{self._data['dst-port']}-"
-                f"{self._data['out-interface']}:{self._data['to-addresses']}:{self._data['to-ports']}"
-            ):
-                value = self.coordinator.data["nat"][uid][".id"]
-
-        mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
-        await self.coordinator.async_refresh()
-
 
 # ---------------------------
 #   MikrotikMangleSwitch
@@ -237,48 +229,6 @@ class MikrotikNATSwitch(MikrotikSwitch):
 class MikrotikMangleSwitch(MikrotikSwitch):
     """Representation of a Mangle switch."""
 
-    async def async_turn_on(self) -> None:
-        """Turn on the switch."""
-        if "write" not in self.coordinator.data["access"]:
-            return
-
-        path = self.entity_description.data_switch_path
-        param = ".id"
-        value = None
-        for uid in self.coordinator.data["mangle"]:
-            if self.coordinator.data["mangle"][uid]["uniq-id"] == (
-                f"{self._data['chain']},{self._data['action']},{self._data['protocol']},"
-                f"{self._data['src-address']}:{self._data['src-port']}-"
-                f"{self._data['dst-address']}:{self._data['dst-port']},"
-                f"{self._data['src-address-list']}-{self._data['dst-address-list']}"
-            ):
-                value = self.coordinator.data["mangle"][uid][".id"]
-
-        mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
-        await self.coordinator.async_refresh()
-
-    async def async_turn_off(self) -> None:
-        """Turn off the switch."""
-        if "write" not in self.coordinator.data["access"]:
-            return
-
-        path = self.entity_description.data_switch_path
-        param = ".id"
-        value = None
-        for uid in self.coordinator.data["mangle"]:
-            if self.coordinator.data["mangle"][uid]["uniq-id"] == (
-                f"{self._data['chain']},{self._data['action']},{self._data['protocol']},"
-                f"{self._data['src-address']}:{self._data['src-port']}-"
-                f"{self._data['dst-address']}:{self._data['dst-port']},"
-                f"{self._data['src-address-list']}-{self._data['dst-address-list']}"
-            ):
-                value = self.coordinator.data["mangle"][uid][".id"]
-
-        mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
-        await self.coordinator.async_refresh()
-
 
 # ---------------------------
 #   MikrotikFilterSwitch
@@ -286,46 +236,6 @@ class MikrotikMangleSwitch(MikrotikSwitch):
 class MikrotikFilterSwitch(MikrotikSwitch):
     """Representation of a Filter switch."""
 
-    async def async_turn_on(self) -> None:
-        """Turn on the switch."""
-        if "write" not in self.coordinator.data["access"]:
-            return
-
-        path = self.entity_description.data_switch_path
-        param = ".id"
-        value = None
-        for uid in self.coordinator.data["filter"]:
-            if self.coordinator.data["filter"][uid]["uniq-id"] == (
-                f"{self._data['chain']},{self._data['action']},{self._data['protocol']},{self._data['layer7-protocol']},"
-                f"{self._data['in-interface']},{self._data['in-interface-list']}:{self._data['src-address']},{self._data['src-address-list']}:{self._data['src-port']}-"
-                f"{self._data['out-interface']},{self._data['out-interface-list']}:{self._data['dst-address']},{self._data['dst-address-list']}:{self._data['dst-port']}"
-            ):
-                value = self.coordinator.data["filter"][uid][".id"]
-
-        mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
-        await self.coordinator.async_refresh()
-
-    async def async_turn_off(self) -> None:
-        """Turn off the switch."""
-        if "write" not in self.coordinator.data["access"]:
-            return
-
-        path = self.entity_description.data_switch_path
-        param = ".id"
-        value = None
-        for uid in self.coordinator.data["filter"]:
-            if self.coordinator.data["filter"][uid]["uniq-id"] == (
-                f"{self._data['chain']},{self._data['action']},{self._data['protocol']},{self._data['layer7-protocol']},"
-                f"{self._data['in-interface']},{self._data['in-interface-list']}:{self._data['src-address']},{self._data['src-address-list']}:{self._data['src-port']}-"
-                f"{self._data['out-interface']},{self._data['out-interface-list']}:{self._data['dst-address']},{self._data['dst-address-list']}:{self._data['dst-port']}"
-            ):
-                value = self.coordinator.data["filter"][uid][".id"]
-
-        mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
-        await self.coordinator.async_refresh()
-
 
 # ---------------------------
 #   MikrotikQueueSwitch
@@ -333,38 +243,6 @@ class MikrotikFilterSwitch(MikrotikSwitch):
 class MikrotikQueueSwitch(MikrotikSwitch):
     """Representation of a queue switch."""
 
-    async def async_turn_on(self) -> None:
-        """Turn on the switch."""
-        if "write" not in self.coordinator.data["access"]:
-            return
-
-        path = self.entity_description.data_switch_path
-        param = ".id"
-        value = None
-        for uid in self.coordinator.data["queue"]:
-            if self.coordinator.data["queue"][uid]["name"] == f"{self._data['name']}":
-                value = self.coordinator.data["queue"][uid][".id"]
-
-        mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
-        await self.coordinator.async_refresh()
-
-    async def async_turn_off(self) -> None:
-        """Turn off the switch."""
-        if "write" not in self.coordinator.data["access"]:
-            return
-
-        path = self.entity_description.data_switch_path
-        param = ".id"
-        value = None
-        for uid in self.coordinator.data["queue"]:
-            if self.coordinator.data["queue"][uid]["name"] == f"{self._data['name']}":
-                value = self.coordinator.data["queue"][uid][".id"]
-
-        mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
-        await self.coordinator.async_refresh()
-
 
 # ---------------------------
 #   MikrotikKidcontrolPauseSwitch
@@ -378,11 +256,15 @@ class MikrotikKidcontrolPauseSwitch(MikrotikSwitch):
             return
 
         path = self.entity_description.data_switch_path
-        param = self.entity_description.data_reference
-        value = self._data[self.entity_description.data_reference]
+        param, value = self._switch_reference()
         command = "resume"
-        self.coordinator.execute(path, command, param, value)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_execute(
+            path,
+            command,
+            param,
+            value,
+            data_path=self.entity_description.data_path,
+        )
 
     async def async_turn_off(self) -> None:
         """Turn off the switch."""
@@ -390,8 +272,12 @@ class MikrotikKidcontrolPauseSwitch(MikrotikSwitch):
             return
 
         path = self.entity_description.data_switch_path
-        param = self.entity_description.data_reference
-        value = self._data[self.entity_description.data_reference]
+        param, value = self._switch_reference()
         command = "pause"
-        self.coordinator.execute(path, command, param, value)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_execute(
+            path,
+            command,
+            param,
+            value,
+            data_path=self.entity_description.data_path,
+        )
@@ -0,0 +1 @@
+"""Tests for Mikrotik Router."""
@@ -0,0 +1,52 @@
+"""Common helpers for Mikrotik Router tests."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from tempfile import TemporaryDirectory
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry, entity_registry
+
+from benchmarks.fake_routeros import DatasetSize, FakeRouterOS, build_tables
+from benchmarks.run import OPTIONS, create_coordinators
+
+SIZE = DatasetSize(
+    interfaces=4, hosts=6, wireless_hosts=2, rules=3, queues=2, accounting=10
+)
+
+
+# ---------------------------
+#   async_fake_router
+# ---------------------------
+@asynccontextmanager
+async def async_fake_router(tables=None, options=None, server=None):
+    """Yield fake router with coordinator and tracker coordinator for it."""
+    server = server or FakeRouterOS(build_tables(SIZE) if tables is None else tables)
+    port = await server.start()
+    with TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        await device_registry.async_load(hass)
+        await entity_registry.async_load(hass)
+        coordinator, tracker_coordinator = await create_coordinators(
+            hass, port, OPTIONS if options is None else options
+        )
+        # Connect before first update, so later updates do not refresh all tiers
+        await coordinator.api.connection_check()
+        try:
+            yield server, coordinator, tracker_coordinator
+        finally:
+            coordinator.api.close()
+            await server.close()
+            await hass.async_stop(force=True)
+
+
+# ---------------------------
+#   async_wait_for
+# ---------------------------
+async def async_wait_for(condition, timeout=2) -> None:
+    """Wait until condition is true, background tasks run meanwhile."""
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
@@ -0,0 +1,120 @@
+"""Tests for client traffic accounting."""
+
+import random
+from ipaddress import IPv4Network
+
+from custom_components.mikrotik_router import accounting
+from custom_components.mikrotik_router.accounting import AccountingAggregator
+
+NETWORKS = (
+    [int(IPv4Network("10.0.0.0/16")[0]), int(IPv4Network("192.168.88.0/24")[0])],
+    [int(IPv4Network("10.0.0.0/16")[-1]), int(IPv4Network("192.168.88.0/24")[-1])],
+)
+HOSTS = ["192.168.88.10", "192.168.88.11", "10.0.5.1"]
+
+
+def make_rows(count, seed=1) -> tuple:
+    """Return random snapshot columns of local and external addresses."""
+    rng = random.Random(seed)
+    addresses = [
+        *HOSTS,
+        "192.168.88.200",
+        "10.0.0.1",
+        "8.8.8.8",
+        "1.1.1.1",
+        "172.16.0.1",
+    ]
+    sources = [rng.choice(addresses) for _ in range(count)]
+    destinations = [rng.choice(addresses) for _ in range(count)]
+    byte_counts = [rng.randrange(1, 1 << 40) for _ in range(count)]
+    return sources, destinations, byte_counts
+
+
+def aggregate(rows) -> dict:
+    aggregator = AccountingAggregator(HOSTS, NETWORKS)
+    aggregator.add_rows(*rows)
+    return aggregator.totals
+
+
+def aggregate_each(rows) -> dict:
+    aggregator = AccountingAggregator(HOSTS, NETWORKS)
+    for source, destination, byte_count in zip(*rows):
+        aggregator.add(source, destination, byte_count)
+
+    return aggregator.totals
+
+
+# ---------------------------
+#   AccountingAggregator
+# ---------------------------
+def test_add_classifies_traffic():
+    aggregator = AccountingAggregator(HOSTS, NETWORKS)
+    aggregator.add("192.168.88.10", "10.0.5.1", 100)
+    aggregator.add("192.168.88.10", "8.8.8.8", 20)
+    aggregator.add("8.8.8.8", "192.168.88.11", 3)
+    aggregator.add("192.168.88.200", "192.168.88.11", 4)
+    aggregator.add("8.8.8.8", "1.1.1.1", 1000)
+    assert aggregator.totals == {
+        "192.168.88.10": {"wan-tx": 20, "wan-rx": 0, "lan-tx": 100, "lan-rx": 0},
+        "192.168.88.11": {"wan-tx": 0, "wan-rx": 3, "lan-tx": 0, "lan-rx": 4},
+        "10.0.5.1": {"wan-tx": 0, "wan-rx": 0, "lan-tx": 0, "lan-rx": 100},
+    }
+
+
+def test_is_local():
+    aggregator = AccountingAggregator(HOSTS, NETWORKS)
+    assert aggregator.is_local("10.0.255.255")
+    assert aggregator.is_local("192.168.88.0")
+    assert not aggregator.is_local("10.1.0.0")
+    assert not aggregator.is_local("192.168.87.255")
+    assert not AccountingAggregator(HOSTS, ([], [])).is_local("10.0.0.1")
+
+
+def test_add_rows_matches_add():
+    rows = make_rows(5000)
+    expected = aggregate_each(rows)
+    assert any(value for totals in expected.values() for value in totals.values())
+    assert aggregate(rows) == expected
+
+
+def test_add_rows_sums_exact_above_float_precision():
+    big = (1 << 53) + 1
+    rows = ([HOSTS[0]] * 3, ["8.8.8.8"] * 3, [big, 1, 1])
+    assert aggregate(rows)[HOSTS[0]]["wan-tx"] == big + 2
+    assert aggregate_each(rows) == aggregate(rows)
+
+
+def test_add_rows_empty():
+    assert aggregate(([], [], [])) == aggregate_each(([], [], []))
+
+
+def test_add_rows_without_local_networks():
+    rows = make_rows(100)
+    aggregator = AccountingAggregator(HOSTS, ([], []))
+    aggregator.add_rows(*rows)
+    assert all(
+        value == 0 for totals in aggregator.totals.values() for value in totals.values()
+    )
+
+
+def test_feed_matches_add_rows():
+    rows = make_rows(accounting.CHUNK_SIZE * 2 + 10, seed=2)
+    aggregator = AccountingAggregator(HOSTS, NETWORKS)
+    for source, destination, byte_count in zip(*rows):
+        aggregator.feed(
+            {"src-address": source, "dst-address": destination, "bytes": byte_count}
+        )
+
+    aggregator.flush()
+    assert aggregator.count == len(rows[0])
+    assert aggregator.totals == aggregate(rows)
+
+
+def test_clear():
+    aggregator = AccountingAggregator(HOSTS, NETWORKS)
+    aggregator.feed({"src-address": HOSTS[0], "dst-address": "8.8.8.8", "bytes": 5})
+    aggregator.add(HOSTS[0], "8.8.8.8", 5)
+    aggregator.clear()
+    aggregator.flush()
+    assert aggregator.count == 0
+    assert aggregator.totals[HOSTS[0]]["wan-tx"] == 0
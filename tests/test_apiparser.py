@@ -0,0 +1,190 @@
+"""Tests for API parser."""
+
+import pytest
+
+from custom_components.mikrotik_router.apiparser import (
+    can_skip,
+    compile_spec,
+    compile_val,
+    from_entry,
+    from_entry_bool,
+    get_proplist,
+    get_query,
+    parse_api,
+)
+
+SKIP = [
+    {"name": "type", "value": "bridge"},
+    {"name": "type", "value": "ppp-in"},
+    {"name": "dynamic", "value": True},
+]
+
+ROWS = [
+    {"name": "ether1", "type": "ether", "dynamic": False},
+    {"name": "bridge", "type": "bridge", "dynamic": False},
+    {"name": "<pppoe-user>", "type": "ppp-in", "dynamic": True},
+    {"name": "vlan10", "type": "vlan", "dynamic": True},
+    {"name": "wg0", "type": "wg"},
+]
+
+
+def match_query(row, query) -> bool:
+    """Evaluate RouterOS query words against row."""
+    stack = []
+    for word in query:
+        if word == "?#!":
+            stack.append(not stack.pop())
+        else:
+            key, value = word[1:].split("=", 1)
+            tmp = row.get(key)
+            if type(tmp) is bool:
+                tmp = "true" if tmp else "false"
+
+            stack.append(tmp == value)
+
+    return all(stack)
+
+
+# ---------------------------
+#   get_query
+# ---------------------------
+def test_get_query_skip():
+    assert get_query(skip=SKIP) == [
+        "?type=bridge",
+        "?#!",
+        "?type=ppp-in",
+        "?#!",
+        "?dynamic=true",
+        "?#!",
+    ]
+
+
+def test_get_query_only_and_skip():
+    assert get_query(
+        only=[{"key": "disabled", "value": False}],
+        skip=[{"name": "type", "value": "bridge"}],
+    ) == ["?disabled=false", "?type=bridge", "?#!"]
+
+
+def test_get_query_skip_empty_value_left_to_client():
+    assert get_query(skip=[{"name": "comment", "value": ""}]) == []
+    assert get_query() == []
+
+
+def test_get_query_matches_client_side_skip():
+    query = get_query(skip=SKIP)
+    assert [row["name"] for row in ROWS if match_query(row, query)] == [
+        row["name"] for row in ROWS if not can_skip(row, SKIP)
+    ]
+
+
+def test_get_proplist():
+    assert get_proplist(
+        key=".id",
+        key_secondary="name",
+        vals=[{"name": "name"}, {"name": "rx", "source": "stats/rx"}],
+        only=[{"key": "disabled", "value": False}],
+        skip=SKIP,
+    ) == [".id", "name", "stats", "disabled", "type", "dynamic"]
+
+
+# ---------------------------
+#   compile_val
+# ---------------------------
+@pytest.mark.parametrize(
+    "entry",
+    [
+        {},
+        {"value": "text"},
+        {"value": "x" * 300},
+        {"value": 15},
+        {"value": 1.23456},
+        {"value": True},
+        {"value": "yes"},
+        {"value": "down"},
+        {"nested": {"value": "on"}},
+        {"nested": "flat"},
+    ],
+)
+@pytest.mark.parametrize(
+    "val",
+    [
+        {"name": "value"},
+        {"name": "value", "default": 0},
+        {"name": "value", "default": "unknown"},
+        {"name": "value", "source": "nested/value"},
+        {"name": "value", "source": "nested/value", "default": "none"},
+    ],
+)
+def test_compile_val_matches_from_entry(val, entry):
+    source = val.get("source", val["name"])
+    expected = from_entry(entry, source, val.get("default", ""))
+    assert compile_val(val)(entry) == expected
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [{}, {"value": True}, {"value": "no"}, {"value": "UP"}, {"value": 1}],
+)
+@pytest.mark.parametrize(
+    "val",
+    [
+        {"name": "value", "type": "bool"},
+        {"name": "value", "type": "bool", "reverse": True},
+        {"name": "value", "type": "bool", "default": True},
+    ],
+)
+def test_compile_bool_val_matches_from_entry_bool(val, entry):
+    expected = from_entry_bool(
+        entry, val["name"], val.get("default", False), val.get("reverse", False)
+    )
+    assert compile_val(val)(entry) == expected
+
+
+# ---------------------------
+#   parse_api
+# ---------------------------
+def test_parse_api_compiled_spec():
+    spec = compile_spec(
+        key="name",
+        vals=[
+            {"name": "name"},
+            {"name": "type", "default": "unknown"},
+            {"name": "enabled", "source": "disabled", "type": "bool", "reverse": True},
+        ],
+        val_proc=[
+            [
+                {"name": "label"},
+                {"action": "combine"},
+                {"key": "name"},
+                {"text": " ("},
+                {"key": "type"},
+                {"text": ")"},
+            ]
+        ],
+        ensure_vals=[{"name": "client-ip-address"}],
+        skip=SKIP,
+    )
+    rows = [dict(row, disabled=row["name"] == "wg0") for row in ROWS]
+    seen = set()
+    data = parse_api(data={}, source=rows, seen=seen, **spec)
+    assert data == {
+        "ether1": {
+            "name": "ether1",
+            "type": "ether",
+            "enabled": True,
+            "label": "ether1 (ether)",
+            "client-ip-address": "",
+        },
+        "wg0": {
+            "name": "wg0",
+            "type": "wg",
+            "enabled": False,
+            "label": "wg0 (wg)",
+            "client-ip-address": "",
+        },
+    }
+    assert seen == {"ether1", "wg0"}
+
+    # Compiled spec is parsed again with same result
+    assert parse_api(data={}, source=rows, **spec) == data
@@ -0,0 +1,279 @@
+"""Tests for RouterOS API protocol."""
+
+import asyncio
+
+import pytest
+
+from custom_components.mikrotik_router.apiprotocol import (
+    RouterOSConnection,
+    decode_sentences,
+    encode_length,
+    encode_sentence,
+    parse_word,
+)
+from custom_components.mikrotik_router.exceptions import (
+    ApiConnectionClosed,
+    ApiFatalError,
+    ApiProtocolError,
+    ApiTrapError,
+)
+
+
+# ---------------------------
+#   FakeWriter
+# ---------------------------
+class FakeWriter:
+    """Stream writer decoding sentences sent by connection."""
+
+    def __init__(self):
+        """Initialize FakeWriter."""
+        self.sentences = []
+        self.closed = False
+        self._buffer = bytearray()
+
+    def write(self, data) -> None:
+        self._buffer += data
+        sentences, consumed = decode_sentences(self._buffer, "ASCII")
+        del self._buffer[:consumed]
+        self.sentences += sentences
+
+    async def drain(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def open_connection(timeout=1):
+    """Return connection with reader fed by test and its writer."""
+    reader = asyncio.StreamReader()
+    writer = FakeWriter()
+    return RouterOSConnection(reader, writer, "ASCII", timeout), reader, writer
+
+
+def reply(reader, *words) -> None:
+    """Feed reply sentence to connection."""
+    reader.feed_data(encode_sentence(words, "ASCII"))
+
+
+async def wait_sent(writer, count) -> None:
+    """Wait until connection sent count sentences."""
+    while len(writer.sentences) < count:
+        await asyncio.sleep(0)
+
+    # Let write finish, command is then waiting for replies
+    await asyncio.sleep(0.01)
+
+
+# ---------------------------
+#   encode_length
+# ---------------------------
+@pytest.mark.parametrize(
+    "length, encoded",
+    [
+        (0, b"\x00"),
+        (0x7F, b"\x7f"),
+        (0x80, b"\x80\x80"),
+        (0x3FFF, b"\xbf\xff"),
+        (0x4000, b"\xc0\x40\x00"),
+        (0x1FFFFF, b"\xdf\xff\xff"),
+        (0x200000, b"\xe0\x20\x00\x00"),
+        (0xFFFFFFF, b"\xef\xff\xff\xff"),
+    ],
+)
+def test_encode_length(length, encoded):
+    assert encode_length(length) == encoded
+
+
+def test_encode_length_too_long():
+    with pytest.raises(ApiProtocolError):
+        encode_length(0x10000000)
+
+
+@pytest.mark.parametrize("length", [0x7F, 0x80, 0x3FFF, 0x4000, 0x1FFFFF, 0x200000])
+def test_decode_length_boundaries(length):
+    word = "a" * length
+    sentences, consumed = decode_sentences(encode_sentence([word], "ASCII"), "ASCII")
+    assert sentences == [[word]]
+    assert consumed == len(encode_length(length)) + length + 1
+
+
+def test_decode_partial_sentence():
+    data = encode_sentence(["!re", "=name=" + "x" * 0x4000], "ASCII")
+    data += encode_sentence(["!done"], "ASCII")
+    first = len(data) - len(encode_sentence(["!done"], "ASCII"))
+    for end in range(first):
+        assert decode_sentences(data[:end], "ASCII") == ([], 0)
+
+    sentences, consumed = decode_sentences(data, "ASCII")
+    assert [words[0] for words in sentences] == ["!re", "!done"]
+    assert consumed == len(data)
+
+
+def test_decode_unknown_control_byte():
+    with pytest.raises(ApiProtocolError):
+        decode_sentences(b"\xf8\x00", "ASCII")
+
+
+# ---------------------------
+#   parse_word
+# ---------------------------
+@pytest.mark.parametrize(
+    "word, expected",
+    [
+        ("=mtu=1500", ("mtu", 1500)),
+        ("=vlan=007", ("vlan", "007")),
+        ("=disabled=true", ("disabled", True)),
+        ("=running=no", ("running", False)),
+        ("=comment=a=b", ("comment", "a=b")),
+        ("=comment=", ("comment", "")),
+    ],
+)
+def test_parse_word(word, expected):
+    assert parse_word(word) == expected
+
+
+# ---------------------------
+#   RouterOSConnection
+# ---------------------------
+def test_talk_demultiplexes_tags():
+    async def run():
+        connection, reader, writer = open_connection()
+        first = asyncio.create_task(connection.talk("/interface/print"))
+        second = asyncio.create_task(connection.talk("/ip/arp/print"))
+        await wait_sent(writer, 2)
+        assert writer.sentences == [
+            ["/interface/print", ".tag=1"],
+            ["/ip/arp/print", ".tag=2"],
+        ]
+
+        reply(reader, "!re", "=name=ether1", ".tag=1")
+        reply(reader, "!re", "=address=10.0.0.1", ".tag=2")
+        reply(reader, "!done", ".tag=2")
+        reply(reader, "!re", "=name=ether2", ".tag=1")
+        reply(reader, "!done", ".tag=1")
+        assert await first == [{"name": "ether1"}, {"name": "ether2"}]
+        assert await second == [{"address": "10.0.0.1"}]
+        connection.close()
+
+    asyncio.run(run())
+
+
+def test_talk_callback_receives_rows():
+    async def run():
+        connection, reader, writer = open_connection()
+        rows = []
+        task = asyncio.create_task(connection.talk("/log/print", callback=rows.append))
+        await wait_sent(writer, 1)
+        reply(reader, "!re", "=message=one", ".tag=1")
+        reply(reader, "!re", "=message=two", ".tag=1")
+        reply(reader, "!done", ".tag=1")
+        assert await task == []
+        assert rows == [{"message": "one"}, {"message": "two"}]
+        connection.close()
+
+    asyncio.run(run())
+
+
+def test_talk_trap():
+    async def run():
+        connection, reader, writer = open_connection()
+        task = asyncio.create_task(connection.talk("/interface/set"))
+        await wait_sent(writer, 1)
+        reply(reader, "!trap", "=message=no such item", "=category=2", ".tag=1")
+        reply(reader, "!done", ".tag=1")
+        with pytest.raises(ApiTrapError) as error:
+            await task
+
+        assert error.value.message == "no such item"
+        assert error.value.category == 2
+
+        # Connection stays usable after trap
+        task = asyncio.create_task(connection.talk("/interface/print"))
+        await wait_sent(writer, 2)
+        reply(reader, "!done", ".tag=2")
+        assert await task == []
+        connection.close()
+
+    asyncio.run(run())
+
+
+def test_talk_cancel_sends_cancel():
+    async def run():
+        connection, reader, writer = open_connection()
+        task = asyncio.create_task(connection.talk("/interface/listen", timeout=False))
+        await wait_sent(writer, 1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert writer.sentences[1] == ["/cancel", "=tag=1", ".tag=cancel-1"]
+
+        # Late replies of cancelled command are ignored
+        reply(reader, "!trap", "=message=interrupted", "=category=2", ".tag=1")
+        reply(reader, "!done", ".tag=cancel-1")
+        task = asyncio.create_task(connection.talk("/interface/print"))
+        await wait_sent(writer, 3)
+        reply(reader, "!done", ".tag=2")
+        assert await task == []
+        connection.close()
+
+    asyncio.run(run())
+
+
+def test_talk_timeout():
+    async def run():
+        connection, _, writer = open_connection(timeout=0.05)
+        with pytest.raises(asyncio.TimeoutError):
+            await connection.talk("/interface/print")
+
+        assert writer.sentences[1] == ["/cancel", "=tag=1", ".tag=cancel-1"]
+        connection.close()
+
+    asyncio.run(run())
+
+
+def test_talk_timeout_extended_by_activity():
+    async def run():
+        connection, reader, writer = open_connection(timeout=0.05)
+        task = asyncio.create_task(connection.talk("/ip/dhcp-server/lease/print"))
+        await wait_sent(writer, 1)
+        for _ in range(5):
+            await asyncio.sleep(0.03)
+            reply(reader, "!re", "=address=10.0.0.1", ".tag=1")
+
+        reply(reader, "!done", ".tag=1")
+        assert len(await task) == 5
+        connection.close()
+
+    asyncio.run(run())
+
+
+def test_connection_closed_by_router():
+    async def run():
+        connection, reader, writer = open_connection()
+        task = asyncio.create_task(connection.talk("/interface/print"))
+        await wait_sent(writer, 1)
+        reader.feed_eof()
+        with pytest.raises(ApiConnectionClosed):
+            await task
+
+        assert connection.closed
+        with pytest.raises(ApiConnectionClosed):
+            await connection.talk("/interface/print")
+
+    asyncio.run(run())
+
+
+def test_fatal_fails_pending():
+    async def run():
+        connection, reader, writer = open_connection()
+        task = asyncio.create_task(connection.talk("/interface/print"))
+        await wait_sent(writer, 1)
+        reply(reader, "!fatal", "session terminated")
+        with pytest.raises(ApiFatalError):
+            await task
+
+        assert connection.closed
+
+    asyncio.run(run())
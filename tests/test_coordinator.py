@@ -0,0 +1,465 @@
+"""Tests for Mikrotik Router coordinator."""
+
+import asyncio
+from datetime import timedelta
+
+from homeassistant.util.dt import utcnow
+
+from benchmarks.fake_routeros import FakeRouterOS, _mac, build_tables
+from benchmarks.run import OPTIONS
+
+from custom_components.mikrotik_router import coordinator as coordinator_module
+from custom_components.mikrotik_router.const import (
+    CONF_STALE_ROW_TIMEOUT,
+    CONF_SUBSCRIBE_CHANGES,
+    CONF_TRACK_HOSTS_PASSIVE,
+)
+from custom_components.mikrotik_router.coordinator import ARP_SPEC, NAT_SPEC
+
+from .common import SIZE, async_fake_router, async_wait_for
+
+SUBSCRIBE_OPTIONS = {**OPTIONS, CONF_SUBSCRIBE_CHANGES: True}
+STALE_OPTIONS = {**OPTIONS, CONF_STALE_ROW_TIMEOUT: 60}
+
+
+# ---------------------------
+#   NoListenRouter
+# ---------------------------
+class NoListenRouter(FakeRouterOS):
+    """Fake router without listen support for netwatch."""
+
+    def _reply(self, writer, words) -> list:
+        if words[0] == "/tool/netwatch/listen":
+            tag = [word for word in words[1:] if word.startswith(".tag=")]
+            return [["!trap", "=message=no such command", *tag], ["!done", *tag]]
+
+        return super()._reply(writer, words)
+
+
+def sfp_tables(count=1) -> dict:
+    """Return router tables with SFP ports after copper ports."""
+    tables = build_tables(SIZE)
+    for i in range(1, count + 1):
+        add_sfp_port(tables, i)
+
+    return tables
+
+
+def add_sfp_port(tables, index) -> None:
+    name = f"sfp{index}"
+    tables["/interface"].append(
+        {".id": f"*5{index}", "name": name, "default-name": name, "type": "ether"}
+    )
+    tables["/interface/ethernet"].append(
+        {
+            ".id": f"*5{index}",
+            "name": name,
+            "default-name": name,
+            "sfp-shutdown-temperature": "95",
+        }
+    )
+    tables["/interface/ethernet/monitor"].append(
+        {
+            "name": name,
+            "status": "link-ok",
+            "sfp-temperature": "40",
+            "sfp-type": "SFP/SFP+/SFP28",
+            "sfp-vendor-name": "MikroTik",
+        }
+    )
+
+
+def monitor_row(tables, name) -> dict:
+    for row in tables["/interface/ethernet/monitor"]:
+        if row["name"] == name:
+            return row
+
+
+# ---------------------------
+#   interface_ethernet
+# ---------------------------
+def test_ethernet_status_fast_sfp_info_slow():
+    async def run():
+        tables = sfp_tables()
+        async with async_fake_router(tables) as (_, coordinator, _):
+            await coordinator._async_update_data()
+            sfp = coordinator.ds["interface"]["sfp1"]
+            assert sfp["sfp-vendor-name"] == "MikroTik"
+            assert sfp["sfp-temperature"] == 40
+
+            monitor_row(tables, "sfp1").update(
+                {"status": "no-link", "sfp-temperature": "45", "sfp-vendor-name": "FS"}
+            )
+            monitor_row(tables, "ether1")["status"] = "no-link"
+            await coordinator._async_update_data()
+            # Status and module readings are polled every update
+            assert coordinator.ds["interface"]["ether1"]["status"] == "no-link"
+            assert sfp["status"] == "no-link"
+            assert sfp["sfp-temperature"] == 45
+            # Module info waits for slow tier
+            assert sfp["sfp-vendor-name"] == "MikroTik"
+
+            coordinator.stage_last_run.pop("interface_sfp")
+            await coordinator._async_update_data()
+            assert sfp["sfp-vendor-name"] == "FS"
+
+    asyncio.run(run())
+
+
+def test_ethernet_new_sfp_port_gets_info():
+    async def run():
+        tables = sfp_tables()
+        async with async_fake_router(tables) as (_, coordinator, _):
+            await coordinator._async_update_data()
+            add_sfp_port(tables, 2)
+            monitor_row(tables, "sfp1")["sfp-vendor-name"] = "FS"
+            await coordinator._async_update_data()
+            assert coordinator.ds["interface"]["sfp2"]["sfp-vendor-name"] == "MikroTik"
+            assert coordinator.ds["interface"]["sfp2"]["sfp-temperature"] == 40
+            assert coordinator.ds["interface"]["sfp1"]["sfp-vendor-name"] == "FS"
+
+    asyncio.run(run())
+
+
+# ---------------------------
+#   async_listen
+# ---------------------------
+def test_listen_applies_changes():
+    async def run():
+        async with async_fake_router(options=SUBSCRIBE_OPTIONS) as (
+            server,
+            coordinator,
+            _,
+        ):
+            await coordinator._async_update_data()
+            await async_wait_for(lambda: len(server._listeners) == 5)
+            arp = coordinator.ds["arp"]
+            updated = []
+            coordinator.async_add_row_listener(
+                "arp", _mac(1), lambda: updated.append(_mac(1))
+            )
+            coordinator.async_add_row_listener(
+                "arp", _mac(2), lambda: updated.append(_mac(2))
+            )
+
+            server.set_row("/ip/arp", {".id": "*1", "address": "10.9.9.9"})
+            await async_wait_for(lambda: arp[_mac(1)]["address"] == "10.9.9.9")
+            await async_wait_for(lambda: updated)
+            assert updated == [_mac(1)]
+
+            server.remove_row("/ip/arp", "*2")
+            await async_wait_for(lambda: _mac(2) not in arp)
+            # Removed rows have no entity left to update
+            assert updated == [_mac(1)]
+            assert not coordinator.listen_changes
+
+    asyncio.run(run())
+
+
+def test_listen_unsupported_path_is_polled():
+    async def run():
+        server = NoListenRouter(build_tables(SIZE))
+        async with async_fake_router(server=server, options=SUBSCRIBE_OPTIONS) as (
+            _,
+            coordinator,
+            _,
+        ):
+            await coordinator._async_update_data()
+            await async_wait_for(lambda: coordinator.listen_unsupported)
+            assert coordinator.listen_unsupported == {"netwatch"}
+            assert "netwatch" not in coordinator._subscriptions()
+            assert "arp" in coordinator._subscriptions()
+            assert coordinator.api.connected()
+
+    asyncio.run(run())
+
+
+# ---------------------------
+#   _apply_rows
+# ---------------------------
+def test_apply_rows():
+    async def run():
+        async with async_fake_router() as (_, coordinator, _):
+            await coordinator._async_update_data()
+            arp = coordinator.ds["arp"]
+            uids = coordinator._apply_rows(
+                "arp",
+                [
+                    # Changed
+                    {".id": "*1", "mac-address": _mac(1), "address": "10.9.9.9"},
+                    # MAC address changed, row moves to new uid
+                    {".id": "*2", "mac-address": _mac(99), "address": "10.0.0.99"},
+                    # Removed
+                    {".id": "*3", ".dead": True},
+                    # Added
+                    {".id": "*100", "mac-address": _mac(100), "address": "10.0.1.0"},
+                    # Unknown removed row
+                    {".id": "*200", ".dead": True},
+                ],
+                ARP_SPEC,
+            )
+            assert uids == {_mac(1), _mac(2), _mac(99), _mac(3), _mac(100)}
+            assert arp[_mac(1)]["address"] == "10.9.9.9"
+            assert arp[_mac(99)][".id"] == "*2"
+            assert arp[_mac(100)]["address"] == "10.0.1.0"
+            assert arp[_mac(100)]["bridge"] == ""
+            assert _mac(2) not in arp
+            assert _mac(3) not in arp
+
+    asyncio.run(run())
+
+
+# ---------------------------
+#   detect_changed_rows
+# ---------------------------
+def test_detect_changed_rows():
+    async def run():
+        async with async_fake_router() as (_, coordinator, _):
+            coordinator.ds["nat"] = {"*1": {"comment": "a"}, "*2": {"comment": "b"}}
+            remove = {
+                uid: coordinator.async_add_row_listener("nat", uid, lambda: None)
+                for uid in ("*1", "*2", "*3")
+            }
+            # Rows without snapshot are changed, missing row too
+            assert coordinator.detect_changed_rows() == {"nat": {"*1", "*2", "*3"}}
+            assert coordinator.detect_changed_rows() == {}
+
+            coordinator.ds["nat"]["*1"]["comment"] = "c"
+            del coordinator.ds["nat"]["*2"]
+            coordinator.ds["nat"]["*4"] = {"comment": "d"}
+            assert coordinator.detect_changed_rows() == {"nat": {"*1", "*2"}}
+
+            # Snapshots of rows without listeners are dropped
+            remove["*1"]()
+            assert coordinator.detect_changed_rows() == {}
+            assert set(coordinator.row_snapshots["nat"]) == {"*2", "*3"}
+
+    asyncio.run(run())
+
+
+def test_row_changed():
+    async def run():
+        async with async_fake_router() as (_, coordinator, tracker_coordinator):
+            coordinator.changed_rows = None
+            assert coordinator.row_changed("nat", "*1")
+
+            coordinator.changed_rows = {"nat": {"*1"}}
+            assert coordinator.row_changed("nat", "*1")
+            assert not coordinator.row_changed("nat", "*2")
+            assert not coordinator.row_changed("filter", "*1")
+            # Tracker state depends on time
+            assert tracker_coordinator.row_changed("host", "*2")
+
+    asyncio.run(run())
+
+
+def test_async_update_rows():
+    async def run():
+        async with async_fake_router() as (_, coordinator, _):
+            updated = []
+            coordinator.ds["nat"] = {"*1": {"comment": "a"}, "*2": {"comment": "b"}}
+            for uid in ("*1", "*2", "*3"):
+                coordinator.async_add_row_listener(
+                    "nat", uid, lambda uid=uid: updated.append(uid)
+                )
+
+            coordinator.detect_changed_rows()
+            coordinator.ds["nat"]["*1"]["comment"] = "c"
+            coordinator.async_update_rows({"nat": {"*1", "*3"}})
+            # Missing rows are skipped, updated row is not changed again
+            assert updated == ["*1"]
+            assert coordinator.detect_changed_rows() == {}
+
+    asyncio.run(run())
+
+
+# ---------------------------
+#   update_host_passive
+# ---------------------------
+def test_host_passive_age():
+    async def run():
+        async with async_fake_router() as (_, coordinator, _):
+            await coordinator._async_update_data()
+            uid = _mac(1)
+            ds = coordinator.ds
+            ds["arp"][uid]["status"] = "stale"
+            ds["dhcp"][uid]["last-seen"] = "5m"
+            ds["bridge_host"][uid]["age"] = "30s"
+            assert coordinator.get_host_passive_age(uid) == 30
+
+            ds["arp"][uid]["status"] = "delay"
+            assert coordinator.get_host_passive_age(uid) == 0
+
+            del ds["arp"][uid]
+            del ds["bridge_host"][uid]
+            assert coordinator.get_host_passive_age(uid) == 300
+
+            # Lease which is not bound does not count
+            ds["dhcp"][uid]["status"] = "waiting"
+            assert coordinator.get_host_passive_age(uid) is None
+
+    asyncio.run(run())
+
+
+def test_tracker_passive_mode():
+    async def run():
+        tables = build_tables(SIZE)
+        tables["/ip/arp"][1]["status"] = "stale"
+        tables["/ip/dhcp-server/lease"][1]["last-seen"] = "1h"
+        tables["/ip/arp"][2]["status"] = "failed"
+        tables["/ip/dhcp-server/lease"][2]["last-seen"] = "1m"
+        del tables["/interface/bridge/host"][1:3]
+        options = {**OPTIONS, CONF_TRACK_HOSTS_PASSIVE: True}
+        async with async_fake_router(tables, options) as (server, coordinator, tracker):
+            await coordinator._async_update_data()
+            commands = server.commands
+            await tracker._async_update_data()
+            # Availability comes from collected data, nothing is pinged
+            assert server.commands == commands
+
+            hosts = coordinator.ds["host"]
+            assert hosts[_mac(0)]["available"]
+            assert not hosts[_mac(1)]["available"]
+            assert hosts[_mac(2)]["available"]
+            assert (utcnow() - hosts[_mac(2)]["last-seen"]).total_seconds() >= 60
+
+    asyncio.run(run())
+
+
+# ---------------------------
+#   expire_rows
+# ---------------------------
+def backdate_missing(coordinator, data_path, seconds=61) -> None:
+    missing = coordinator.rows_missing[data_path]
+    for uid in missing:
+        missing[uid] -= timedelta(seconds=seconds)
+
+
+def test_expire_rows_after_timeout():
+    async def run():
+        async with async_fake_router(options=STALE_OPTIONS) as (_, coordinator, _):
+            coordinator.ds["nat"] = {"*1": {}, "*2": {}, "*3": {}}
+            assert coordinator.expire_rows("nat", {"*1"}) == []
+            assert set(coordinator.rows_missing["nat"]) == {"*2", "*3"}
+
+            # Row seen again is no longer tracked as missing
+            backdate_missing(coordinator, "nat")
+            assert coordinator.expire_rows("nat", {"*1", "*2"}) == ["*3"]
+            assert set(coordinator.ds["nat"]) == {"*1", "*2"}
+            assert coordinator.rows_missing["nat"] == {}
+
+    asyncio.run(run())
+
+
+def test_expire_rows_timeout_disabled():
+    async def run():
+        options = {**OPTIONS, CONF_STALE_ROW_TIMEOUT: 0}
+        async with async_fake_router(options=options) as (_, coordinator, _):
+            coordinator.ds["nat"] = {"*1": {}, "*2": {}}
+            coordinator.expire_rows("nat", {"*1"})
+            backdate_missing(coordinator, "nat", 86400)
+            assert coordinator.expire_rows("nat", {"*1"}) == []
+            assert set(coordinator.ds["nat"]) == {"*1", "*2"}
+
+    asyncio.run(run())
+
+
+# ---------------------------
+#   async_parse_query
+# ---------------------------
+def test_parse_query_empty_table_expires_rows():
+    async def run():
+        async with async_fake_router(options=STALE_OPTIONS) as (
+            server,
+            coordinator,
+            _,
+        ):
+            await coordinator.async_parse_query(
+                "/ip/firewall/nat", data_path="nat", **NAT_SPEC
+            )
+            uids = set(coordinator.ds["nat"])
+            assert uids
+
+            # Empty table is returned as None by api
+            server.tables["/ip/firewall/nat"] = []
+            await coordinator.async_parse_query(
+                "/ip/firewall/nat", data_path="nat", **NAT_SPEC
+            )
+            assert set(coordinator.rows_missing["nat"]) == uids
+            backdate_missing(coordinator, "nat")
+            await coordinator.async_parse_query(
+                "/ip/firewall/nat", data_path="nat", **NAT_SPEC
+            )
+            assert coordinator.ds["nat"] == {}
+
+    asyncio.run(run())
+
+
+def test_parse_query_trap_keeps_rows():
+    async def run():
+        async with async_fake_router(options=STALE_OPTIONS) as (
+            server,
+            coordinator,
+            _,
+        ):
+            await coordinator.async_parse_query(
+                "/ip/firewall/nat", data_path="nat", **NAT_SPEC
+            )
+            rows = dict(coordinator.ds["nat"])
+            assert rows
+            coordinator.rows_missing["nat"] = {}
+
+            # Print of removed table is answered with !trap
+            del server.tables["/ip/firewall/nat"]
+            data = await coordinator.async_parse_query(
+                "/ip/firewall/nat", data_path="nat", **NAT_SPEC
+            )
+            assert data is coordinator.ds["nat"]
+            assert coordinator.ds["nat"] == rows
+            assert coordinator.rows_missing["nat"] == {}
+            assert coordinator.api.connected()
+
+    asyncio.run(run())
+
+
+# ---------------------------
+#   async_request_path_refresh
+# ---------------------------
+def prints(coordinator, path) -> int:
+    return coordinator.api.stats.totals.get(f"{path}/print", {}).get("count", 0)
+
+
+def test_request_path_refresh(monkeypatch):
+    monkeypatch.setattr(coordinator_module, "WRITE_REFRESH_COOLDOWN", 0.05)
+
+    async def run():
+        async with async_fake_router() as (server, coordinator, _):
+            await coordinator.async_refresh()
+            paths = ("/ip/firewall/nat", "/ip/firewall/filter", "/interface")
+            before = {path: prints(coordinator, path) for path in paths}
+            updates = []
+            coordinator.async_add_listener(lambda: updates.append(True))
+            coordinator.async_add_row_listener("nat", "*n0", lambda: None)
+            coordinator.async_add_row_listener("nat", "*n1", lambda: None)
+            coordinator.detect_changed_rows()
+
+            server.set_row("/ip/firewall/nat", {".id": "*n0", "comment": "changed"})
+            # Requests within cooldown are combined into one refresh
+            coordinator.async_request_path_refresh("nat")
+            coordinator.async_request_path_refresh("filter")
+            coordinator.async_request_path_refresh("nat")
+            assert coordinator.refresh_paths == {"nat", "filter"}
+
+            await async_wait_for(lambda: updates)
+            assert coordinator.refresh_paths == set()
+            assert coordinator.ds["nat"]["*n0"]["comment"] == "changed"
+            assert coordinator.changed_rows == {"nat": {"*n0"}}
+            # Only stages of requested tables run
+            assert {
+                path: prints(coordinator, path) - before[path] for path in paths
+            } == {"/ip/firewall/nat": 1, "/ip/firewall/filter": 1, "/interface": 0}
+
+            await asyncio.sleep(0.1)
+            assert updates == [True]
+
+    asyncio.run(run())
@@ -0,0 +1,30 @@
+"""Tests for helper functions."""
+
+import pytest
+
+from custom_components.mikrotik_router.helper import parse_duration
+
+
+# ---------------------------
+#   parse_duration
+# ---------------------------
+@pytest.mark.parametrize(
+    "value, seconds",
+    [
+        ("5s", 5),
+        ("1w2d3h4m5s", 788645),
+        ("500ms", 0.5),
+        ("1m30s500ms", 90.5),
+        ("00:00:05", 5),
+        ("1d02:03:04", 93784),
+        ("02:03:04.123", 7384),
+        (42, 42),
+        ("", None),
+        ("never", None),
+        ("5x", None),
+        (None, None),
+        (True, None),
+    ],
+)
+def test_parse_duration(value, seconds):
+    assert parse_duration(value) == seconds
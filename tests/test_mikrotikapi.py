@@ -0,0 +1,216 @@
+"""Tests for Mikrotik API."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from benchmarks.fake_routeros import FakeRouterOS, build_tables
+
+from custom_components.mikrotik_router.exceptions import ApiTrapError
+from custom_components.mikrotik_router.mikrotikapi import MikrotikAPI
+
+from .common import SIZE, async_wait_for
+
+TRAP = "=message=unknown parameter"
+
+
+# ---------------------------
+#   QueryRouter
+# ---------------------------
+class QueryRouter(FakeRouterOS):
+    """Fake router rejecting query words on some paths."""
+
+    def __init__(self, tables, rejected=(), **kwargs):
+        """Initialize QueryRouter."""
+        super().__init__(tables, **kwargs)
+        self.rejected = set(rejected)
+        self.queries = []
+
+    def _print(self, path, args, query, tag) -> list:
+        self.queries.append((path, query))
+        if query and path in self.rejected:
+            return [["!trap", TRAP, *tag], ["!done", *tag]]
+
+        return super()._print(path, args, query, tag)
+
+
+# ---------------------------
+#   PingRouter
+# ---------------------------
+class PingRouter(FakeRouterOS):
+    """Fake router answering pings after delay, counting pings in flight."""
+
+    def __init__(self, tables, unreachable=(), delay=0.02):
+        """Initialize PingRouter."""
+        super().__init__(tables)
+        self.unreachable = set(unreachable)
+        self.delay = delay
+        self.pinged = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _reply(self, writer, words) -> list:
+        if words[0] != "/ping":
+            return super()._reply(writer, words)
+
+        args = self._args(words)
+        tag = [word for word in words[1:] if word.startswith(".tag=")]
+        received = 0 if args["address"] in self.unreachable else args["count"]
+        self.pinged.append((args["address"], args["interface"]))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        def answer():
+            self.in_flight -= 1
+            self._write(
+                writer,
+                [
+                    ["!re", f"=sent={args['count']}", f"=received={received}", *tag],
+                    ["!done", *tag],
+                ],
+            )
+
+        asyncio.get_running_loop().call_later(self.delay, answer)
+        return []
+
+
+@asynccontextmanager
+async def async_api(server):
+    """Yield API connected to fake router."""
+    port = await server.start()
+    api = MikrotikAPI("127.0.0.1", "admin", "", port, use_ssl=False)
+    try:
+        yield api
+    finally:
+        api.close()
+        await server.close()
+
+
+# ---------------------------
+#   query
+# ---------------------------
+def test_query_words_rejected_by_router():
+    async def run():
+        server = QueryRouter(build_tables(SIZE), rejected={"/ip/arp"})
+        async with async_api(server) as api:
+            query = ["?interface=bridge"]
+            rows = await api.query("/ip/arp", query=query)
+            # Rows are filtered on client when router rejects query words
+            assert len(rows) == len(server.tables["/ip/arp"])
+            assert api.query_unsupported == {"/ip/arp"}
+
+            await api.query("/ip/arp", query=query)
+            assert server.queries[-1] == ("/ip/arp", [])
+            assert api.connected()
+
+    asyncio.run(run())
+
+
+def test_query_trap_not_caused_by_query_words():
+    async def run():
+        server = QueryRouter(build_tables(SIZE))
+        async with async_api(server) as api:
+            query = ["?disabled=false"]
+            assert await api.query("/routing/bgp/peer", query=query) is None
+            # Path traps without query words too, they stay in use
+            assert api.query_unsupported == set()
+            assert await api.query("/ip/arp", query=query) is not None
+            assert server.queries[-1] == ("/ip/arp", query)
+
+    asyncio.run(run())
+
+
+def test_query_raise_trap():
+    async def run():
+        tables = build_tables(SIZE)
+        tables["/ip/firewall/nat"] = []
+        server = QueryRouter(tables, rejected={"/ip/arp"})
+        async with async_api(server) as api:
+            # Empty table and trap both return None unless trap is raised
+            assert await api.query("/ip/firewall/nat", raise_trap=True) is None
+            with pytest.raises(ApiTrapError):
+                await api.query("/routing/bgp/peer", raise_trap=True)
+
+            with pytest.raises(ApiTrapError):
+                await api.query(
+                    "/routing/bgp/peer", query=["?disabled=false"], raise_trap=True
+                )
+
+            # Retry without rejected query words succeeds
+            query = ["?disabled=false"]
+            assert await api.query("/ip/arp", query=query, raise_trap=True)
+            assert api.query_unsupported == {"/ip/arp"}
+            assert api.connected()
+            # Trapped calls are recorded too
+            assert api.stats.totals["/routing/bgp/peer/print"]["count"] == 2
+
+    asyncio.run(run())
+
+
+# ---------------------------
+#   _find_id
+# ---------------------------
+def test_find_id():
+    async def run():
+        server = QueryRouter(build_tables(SIZE))
+        async with async_api(server) as api:
+            # .id is used as given without query
+            assert await api._find_id("/system/script", ".id", "*9") == "*9"
+            assert server.queries == []
+
+            assert await api._find_id("/system/script", "name", "backup") == "*1"
+            assert server.queries == [("/system/script", ["?name=backup"])]
+            assert await api._find_id("/system/script", "name", "missing") is None
+            assert await api._find_id("/interface", "name", "ether2") == "*2"
+
+    asyncio.run(run())
+
+
+def test_find_id_query_words_rejected():
+    async def run():
+        server = QueryRouter(build_tables(SIZE), rejected={"/system/script"})
+        async with async_api(server) as api:
+            # Full table is matched locally instead
+            assert await api._find_id("/system/script", "name", "backup") == "*1"
+            assert server.queries[-1] == ("/system/script", [])
+            assert await api._find_id("/system/script", "name", "missing") is None
+
+    asyncio.run(run())
+
+
+# ---------------------------
+#   arp_ping_hosts
+# ---------------------------
+def test_arp_ping_hosts_concurrency():
+    async def run():
+        server = PingRouter(build_tables(SIZE), unreachable={"10.0.0.3"})
+        async with async_api(server) as api:
+            hosts = {
+                f"uid{index}": (f"10.0.0.{index}", "bridge") for index in range(10)
+            }
+            result = await api.arp_ping_hosts(hosts, 3)
+            assert result == {uid: uid != "uid3" for uid in hosts}
+            assert sorted(server.pinged) == sorted(hosts.values())
+            assert server.max_in_flight == 3
+
+            server.max_in_flight = 0
+            assert await api.arp_ping_hosts(hosts, 20) == result
+            assert server.max_in_flight == 10
+
+    asyncio.run(run())
+
+
+def test_arp_ping_hosts_disconnected():
+    async def run():
+        server = PingRouter(build_tables(SIZE), delay=10)
+        async with async_api(server) as api:
+            task = asyncio.create_task(
+                api.arp_ping_hosts({"uid1": ("10.0.0.1", "bridge")}, 5)
+            )
+            await async_wait_for(lambda: server.pinged)
+            api.disconnect()
+            # Pending pings fail, hosts are reported unavailable
+            assert await task == {"uid1": False}
+
+    asyncio.run(run())
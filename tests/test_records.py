@@ -0,0 +1,96 @@
+"""Tests for record types."""
+
+import copy
+import pickle
+
+import pytest
+
+from custom_components.mikrotik_router.records import (
+    ClientTrafficRecord,
+    HostRecord,
+)
+
+
+# ---------------------------
+#   Record
+# ---------------------------
+def test_record_defaults_and_values():
+    host = HostRecord({"source": "arp", "address": "10.0.0.2"})
+    assert dict(host) == {
+        "source": "arp",
+        "address": "10.0.0.2",
+        "mac-address": "unknown",
+        "interface": "unknown",
+        "host-name": "unknown",
+        "manufacturer": "detect",
+        "last-seen": False,
+        "available": False,
+    }
+    assert host == dict(host)
+    assert dict(ClientTrafficRecord()) == {}
+
+
+def test_record_missing_keys():
+    host = HostRecord()
+    assert "signal-strength" not in host
+    assert host.get("signal-strength") is None
+    with pytest.raises(KeyError):
+        host["signal-strength"]
+
+    host["signal-strength"] = -60
+    assert "signal-strength" in host
+    assert host["signal-strength"] == -60
+
+    del host["signal-strength"]
+    assert "signal-strength" not in host
+    with pytest.raises(KeyError):
+        del host["signal-strength"]
+
+    assert "unknown-field" not in host
+    with pytest.raises(KeyError):
+        host["unknown-field"]
+
+
+def test_record_rejects_unknown_field():
+    host = HostRecord()
+    with pytest.raises(KeyError, match="HostRecord has no field tx"):
+        host["tx"] = 1
+
+    with pytest.raises(KeyError):
+        HostRecord({"tx": 1})
+
+    # Slots leave no room for other attributes
+    with pytest.raises(AttributeError):
+        host.extra = 1
+
+
+def test_record_iterates_set_fields_in_key_order():
+    traffic = ClientTrafficRecord({"rx": 2, "address": "10.0.0.2", "tx": 1})
+    assert list(traffic) == ["address", "tx", "rx"]
+    assert len(traffic) == 3
+    traffic.update({"wan-tx": 5})
+    assert len(traffic) == 4
+    assert traffic.setdefault("wan-rx", 0) == 0
+    assert traffic["wan-rx"] == 0
+
+
+def test_record_interns_strings():
+    interface = "".join(["bridge", "-lan"])
+    first = HostRecord({"interface": interface, "host-name": interface})
+    second = HostRecord({"interface": "".join(["bridge", "-lan"])})
+    assert first["interface"] is second["interface"]
+    assert first["host-name"] is interface
+
+
+def test_record_copy_and_pickle():
+    host = HostRecord({"source": "dhcp", "tx-rate": "54Mbps"})
+    for other in (
+        copy.copy(host),
+        copy.deepcopy(host),
+        pickle.loads(pickle.dumps(host)),
+    ):
+        assert type(other) is HostRecord
+        assert other == host
+        assert other is not host
+
+    assert repr(host) == f"HostRecord({dict(host)})"
@@ -0,0 +1,216 @@
+"""Tests for update stage scheduler."""
+
+import asyncio
+from time import monotonic
+
+import pytest
+
+from custom_components.mikrotik_router.scheduler import (
+    TIER_FAST,
+    TIER_MEDIUM,
+    TIER_SLOW,
+    UpdateStage,
+    async_run_stages,
+    select_stages,
+    sort_stages,
+)
+
+INTERVALS = {TIER_FAST: None, TIER_MEDIUM: 300, TIER_SLOW: 3600}
+
+
+def make_stages(ran, *specs):
+    """Return stages from (name, deps, tier) recording their runs to ran."""
+
+    def record(name):
+        async def run():
+            ran.append(name)
+
+        return run
+
+    return [
+        UpdateStage(name, record(name), deps, tier=tier) for name, deps, tier in specs
+    ]
+
+
+def names(stages) -> list:
+    return [stage.name for stage in stages]
+
+
+# ---------------------------
+#   sort_stages
+# ---------------------------
+def test_sort_stages_follows_dependencies():
+    stages = make_stages(
+        [],
+        ("host", ("arp", "dhcp"), TIER_FAST),
+        ("dhcp", ("arp",), TIER_FAST),
+        ("arp", (), TIER_FAST),
+    )
+    assert names(sort_stages(stages)) == ["arp", "dhcp", "host"]
+
+
+def test_sort_stages_detects_cycle():
+    stages = make_stages(
+        [],
+        ("arp", ("host",), TIER_FAST),
+        ("dhcp", ("arp",), TIER_FAST),
+        ("host", ("dhcp",), TIER_FAST),
+    )
+    with pytest.raises(ValueError, match="cycle: arp -> host -> dhcp -> arp"):
+        sort_stages(stages)
+
+
+def test_sort_stages_unknown_dependency():
+    with pytest.raises(ValueError, match="unknown arp"):
+        sort_stages(make_stages([], ("dhcp", ("arp",), TIER_FAST)))
+
+
+# ---------------------------
+#   select_stages
+# ---------------------------
+def test_select_stages_adds_dependents_and_drops_dependencies():
+    stages = make_stages(
+        [],
+        ("bridge", (), TIER_FAST),
+        ("interface", (), TIER_FAST),
+        ("arp", ("bridge",), TIER_FAST),
+        ("interface_client", ("interface", "arp"), TIER_FAST),
+        ("host", ("interface_client",), TIER_FAST),
+        ("nat", (), TIER_MEDIUM),
+    )
+    selected = select_stages(stages, {"arp"})
+    assert names(selected) == ["arp", "interface_client", "host"]
+    assert [stage.deps for stage in selected] == [(), ("arp",), ("interface_client",)]
+    # Dropped dependencies do not fail sorting
+    assert names(sort_stages(selected)) == ["arp", "interface_client", "host"]
+    # Original stages are not changed
+    assert stages[2].deps == ("bridge",)
+
+
+def test_select_stages_unknown_name():
+    assert select_stages(make_stages([], ("nat", (), TIER_MEDIUM)), {"filter"}) == []
+
+
+# ---------------------------
+#   async_run_stages
+# ---------------------------
+def test_run_stages_waits_for_dependencies():
+    events = []
+
+    def stage(name, delay):
+        async def run():
+            events.append(f"{name} start")
+            await asyncio.sleep(delay)
+            events.append(f"{name} end")
+
+        return run
+
+    stages = [
+        UpdateStage("host", stage("host", 0), ("arp", "dhcp")),
+        UpdateStage("arp", stage("arp", 0.02)),
+        UpdateStage("dhcp", stage("dhcp", 0.01)),
+    ]
+    asyncio.run(async_run_stages(stages))
+    # Independent stages run concurrently, dependent one after both
+    assert events[:2] == ["arp start", "dhcp start"]
+    assert events[-2:] == ["host start", "host end"]
+
+
+def test_run_stages_condition_skips_stage_not_dependents():
+    ran = []
+    stages = make_stages(
+        ran, ("capsman_hosts", (), TIER_FAST), ("host", ("capsman_hosts",), TIER_FAST)
+    )
+    stages[0].condition = lambda: False
+    asyncio.run(async_run_stages(stages))
+    assert ran == ["host"]
+
+
+def test_run_stages_tiers_due():
+    ran = []
+    now = monotonic()
+    stages = make_stages(
+        ran,
+        ("resource", (), TIER_FAST),
+        ("nat", (), TIER_MEDIUM),
+        ("filter", (), TIER_MEDIUM),
+        ("dns", (), TIER_SLOW),
+        ("script", (), TIER_SLOW),
+        ("queue", (), TIER_SLOW),
+    )
+    last_run = {
+        "resource": now,
+        "nat": now,
+        "filter": now - 301,
+        "dns": now - 301,
+        "script": now - 3601,
+    }
+    asyncio.run(async_run_stages(stages, intervals=INTERVALS, last_run=last_run))
+    # Fast tier always, others once interval elapsed or never run
+    assert sorted(ran) == ["filter", "queue", "resource", "script"]
+    assert last_run["nat"] == now
+    assert last_run["dns"] == now - 301
+    assert all(last_run[name] >= now for name in ran)
+
+
+def test_run_stages_without_intervals_runs_all():
+    ran = []
+    stages = make_stages(ran, ("nat", (), TIER_MEDIUM), ("dns", (), TIER_SLOW))
+    last_run = {"nat": monotonic(), "dns": monotonic()}
+    asyncio.run(async_run_stages(stages, last_run=last_run))
+    assert sorted(ran) == ["dns", "nat"]
+
+
+def test_run_stages_disconnected():
+    ran = []
+    connected = [True]
+
+    async def disconnect():
+        ran.append("resource")
+        connected[0] = False
+
+    stages = [
+        UpdateStage("resource", disconnect),
+        *make_stages(ran, ("health", ("resource",), TIER_FAST)),
+    ]
+    last_run = {}
+    asyncio.run(async_run_stages(stages, lambda: connected[0], last_run=last_run))
+    # Stage which lost connection is not marked as run
+    assert ran == ["resource"]
+    assert last_run == {}
+
+
+def test_run_stages_records_stats():
+    class Stats:
+        def __init__(self):
+            self.records = {}
+
+        def record(self, name, duration):
+            self.records[name] = duration
+
+    stats = Stats()
+    stages = make_stages([], ("nat", (), TIER_MEDIUM))
+    stages[0].condition = lambda: True
+    stages.append(UpdateStage("ups", lambda: None, condition=lambda: False))
+    asyncio.run(async_run_stages(stages, stats=stats))
+    assert list(stats.records) == ["nat"]
+
+
+def test_run_stages_failure_cancels_others():
+    cancelled = []
+
+    async def fail():
+        raise RuntimeError("failed")
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+
+    stages = [UpdateStage("fail", fail), UpdateStage("slow", slow)]
+    with pytest.raises(RuntimeError):
+        asyncio.run(async_run_stages(stages))
+
+    assert cancelled == ["slow"]